@@ -0,0 +1,541 @@
+"""End-to-end gateway benchmark: the full FastAPI app in front of a fake MLflow.
+
+Drives ``gateway.main.app`` through ``httpx.ASGITransport`` with auth off
+(``X-Tenant``) and in OIDC mode (RS256 tokens signed with a locally generated
+key), against ``benchmarks.fake_mlflow`` either in process or as a local server.
+Scenarios:
+
+- ``create``: ``runs/create`` (tenant tag injection, cached experiment owner)
+- ``get``: ``runs/get`` (ownership preflight whose body is returned)
+- ``search``: ``runs/search`` with a filter (tenant clause rewrite)
+- ``mutation_preflight``: ``runs/log-metric`` with a cold ownership cache
+- ``large_payload``: ``runs/log-batch`` with 1000 metrics
+
+Each scenario reports rps and p50/p95/p99 latency, and the peak traced memory
+of a separate, shorter pass under ``tracemalloc``.
+
+Usage::
+
+    python -m benchmarks.e2e run --requests 2000 --concurrency 32 --output results.json
+    python -m benchmarks.e2e compare main HEAD --requests 2000
+
+``compare`` checks both commits out into temporary git worktrees, runs this
+harness against each (with a fresh fake MLflow server per commit) and fails
+when p99 latency or throughput regresses beyond ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+TENANTS = ("alpha", "bravo")
+RUNS_PER_TENANT = 50
+IN_PROCESS_BASE_URL = "http://fake-mlflow"
+ISSUER = "https://issuer.benchmark.local"
+AUDIENCE = "mlflow-gateway"
+
+
+@dataclass
+class Context:
+    experiment_ids: dict[str, str] = field(default_factory=dict)
+    # Runs created by the ``create`` scenario go here so searches see a fixed run count.
+    create_experiment_ids: dict[str, str] = field(default_factory=dict)
+    run_ids: dict[str, list[str]] = field(default_factory=dict)
+    headers: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+# (tenant, method, path, httpx request kwargs) for the i-th request of a scenario.
+Request = tuple[str, str, str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    build: Callable[[Context, int], Request]
+    # Clear the ownership cache before every request so each one pays for its preflight.
+    cold_ownership: bool = False
+
+
+def _tenant(index: int) -> str:
+    return TENANTS[index % len(TENANTS)]
+
+
+def _run_id(ctx: Context, tenant: str, index: int) -> str:
+    run_ids = ctx.run_ids[tenant]
+    return run_ids[index % len(run_ids)]
+
+
+def _create(ctx: Context, index: int) -> Request:
+    tenant = _tenant(index)
+    body = {"experiment_id": ctx.create_experiment_ids[tenant], "run_name": f"bench-{index}"}
+    return tenant, "POST", "/api/2.0/mlflow/runs/create", {"json": body}
+
+
+def _get(ctx: Context, index: int) -> Request:
+    tenant = _tenant(index)
+    params = {"run_id": _run_id(ctx, tenant, index)}
+    return tenant, "GET", "/api/2.0/mlflow/runs/get", {"params": params}
+
+
+def _search(ctx: Context, index: int) -> Request:
+    tenant = _tenant(index)
+    body = {
+        "experiment_ids": [ctx.experiment_ids[tenant]],
+        "filter": "attributes.status = 'RUNNING'",
+        "max_results": 25,
+    }
+    return tenant, "POST", "/api/2.0/mlflow/runs/search", {"json": body}
+
+
+def _mutation(ctx: Context, index: int) -> Request:
+    tenant = _tenant(index)
+    body = {
+        "run_id": _run_id(ctx, tenant, index),
+        "key": "loss",
+        "value": 1.0 / (index + 1),
+        "timestamp": 1_700_000_000_000 + index,
+        "step": index,
+    }
+    return tenant, "POST", "/api/2.0/mlflow/runs/log-metric", {"json": body}
+
+
+_LARGE_METRICS = [
+    {"key": f"metric_{i % 10}", "value": i * 0.001, "timestamp": 1_700_000_000_000, "step": i}
+    for i in range(1000)
+]
+
+
+def _large_payload(ctx: Context, index: int) -> Request:
+    tenant = _tenant(index)
+    # Always the same run, so the fake's bounded metric history keeps memory flat.
+    body = {"run_id": ctx.run_ids[tenant][0], "metrics": _LARGE_METRICS}
+    return tenant, "POST", "/api/2.0/mlflow/runs/log-batch", {"json": body}
+
+
+SCENARIOS = (
+    Scenario("create", _create),
+    Scenario("get", _get),
+    Scenario("search", _search),
+    Scenario("mutation_preflight", _mutation, cold_ownership=True),
+    Scenario("large_payload", _large_payload),
+)
+MODES = ("off", "oidc")
+
+
+def _configure_auth(mode: str) -> dict[str, dict[str, str]]:
+    """Switch the gateway to ``mode`` and return request headers per tenant."""
+    from gateway.config import settings
+
+    if mode == "off":
+        settings.auth_enabled = False
+        settings.auth_mode = "off"
+        return {tenant: {"X-Tenant": tenant} for tenant in TENANTS}
+
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from gateway.main import _validator
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk["kid"] = "benchmark"
+    settings.auth_enabled = True
+    settings.auth_mode = "oidc"
+    settings.tenant_claim = "tenant_id"
+    settings.role_claim = "roles"
+    _validator.config.enabled = True
+    _validator.config.issuer = ISSUER
+    _validator.config.audience = AUDIENCE
+    _validator.config.algorithms = ["RS256"]
+    _validator.config.jwks_uri = None
+    _validator.config.jwks_json = json.dumps({"keys": [jwk]})
+    _validator.config.tenant_claim = "tenant_id"
+    _validator._jwks_cache = None
+
+    now = datetime.now(UTC)
+    headers = {}
+    for tenant in TENANTS:
+        token = jwt.encode(
+            {
+                "sub": f"bench-{tenant}",
+                "tenant_id": tenant,
+                "roles": ["contributor"],
+                "iss": ISSUER,
+                "aud": AUDIENCE,
+                "iat": now,
+                "nbf": now,
+                "exp": now + timedelta(hours=1),
+            },
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "benchmark"},
+        )
+        headers[tenant] = {"Authorization": f"Bearer {token}"}
+    return headers
+
+
+def _clear_ownership_cache() -> None:
+    import gateway.main
+
+    # Older commits have no ownership cache; every mutation preflights there anyway.
+    cache = getattr(gateway.main, "_ownership_cache", None)
+    if cache is not None:
+        cache.clear()
+
+
+async def _create_experiment(upstream: httpx.AsyncClient, name: str, tag: dict) -> str:
+    created = await upstream.post(
+        "/api/2.0/mlflow/experiments/create",
+        json={"name": f"{name}-{time.time_ns()}", "tags": [tag]},
+    )
+    created.raise_for_status()
+    return created.json()["experiment_id"]
+
+
+async def _seed(upstream: httpx.AsyncClient, tenant_tag_key: str) -> Context:
+    ctx = Context()
+    for tenant in TENANTS:
+        tag = {"key": tenant_tag_key, "value": tenant}
+        experiment_id, create_experiment_id = [
+            await _create_experiment(upstream, f"bench-{tenant}-{purpose}", tag)
+            for purpose in ("runs", "create")
+        ]
+        ctx.experiment_ids[tenant] = experiment_id
+        ctx.create_experiment_ids[tenant] = create_experiment_id
+        ctx.run_ids[tenant] = []
+        for _ in range(RUNS_PER_TENANT):
+            run = await upstream.post(
+                "/api/2.0/mlflow/runs/create",
+                json={"experiment_id": experiment_id, "tags": [tag]},
+            )
+            run.raise_for_status()
+            ctx.run_ids[tenant].append(run.json()["run"]["info"]["run_id"])
+    return ctx
+
+
+async def _drive(
+    client: httpx.AsyncClient, ctx: Context, scenario: Scenario, requests: int, concurrency: int
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def _worker() -> None:
+        nonlocal errors
+        for index in remaining:
+            tenant, method, path, kwargs = scenario.build(ctx, index)
+            if scenario.cold_ownership:
+                _clear_ownership_cache()
+            started = time.perf_counter()
+            response = await client.request(method, path, headers=ctx.headers[tenant], **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    ctx: Context,
+    scenario: Scenario,
+    mode: str,
+    requests: int,
+    concurrency: int,
+    memory_requests: int,
+) -> dict[str, Any]:
+    await _drive(client, ctx, scenario, concurrency, concurrency)  # warm-up
+    started = time.perf_counter()
+    latencies, errors = await _drive(client, ctx, scenario, requests, concurrency)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    await _drive(client, ctx, scenario, memory_requests, concurrency)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "mode": mode,
+        "scenario": scenario.name,
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+        "peak_traced_kib": round(peak / 1024, 1),
+    }
+
+
+async def _open_upstream(upstream_url: str | None) -> tuple[str, httpx.AsyncClient]:
+    """Point the gateway at the fake MLflow and return a client for seeding it directly."""
+    if upstream_url:
+        return upstream_url, httpx.AsyncClient(base_url=upstream_url)
+
+    from benchmarks.fake_mlflow import create_app
+    from gateway.upstream import register_upstream_client
+
+    fake = create_app()
+    register_upstream_client(
+        IN_PROCESS_BASE_URL,
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url=IN_PROCESS_BASE_URL),
+    )
+    return IN_PROCESS_BASE_URL, httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fake), base_url=IN_PROCESS_BASE_URL
+    )
+
+
+async def run(
+    *,
+    requests: int,
+    concurrency: int,
+    memory_requests: int,
+    modes: list[str],
+    scenarios: list[str],
+    upstream_url: str | None = None,
+) -> list[dict[str, Any]]:
+    from gateway.config import settings
+    from gateway.main import app
+    from gateway.upstream import close_upstream_clients
+
+    base_url, upstream = await _open_upstream(upstream_url)
+    settings.target_base_url = base_url
+    settings.tenant_tag_key = "tenant"
+    results = []
+    try:
+        ctx = await _seed(upstream, settings.tenant_tag_key)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://gateway"
+        ) as client:
+            for mode in modes:
+                ctx.headers = _configure_auth(mode)
+                for scenario in SCENARIOS:
+                    if scenario.name not in scenarios:
+                        continue
+                    _clear_ownership_cache()
+                    results.append(
+                        await _run_scenario(
+                            client, ctx, scenario, mode, requests, concurrency, memory_requests
+                        )
+                    )
+    finally:
+        await upstream.aclose()
+        await close_upstream_clients()
+    return results
+
+
+def _git(*args: str, cwd: str | None = None) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _print_table(results: list[dict[str, Any]]) -> None:
+    columns = ("rps", "p50_ms", "p95_ms", "p99_ms", "peak_traced_kib", "errors")
+    print(f"{'mode':<6} {'scenario':<20}" + "".join(f" {c:>16}" for c in columns))
+    for result in results:
+        print(
+            f"{result['mode']:<6} {result['scenario']:<20}"
+            + "".join(f" {result[c]:>16}" for c in columns)
+        )
+
+
+def compare_results(
+    base: list[dict[str, Any]], head: list[dict[str, Any]], threshold: float
+) -> list[dict[str, Any]]:
+    """Pair results by mode and scenario and flag p99 or rps regressions beyond ``threshold``."""
+    base_by_key = {(r["mode"], r["scenario"]): r for r in base}
+    rows = []
+    for result in head:
+        previous = base_by_key.get((result["mode"], result["scenario"]))
+        if previous is None:
+            continue
+        rps_change = result["rps"] / previous["rps"] - 1 if previous["rps"] else 0.0
+        p99_change = result["p99_ms"] / previous["p99_ms"] - 1 if previous["p99_ms"] else 0.0
+        rows.append(
+            {
+                "mode": result["mode"],
+                "scenario": result["scenario"],
+                "base_rps": previous["rps"],
+                "head_rps": result["rps"],
+                "rps_change": round(rps_change, 3),
+                "base_p99_ms": previous["p99_ms"],
+                "head_p99_ms": result["p99_ms"],
+                "p99_change": round(p99_change, 3),
+                "regression": rps_change < -threshold or p99_change > threshold,
+            }
+        )
+    return rows
+
+
+def compare(base_rev: str, head_rev: str, args: argparse.Namespace) -> int:
+    from benchmarks.transports import _free_port, _serve
+
+    root = _git("rev-parse", "--show-toplevel")
+    python = sys.executable
+    outputs: dict[str, list[dict[str, Any]]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # The harness is this checkout's benchmarks package; only ``gateway`` comes from the rev.
+        harness = Path(tmp, "harness")
+        shutil.copytree(
+            Path(__file__).parent,
+            harness / "benchmarks",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        for label, rev in (("base", base_rev), ("head", head_rev)):
+            worktree = str(Path(tmp, label))
+            _git("worktree", "add", "--detach", worktree, rev, cwd=root)
+            try:
+                port = _free_port()
+                upstream_url = f"http://127.0.0.1:{port}"
+                output = str(Path(tmp, f"{label}.json"))
+                with _serve(
+                    [python, "-m", "benchmarks.fake_mlflow", "--port", str(port)],
+                    upstream_url,
+                    None,
+                ):
+                    subprocess.run(
+                        [
+                            python,
+                            "-m",
+                            "benchmarks.e2e",
+                            "run",
+                            "--upstream-url",
+                            upstream_url,
+                            "--output",
+                            output,
+                            *_run_arguments(args),
+                        ],
+                        # Run from the harness so its ``benchmarks`` shadows the rev's own.
+                        cwd=str(harness),
+                        env={**os.environ, "PYTHONPATH": os.pathsep.join([str(harness), worktree])},
+                        stdout=sys.stderr,
+                        check=True,
+                    )
+                with open(output, encoding="utf-8") as handle:
+                    outputs[label] = json.load(handle)["results"]
+            finally:
+                _git("worktree", "remove", "--force", worktree, cwd=root)
+
+    rows = compare_results(outputs["base"], outputs["head"], args.threshold)
+    if args.json:
+        print(json.dumps({"base": base_rev, "head": head_rev, "comparison": rows}, indent=2))
+    else:
+        print(f"{base_rev} -> {head_rev} (threshold {args.threshold:.0%})")
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['mode']:<6} {row['scenario']:<20} rps {row['base_rps']:>10} -> "
+                f"{row['head_rps']:>10} ({row['rps_change']:+.1%})  p99 {row['base_p99_ms']:>8} -> "
+                f"{row['head_p99_ms']:>8} ({row['p99_change']:+.1%}) {flag}"
+            )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def _run_arguments(args: argparse.Namespace) -> list[str]:
+    return [
+        "--requests",
+        str(args.requests),
+        "--concurrency",
+        str(args.concurrency),
+        "--memory-requests",
+        str(args.memory_requests),
+        "--modes",
+        ",".join(args.modes),
+        "--scenarios",
+        ",".join(args.scenarios),
+    ]
+
+
+def _csv(allowed: tuple[str, ...]) -> Callable[[str], list[str]]:
+    def parse(value: str) -> list[str]:
+        items = [item.strip() for item in value.split(",") if item.strip()]
+        unknown = sorted(set(items) - set(allowed))
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown: {', '.join(unknown)}")
+        return items
+
+    return parse
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    scenario_names = tuple(scenario.name for scenario in SCENARIOS)
+    for name in ("run", "compare"):
+        command = commands.add_parser(name)
+        command.add_argument("--requests", type=int, default=2000)
+        command.add_argument("--concurrency", type=int, default=32)
+        command.add_argument("--memory-requests", type=int, default=200)
+        command.add_argument("--modes", type=_csv(MODES), default=list(MODES))
+        command.add_argument("--scenarios", type=_csv(scenario_names), default=list(scenario_names))
+        command.add_argument("--json", action="store_true", help="Print results as JSON")
+    commands.choices["run"].add_argument("--upstream-url", help="Fake MLflow server to use")
+    commands.choices["run"].add_argument("--output", help="Also write the JSON results here")
+    commands.choices["compare"].add_argument("base")
+    commands.choices["compare"].add_argument("head")
+    commands.choices["compare"].add_argument(
+        "--threshold", type=float, default=0.1, help="Allowed relative p99/rps change"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return compare(args.base, args.head, args)
+
+    import gateway
+
+    # Audit events are still formatted and written, just not to the terminal.
+    logging.basicConfig(level=logging.INFO, handlers=[logging.FileHandler(os.devnull)], force=True)
+    results = asyncio.run(
+        run(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            memory_requests=args.memory_requests,
+            modes=args.modes,
+            scenarios=args.scenarios,
+            upstream_url=args.upstream_url,
+        )
+    )
+    report = {
+        "meta": {
+            "commit": _git("rev-parse", "--short", "HEAD", cwd=os.path.dirname(gateway.__file__)),
+            "python": sys.version.split()[0],
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "upstream": args.upstream_url or "in-process",
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
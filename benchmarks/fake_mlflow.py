@@ -0,0 +1,810 @@
+"""In-memory fake of the MLflow REST API the gateway talks to.
+
+Covers experiments, runs (including ``log-batch`` and metric history),
+registered models, model versions, tag-filtered searches (parsed with the
+gateway's own filter parser) and proxied artifacts (with ``Range`` downloads).
+Each endpoint only accepts the HTTP methods MLflow serves it with.
+Latency and errors can be injected to exercise timeouts, retries and breakers.
+
+In-process, as the gateway's upstream (no network)::
+
+    fake = create_app(FaultInjection(latency_ms=2))
+    register_upstream_client(
+        "http://mlflow:5000",
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://mlflow:5000"),
+    )
+
+As a local server::
+
+    python -m benchmarks.fake_mlflow --port 5001 --latency-ms 2 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from gateway.mlflow.filters import And, Comparison, FilterParseError, Node, Or, parse_filter
+
+
+class FakeMlflowError(Exception):
+    def __init__(self, status_code: int, error_code: str, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_code = error_code
+        self.message = message
+
+
+def _not_found(message: str) -> FakeMlflowError:
+    return FakeMlflowError(404, "RESOURCE_DOES_NOT_EXIST", message)
+
+
+def _invalid(message: str) -> FakeMlflowError:
+    return FakeMlflowError(400, "INVALID_PARAMETER_VALUE", message)
+
+
+@dataclass
+class FaultInjection:
+    """Latency and error injection applied to every API call (``/health`` is exempt).
+
+    ``error_rate`` is the fraction of calls answered with ``error_status``
+    instead of being processed. Attributes may be changed while serving.
+    """
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    def delay_seconds(self) -> float:
+        jitter = self._random.uniform(0, self.latency_jitter_ms) if self.latency_jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+# Filter evaluation over the gateway's filter AST.
+
+
+def _like(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    parts = [".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern]
+    return re.compile("".join(parts), flags | re.DOTALL)
+
+
+def _as_number(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compare(actual: Any, comparison: Comparison) -> bool:
+    op = comparison.op
+    if op == "IS NULL":
+        return actual is None
+    if op == "IS NOT NULL":
+        return actual is not None
+    if actual is None:
+        return False
+    value = comparison.value
+    if op in {"IN", "NOT IN"}:
+        members = {str(item.value) for item in value.value}
+        return (str(actual) in members) == (op == "IN")
+    if op in {"LIKE", "ILIKE", "NOT LIKE", "NOT ILIKE"}:
+        flags = re.IGNORECASE if "ILIKE" in op else 0
+        matched = _like(str(value.value), flags).fullmatch(str(actual)) is not None
+        return matched != op.startswith("NOT")
+    if value.kind == "number":
+        left, right = _as_number(actual), float(value.value)
+        if left is None:
+            return False
+    else:
+        left, right = str(actual), str(value.value)
+    return {
+        "=": left == right,
+        "!=": left != right,
+        "<": left < right,
+        "<=": left <= right,
+        ">": left > right,
+        ">=": left >= right,
+    }[op]
+
+
+def _matches(node: Node | None, lookup: Callable[[str | None, str], Any]) -> bool:
+    if node is None:
+        return True
+    if isinstance(node, And):
+        return all(_matches(clause, lookup) for clause in node.clauses)
+    if isinstance(node, Or):
+        return any(_matches(clause, lookup) for clause in node.clauses)
+    return _compare(lookup(node.entity, node.key), node)
+
+
+def _filter_node(raw_filter: Any) -> Node | None:
+    if not isinstance(raw_filter, str) or not raw_filter.strip():
+        return None
+    try:
+        return parse_filter(raw_filter)
+    except FilterParseError as exc:
+        raise _invalid(f"Invalid filter: {exc}") from exc
+
+
+def _tag_map(tags: list[dict[str, Any]]) -> dict[str, str]:
+    return {tag["key"]: tag.get("value") for tag in tags}
+
+
+def _set_tag(tags: list[dict[str, Any]], key: str, value: Any) -> None:
+    for tag in tags:
+        if tag["key"] == key:
+            tag["value"] = value
+            return
+    tags.append({"key": key, "value": value})
+
+
+def _delete_tag(tags: list[dict[str, Any]], key: str) -> None:
+    tags[:] = [tag for tag in tags if tag["key"] != key]
+
+
+def _page(rows: list[Any], payload: dict[str, Any], default_max: int) -> dict[str, Any]:
+    try:
+        start = int(payload.get("page_token") or 0)
+        max_results = int(payload.get("max_results") or default_max)
+    except (TypeError, ValueError) as exc:
+        raise _invalid("Invalid page_token or max_results") from exc
+    end = start + max_results
+    page: dict[str, Any] = {"rows": rows[start:end]}
+    if end < len(rows):
+        page["next_page_token"] = str(end)
+    return page
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _require(payload: dict[str, Any], field: str) -> str:
+    value = payload.get(field)
+    if value is None or value == "":
+        raise _invalid(f"Missing value for required parameter '{field}'")
+    return str(value)
+
+
+class FakeMlflowStore:
+    """In-memory MLflow tracking and registry state, shaped like MLflow's JSON responses."""
+
+    def __init__(self, metric_history_limit: int = 1000) -> None:
+        self.experiments: dict[str, dict[str, Any]] = {}
+        self.runs: dict[str, dict[str, Any]] = {}
+        # Only the latest points per metric are kept so long load runs stay bounded in memory.
+        self.metric_history_limit = metric_history_limit
+        self.metric_history: dict[tuple[str, str], deque[dict[str, Any]]] = {}
+        self.registered_models: dict[str, dict[str, Any]] = {}
+        self.model_versions: dict[tuple[str, str], dict[str, Any]] = {}
+        self.artifacts: dict[str, bytes] = {}
+        self._experiment_ids = itertools.count(1)
+        # MLflow always has an untagged "Default" experiment.
+        self._add_experiment("0", "Default", [])
+
+    # Experiments
+
+    def _add_experiment(self, experiment_id: str, name: str, tags: list[dict[str, Any]]) -> None:
+        now = _now_ms()
+        self.experiments[experiment_id] = {
+            "experiment_id": experiment_id,
+            "name": name,
+            "artifact_location": f"mlflow-artifacts:/{experiment_id}",
+            "lifecycle_stage": "active",
+            "creation_time": now,
+            "last_update_time": now,
+            "tags": [dict(tag) for tag in tags],
+        }
+
+    def _experiment(self, payload: dict[str, Any]) -> dict[str, Any]:
+        experiment_id = _require(payload, "experiment_id")
+        experiment = self.experiments.get(experiment_id)
+        if experiment is None:
+            raise _not_found(f"No Experiment with id={experiment_id} exists")
+        return experiment
+
+    def create_experiment(self, payload: dict[str, Any]) -> dict[str, Any]:
+        name = _require(payload, "name")
+        if any(e["name"] == name for e in self.experiments.values()):
+            raise FakeMlflowError(
+                400, "RESOURCE_ALREADY_EXISTS", f"Experiment(name={name}) already exists"
+            )
+        experiment_id = str(next(self._experiment_ids))
+        self._add_experiment(experiment_id, name, payload.get("tags") or [])
+        return {"experiment_id": experiment_id}
+
+    def get_experiment(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {"experiment": self._experiment(payload)}
+
+    def get_experiment_by_name(self, payload: dict[str, Any]) -> dict[str, Any]:
+        name = _require(payload, "experiment_name")
+        for experiment in self.experiments.values():
+            if experiment["name"] == name:
+                return {"experiment": experiment}
+        raise _not_found(f"Could not find experiment with name '{name}'")
+
+    def search_experiments(self, payload: dict[str, Any]) -> dict[str, Any]:
+        node = _filter_node(payload.get("filter"))
+        view_type = str(payload.get("view_type") or "ACTIVE_ONLY")
+        rows = []
+        for experiment in self.experiments.values():
+            if not _lifecycle_visible(experiment["lifecycle_stage"], view_type):
+                continue
+            tags = _tag_map(experiment["tags"])
+
+            def lookup(entity: str | None, key: str, e: dict = experiment) -> Any:
+                return tags.get(key) if entity == "tags" else e.get(key)
+
+            if _matches(node, lookup):
+                rows.append(experiment)
+        page = _page(rows, payload, 1000)
+        return {"experiments": page.pop("rows"), **page}
+
+    def update_experiment(self, payload: dict[str, Any]) -> dict[str, Any]:
+        experiment = self._experiment(payload)
+        if payload.get("new_name"):
+            experiment["name"] = str(payload["new_name"])
+        experiment["last_update_time"] = _now_ms()
+        return {}
+
+    def delete_experiment(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._experiment(payload)["lifecycle_stage"] = "deleted"
+        return {}
+
+    def restore_experiment(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._experiment(payload)["lifecycle_stage"] = "active"
+        return {}
+
+    def set_experiment_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        _set_tag(self._experiment(payload)["tags"], _require(payload, "key"), payload.get("value"))
+        return {}
+
+    def delete_experiment_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        _delete_tag(self._experiment(payload)["tags"], _require(payload, "key"))
+        return {}
+
+    # Runs
+
+    def _run(self, payload: dict[str, Any]) -> dict[str, Any]:
+        run_id = payload.get("run_id") or payload.get("run_uuid")
+        run = self.runs.get(str(run_id)) if run_id else None
+        if run is None:
+            raise _not_found(f"Run '{run_id}' not found")
+        return run
+
+    def create_run(self, payload: dict[str, Any]) -> dict[str, Any]:
+        experiment = self._experiment(payload)
+        run_id = uuid.uuid4().hex
+        tags = [dict(tag) for tag in payload.get("tags") or []]
+        run_name = payload.get("run_name") or f"run-{len(self.runs) + 1}"
+        self.runs[run_id] = {
+            "info": {
+                "run_id": run_id,
+                "run_uuid": run_id,
+                "run_name": run_name,
+                "experiment_id": experiment["experiment_id"],
+                "user_id": payload.get("user_id", ""),
+                "status": "RUNNING",
+                "start_time": int(payload.get("start_time") or _now_ms()),
+                "artifact_uri": f"{experiment['artifact_location']}/{run_id}/artifacts",
+                "lifecycle_stage": "active",
+            },
+            "data": {"metrics": [], "params": [], "tags": tags},
+        }
+        return {"run": self.runs[run_id]}
+
+    def get_run(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {"run": self._run(payload)}
+
+    def search_runs(self, payload: dict[str, Any]) -> dict[str, Any]:
+        experiment_ids = payload.get("experiment_ids") or []
+        if isinstance(experiment_ids, str):
+            experiment_ids = [experiment_ids]
+        wanted = {str(experiment_id) for experiment_id in experiment_ids}
+        node = _filter_node(payload.get("filter"))
+        view_type = str(payload.get("run_view_type") or "ACTIVE_ONLY")
+        rows = []
+        for run in self.runs.values():
+            info, data = run["info"], run["data"]
+            if info["experiment_id"] not in wanted:
+                continue
+            if not _lifecycle_visible(info["lifecycle_stage"], view_type):
+                continue
+            sources = {
+                "tags": _tag_map(data["tags"]),
+                "params": _tag_map(data["params"]),
+                "metrics": {m["key"]: m["value"] for m in data["metrics"]},
+            }
+
+            def lookup(entity: str | None, key: str, info: dict = info, sources=sources) -> Any:
+                if entity in sources:
+                    return sources[entity].get(key)
+                return info.get(key)
+
+            if _matches(node, lookup):
+                rows.append(run)
+        page = _page(rows, payload, 1000)
+        return {"runs": page.pop("rows"), **page}
+
+    def update_run(self, payload: dict[str, Any]) -> dict[str, Any]:
+        info = self._run(payload)["info"]
+        for field in ("status", "end_time", "run_name"):
+            if payload.get(field) is not None:
+                info[field] = payload[field]
+        return {"run_info": info}
+
+    def delete_run(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._run(payload)["info"]["lifecycle_stage"] = "deleted"
+        return {}
+
+    def restore_run(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._run(payload)["info"]["lifecycle_stage"] = "active"
+        return {}
+
+    def _log_metric(self, run: dict[str, Any], metric: dict[str, Any]) -> None:
+        entry = {
+            "key": str(metric["key"]),
+            "value": float(metric["value"]),
+            "timestamp": int(metric.get("timestamp") or _now_ms()),
+            "step": int(metric.get("step") or 0),
+        }
+        run_id = run["info"]["run_id"]
+        history = self.metric_history.setdefault(
+            (run_id, entry["key"]), deque(maxlen=self.metric_history_limit)
+        )
+        history.append(entry)
+        latest = [m for m in run["data"]["metrics"] if m["key"] != entry["key"]]
+        run["data"]["metrics"] = [*latest, entry]
+
+    def log_batch(self, payload: dict[str, Any]) -> dict[str, Any]:
+        run = self._run(payload)
+        for metric in payload.get("metrics") or []:
+            self._log_metric(run, metric)
+        for param in payload.get("params") or []:
+            _set_tag(run["data"]["params"], str(param["key"]), param.get("value"))
+        for tag in payload.get("tags") or []:
+            _set_tag(run["data"]["tags"], str(tag["key"]), tag.get("value"))
+        return {}
+
+    def log_metric(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._log_metric(self._run(payload), payload)
+        return {}
+
+    def log_parameter(self, payload: dict[str, Any]) -> dict[str, Any]:
+        run = self._run(payload)
+        _set_tag(run["data"]["params"], _require(payload, "key"), payload.get("value"))
+        return {}
+
+    def set_run_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        run = self._run(payload)
+        _set_tag(run["data"]["tags"], _require(payload, "key"), payload.get("value"))
+        return {}
+
+    def delete_run_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        _delete_tag(self._run(payload)["data"]["tags"], _require(payload, "key"))
+        return {}
+
+    def get_metric_history(self, payload: dict[str, Any]) -> dict[str, Any]:
+        run = self._run(payload)
+        key = _require(payload, "metric_key")
+        return {"metrics": list(self.metric_history.get((run["info"]["run_id"], key), ()))}
+
+    # Registered models and model versions
+
+    def _registered_model(self, payload: dict[str, Any]) -> dict[str, Any]:
+        name = _require(payload, "name")
+        model = self.registered_models.get(name)
+        if model is None:
+            raise _not_found(f"Registered Model with name={name} not found")
+        return model
+
+    def create_registered_model(self, payload: dict[str, Any]) -> dict[str, Any]:
+        name = _require(payload, "name")
+        if name in self.registered_models:
+            raise FakeMlflowError(
+                400, "RESOURCE_ALREADY_EXISTS", f"Registered Model (name={name}) already exists."
+            )
+        now = _now_ms()
+        self.registered_models[name] = {
+            "name": name,
+            "creation_timestamp": now,
+            "last_updated_timestamp": now,
+            "description": payload.get("description", ""),
+            "tags": [dict(tag) for tag in payload.get("tags") or []],
+        }
+        return {"registered_model": self.registered_models[name]}
+
+    def get_registered_model(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {"registered_model": self._registered_model(payload)}
+
+    def search_registered_models(self, payload: dict[str, Any]) -> dict[str, Any]:
+        node = _filter_node(payload.get("filter_string") or payload.get("filter"))
+        rows = []
+        for model in self.registered_models.values():
+            tags = _tag_map(model["tags"])
+
+            def lookup(entity: str | None, key: str, model: dict = model, tags=tags) -> Any:
+                return tags.get(key) if entity == "tags" else model.get(key)
+
+            if _matches(node, lookup):
+                rows.append(model)
+        page = _page(rows, payload, 100)
+        return {"registered_models": page.pop("rows"), **page}
+
+    def rename_registered_model(self, payload: dict[str, Any]) -> dict[str, Any]:
+        model = self._registered_model(payload)
+        new_name = _require(payload, "new_name")
+        del self.registered_models[model["name"]]
+        for key in [key for key in self.model_versions if key[0] == model["name"]]:
+            version = self.model_versions.pop(key)
+            version["name"] = new_name
+            self.model_versions[(new_name, key[1])] = version
+        model["name"] = new_name
+        self.registered_models[new_name] = model
+        return {"registered_model": model}
+
+    def delete_registered_model(self, payload: dict[str, Any]) -> dict[str, Any]:
+        model = self._registered_model(payload)
+        del self.registered_models[model["name"]]
+        for key in [key for key in self.model_versions if key[0] == model["name"]]:
+            del self.model_versions[key]
+        return {}
+
+    def set_registered_model_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        model = self._registered_model(payload)
+        _set_tag(model["tags"], _require(payload, "key"), payload.get("value"))
+        return {}
+
+    def delete_registered_model_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        _delete_tag(self._registered_model(payload)["tags"], _require(payload, "key"))
+        return {}
+
+    def _model_version(self, payload: dict[str, Any]) -> dict[str, Any]:
+        key = (_require(payload, "name"), _require(payload, "version"))
+        version = self.model_versions.get(key)
+        if version is None:
+            raise _not_found(f"Model Version (name={key[0]}, version={key[1]}) not found")
+        return version
+
+    def create_model_version(self, payload: dict[str, Any]) -> dict[str, Any]:
+        model = self._registered_model(payload)
+        number = 1 + sum(1 for name, _ in self.model_versions if name == model["name"])
+        now = _now_ms()
+        version = {
+            "name": model["name"],
+            "version": str(number),
+            "creation_timestamp": now,
+            "last_updated_timestamp": now,
+            "current_stage": "None",
+            "source": payload.get("source", ""),
+            "run_id": payload.get("run_id", ""),
+            "status": "READY",
+            "tags": [dict(tag) for tag in payload.get("tags") or []],
+        }
+        self.model_versions[(model["name"], version["version"])] = version
+        return {"model_version": version}
+
+    def get_model_version(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {"model_version": self._model_version(payload)}
+
+    def search_model_versions(self, payload: dict[str, Any]) -> dict[str, Any]:
+        node = _filter_node(payload.get("filter"))
+        rows = []
+        for version in self.model_versions.values():
+            tags = _tag_map(version["tags"])
+
+            def lookup(entity: str | None, key: str, version: dict = version, tags=tags) -> Any:
+                return tags.get(key) if entity == "tags" else version.get(key)
+
+            if _matches(node, lookup):
+                rows.append(version)
+        page = _page(rows, payload, 200_000)
+        return {"model_versions": page.pop("rows"), **page}
+
+    def update_model_version(self, payload: dict[str, Any]) -> dict[str, Any]:
+        version = self._model_version(payload)
+        if payload.get("description") is not None:
+            version["description"] = payload["description"]
+        return {"model_version": version}
+
+    def transition_model_version_stage(self, payload: dict[str, Any]) -> dict[str, Any]:
+        version = self._model_version(payload)
+        version["current_stage"] = _require(payload, "stage")
+        return {"model_version": version}
+
+    def delete_model_version(self, payload: dict[str, Any]) -> dict[str, Any]:
+        version = self._model_version(payload)
+        del self.model_versions[(version["name"], version["version"])]
+        return {}
+
+    def set_model_version_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        version = self._model_version(payload)
+        _set_tag(version["tags"], _require(payload, "key"), payload.get("value"))
+        return {}
+
+    def delete_model_version_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
+        _delete_tag(self._model_version(payload)["tags"], _require(payload, "key"))
+        return {}
+
+    # Artifacts
+
+    def list_artifacts(self, directory: str) -> dict[str, Any]:
+        prefix = f"{directory.strip('/')}/" if directory.strip("/") else ""
+        entries: dict[str, dict[str, Any]] = {}
+        for path, content in self.artifacts.items():
+            if not path.startswith(prefix):
+                continue
+            head, _, rest = path[len(prefix):].partition("/")
+            if rest:
+                entries.setdefault(head, {"path": head, "is_dir": True})
+            else:
+                entries[head] = {"path": head, "is_dir": False, "file_size": len(content)}
+        return {"files": [entries[name] for name in sorted(entries)]}
+
+
+def _lifecycle_visible(stage: str, view_type: str) -> bool:
+    if view_type.upper() == "ALL":
+        return True
+    if view_type.upper() == "DELETED_ONLY":
+        return stage == "deleted"
+    return stage == "active"
+
+
+def _routes(store: FakeMlflowStore) -> dict[str, Callable[[dict[str, Any]], dict[str, Any]]]:
+    return {
+        "experiments/create": store.create_experiment,
+        "experiments/get": store.get_experiment,
+        "experiments/get-by-name": store.get_experiment_by_name,
+        "experiments/search": store.search_experiments,
+        "experiments/update": store.update_experiment,
+        "experiments/delete": store.delete_experiment,
+        "experiments/restore": store.restore_experiment,
+        "experiments/set-experiment-tag": store.set_experiment_tag,
+        "experiments/delete-experiment-tag": store.delete_experiment_tag,
+        "runs/create": store.create_run,
+        "runs/get": store.get_run,
+        "runs/search": store.search_runs,
+        "runs/update": store.update_run,
+        "runs/delete": store.delete_run,
+        "runs/restore": store.restore_run,
+        "runs/log-batch": store.log_batch,
+        "runs/log-metric": store.log_metric,
+        "runs/log-parameter": store.log_parameter,
+        "runs/set-tag": store.set_run_tag,
+        "runs/delete-tag": store.delete_run_tag,
+        "metrics/get-history": store.get_metric_history,
+        "registered-models/create": store.create_registered_model,
+        "registered-models/get": store.get_registered_model,
+        "registered-models/search": store.search_registered_models,
+        "registered-models/rename": store.rename_registered_model,
+        "registered-models/delete": store.delete_registered_model,
+        "registered-models/set-tag": store.set_registered_model_tag,
+        "registered-models/delete-tag": store.delete_registered_model_tag,
+        "model-versions/create": store.create_model_version,
+        "model-versions/get": store.get_model_version,
+        "model-versions/search": store.search_model_versions,
+        "model-versions/update": store.update_model_version,
+        "model-versions/transition-stage": store.transition_model_version_stage,
+        "model-versions/delete": store.delete_model_version,
+        "model-versions/set-tag": store.set_model_version_tag,
+        "model-versions/delete-tag": store.delete_model_version_tag,
+    }
+
+
+# HTTP methods MLflow 2.x serves for each endpoint; anything else is answered with 405.
+_ENDPOINT_METHODS: dict[str, frozenset[str]] = {
+    "experiments/create": frozenset({"POST"}),
+    "experiments/get": frozenset({"GET"}),
+    "experiments/get-by-name": frozenset({"GET"}),
+    "experiments/search": frozenset({"GET", "POST"}),
+    "experiments/update": frozenset({"POST"}),
+    "experiments/delete": frozenset({"POST"}),
+    "experiments/restore": frozenset({"POST"}),
+    "experiments/set-experiment-tag": frozenset({"POST"}),
+    "experiments/delete-experiment-tag": frozenset({"POST"}),
+    "runs/create": frozenset({"POST"}),
+    "runs/get": frozenset({"GET"}),
+    "runs/search": frozenset({"POST"}),
+    "runs/update": frozenset({"POST"}),
+    "runs/delete": frozenset({"POST"}),
+    "runs/restore": frozenset({"POST"}),
+    "runs/log-batch": frozenset({"POST"}),
+    "runs/log-metric": frozenset({"POST"}),
+    "runs/log-parameter": frozenset({"POST"}),
+    "runs/set-tag": frozenset({"POST"}),
+    "runs/delete-tag": frozenset({"POST"}),
+    "metrics/get-history": frozenset({"GET"}),
+    "registered-models/create": frozenset({"POST"}),
+    "registered-models/get": frozenset({"GET"}),
+    "registered-models/search": frozenset({"GET"}),
+    "registered-models/rename": frozenset({"POST"}),
+    "registered-models/delete": frozenset({"DELETE"}),
+    "registered-models/set-tag": frozenset({"POST"}),
+    "registered-models/delete-tag": frozenset({"DELETE"}),
+    "model-versions/create": frozenset({"POST"}),
+    "model-versions/get": frozenset({"GET"}),
+    "model-versions/search": frozenset({"GET"}),
+    "model-versions/update": frozenset({"PATCH"}),
+    "model-versions/transition-stage": frozenset({"POST"}),
+    "model-versions/delete": frozenset({"DELETE"}),
+    "model-versions/set-tag": frozenset({"POST"}),
+    "model-versions/delete-tag": frozenset({"DELETE"}),
+}
+
+_API_PATH = re.compile(r"^/(?:ajax-)?api/2\.[01]/mlflow/(?P<endpoint>.+)$")
+_ARTIFACT_PATH = re.compile(r"^/(?:ajax-)?api/2\.0/mlflow-artifacts/artifacts(?:/(?P<path>.*))?$")
+_RANGE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+def _error_response(error: FakeMlflowError) -> JSONResponse:
+    return JSONResponse(
+        {"error_code": error.error_code, "message": error.message}, status_code=error.status_code
+    )
+
+
+async def _request_payload(request: Request) -> dict[str, Any]:
+    # MLflow clients send reads as GET query parameters and writes as JSON bodies.
+    payload: dict[str, Any] = {}
+    for key in request.query_params:
+        values = request.query_params.getlist(key)
+        payload[key] = values if len(values) > 1 or key == "experiment_ids" else values[0]
+    body = await request.body()
+    if body:
+        try:
+            decoded = json.loads(body)
+        except ValueError as exc:
+            raise _invalid("Malformed JSON body") from exc
+        if not isinstance(decoded, dict):
+            raise _invalid("JSON body must be an object")
+        payload.update(decoded)
+    return payload
+
+
+def _artifact_download(request: Request, content: bytes) -> Response:
+    headers = {"accept-ranges": "bytes"}
+    range_header = request.headers.get("range")
+    match = _RANGE.match(range_header.strip()) if range_header else None
+    if match is None or (not match["start"] and not match["end"]):
+        return Response(content, media_type="application/octet-stream", headers=headers)
+    size = len(content)
+    if match["start"]:
+        start = int(match["start"])
+        end = min(int(match["end"]), size - 1) if match["end"] else size - 1
+    else:
+        start, end = max(0, size - int(match["end"])), size - 1
+    if start >= size or start > end:
+        return Response(status_code=416, headers={"content-range": f"bytes */{size}"})
+    headers["content-range"] = f"bytes {start}-{end}/{size}"
+    return Response(
+        content[start : end + 1],
+        status_code=206,
+        media_type="application/octet-stream",
+        headers=headers,
+    )
+
+
+def create_app(
+    faults: FaultInjection | None = None, store: FakeMlflowStore | None = None
+) -> FastAPI:
+    """Build the fake MLflow ASGI app; ``app.state.store`` and ``app.state.faults`` stay mutable."""
+    app = FastAPI(title="fake-mlflow", docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.store = store or FakeMlflowStore()
+    app.state.faults = faults or FaultInjection()
+    routes = _routes(app.state.store)
+
+    @app.get("/health")
+    @app.get("/")
+    async def health() -> Response:
+        return Response("OK", media_type="text/plain")
+
+    @app.api_route("/{path:path}", methods=["GET", "POST", "PATCH", "PUT", "DELETE", "HEAD"])
+    async def dispatch(request: Request, path: str) -> Response:
+        faults: FaultInjection = app.state.faults
+        delay = faults.delay_seconds()
+        if delay:
+            await asyncio.sleep(delay)
+        if faults.should_fail():
+            return JSONResponse(
+                {"error_code": "TEMPORARILY_UNAVAILABLE", "message": "Injected failure"},
+                status_code=faults.error_status,
+            )
+
+        store: FakeMlflowStore = app.state.store
+        request_path = request.url.path
+        artifact = _ARTIFACT_PATH.match(request_path)
+        if artifact is not None:
+            return await _artifact(request, store, artifact["path"])
+
+        api = _API_PATH.match(request_path)
+        handler = routes.get(api["endpoint"]) if api else None
+        if handler is None:
+            return _error_response(
+                FakeMlflowError(404, "ENDPOINT_NOT_FOUND", f"No endpoint {request_path}")
+            )
+        method = "GET" if request.method == "HEAD" else request.method
+        if method not in _ENDPOINT_METHODS[api["endpoint"]]:
+            return _error_response(
+                FakeMlflowError(
+                    405,
+                    "METHOD_NOT_ALLOWED",
+                    f"{request.method} is not allowed for {request_path}",
+                )
+            )
+        try:
+            return JSONResponse(handler(await _request_payload(request)))
+        except FakeMlflowError as exc:
+            return _error_response(exc)
+        except (KeyError, TypeError, ValueError) as exc:
+            return _error_response(_invalid(f"Malformed request: {exc}"))
+
+    return app
+
+
+async def _artifact(request: Request, store: FakeMlflowStore, path: str | None) -> Response:
+    if path is None:
+        if request.method != "GET":
+            return _error_response(_invalid("Artifact listings only support GET"))
+        return JSONResponse(store.list_artifacts(request.query_params.get("path", "")))
+    if request.method == "PUT":
+        store.artifacts[path] = await request.body()
+        return JSONResponse({})
+    if request.method == "DELETE":
+        removed = [key for key in store.artifacts if key == path or key.startswith(f"{path}/")]
+        for key in removed:
+            del store.artifacts[key]
+        return JSONResponse({})
+    content = store.artifacts.get(path)
+    if content is None:
+        return _error_response(_not_found(f"Artifact '{path}' not found"))
+    return _artifact_download(request, content)
+
+
+def main(argv: list[str] | None = None) -> int:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--uds", help="Serve on a Unix domain socket instead of TCP")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    app = create_app(
+        FaultInjection(
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+        )
+    )
+    uvicorn.run(app, host=args.host, port=args.port, uds=args.uds, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,263 @@
+"""Micro-benchmarks for the pure functions the gateway runs on every request.
+
+Covers tenant tagging and filter rewriting, the ``is_*_path`` route predicates,
+RBAC role resolution, bearer token parsing and RS256 JWT validation against a
+local JWKS. Each benchmark reports the best-of-``--repeat`` time per call.
+
+Usage::
+
+    python -m benchmarks.micro                    # print results
+    python -m benchmarks.micro --save-baseline    # write benchmarks/micro_baseline.json
+    python -m benchmarks.micro --check            # fail on slowdowns beyond --threshold
+
+Baselines are only comparable on the machine (and Python) that produced them;
+``--check`` warns when the recorded platform differs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from gateway.auth import AuthConfig, JWTValidator, extract_bearer_token
+from gateway.mlflow import tenant
+from gateway.rbac import enforce_rbac, extract_effective_role
+
+
+DEFAULT_BASELINE = Path(__file__).with_name("micro_baseline.json")
+ROUTE_PREDICATES = sorted(name for name in dir(tenant) if name.startswith("is_"))
+# Paths covering every route class plus an unmatched one, as seen in real traffic.
+SAMPLE_PATHS = (
+    "/api/2.0/mlflow/runs/create",
+    "/api/2.0/mlflow/runs/search",
+    "/api/2.0/mlflow/runs/log-batch",
+    "/api/2.1/mlflow/registered-models/get",
+    "/api/2.0/mlflow/model-versions/search",
+    "/api/2.0/mlflow/experiments/get-by-name",
+    "/ajax-api/2.0/mlflow/metrics/get-history",
+    "/api/2.0/mlflow-artifacts/artifacts/1/r/artifacts/model.pkl",
+    "/api/2.0/mlflow/gateway/routes",
+)
+ROLE_CLAIMS = {"roles": ["ml-readers", "team-a-contributors"], "groups": ["everyone"]}
+
+
+def _jwt_benchmark() -> Callable[[int], None]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk["kid"] = "micro"
+    validator = JWTValidator(
+        AuthConfig(
+            enabled=True,
+            issuer="https://issuer.benchmark.local",
+            audience="mlflow-gateway",
+            algorithms=["RS256"],
+            jwks_uri=None,
+            jwks_json=json.dumps({"keys": [jwk]}),
+            tenant_claim="tenant_id",
+        )
+    )
+    now = datetime.now(UTC)
+    token = jwt.encode(
+        {
+            "sub": "micro",
+            "tenant_id": "tenant-a",
+            "iss": "https://issuer.benchmark.local",
+            "aud": "mlflow-gateway",
+            "iat": now,
+            "nbf": now,
+            "exp": now + timedelta(hours=1),
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": "micro"},
+    )
+    loop = asyncio.new_event_loop()
+
+    async def _validate(loops: int) -> None:
+        for _ in range(loops):
+            await validator.validate_token(token)
+
+    return lambda loops: loop.run_until_complete(_validate(loops))
+
+
+def _loop(call: Callable[[], object]) -> Callable[[int], None]:
+    def run(loops: int) -> None:
+        for _ in range(loops):
+            call()
+
+    return run
+
+
+def _filter_misses() -> Callable[[], object]:
+    # More distinct filters than the rewrite cache holds, so every call parses and renders.
+    filters = [f"metrics.loss < {index} and params.lr = '0.{index}'" for index in range(8192)]
+    position = 0
+
+    def call() -> object:
+        nonlocal position
+        position = (position + 1) % len(filters)
+        return tenant.ensure_tenant_filter_for_search(
+            {"filter": filters[position]}, "tenant-a", "tenant"
+        )
+
+    return call
+
+
+def benchmarks() -> dict[str, Callable[[int], None]]:
+    return {
+        "ensure_tenant_tag_for_create": _loop(
+            lambda: tenant.ensure_tenant_tag_for_create(
+                {"experiment_id": "1", "tags": [{"key": "mlflow.user", "value": "alice"}]},
+                "tenant-a",
+                "tenant",
+            )
+        ),
+        "ensure_tenant_filter_for_search[cached]": _loop(
+            lambda: tenant.ensure_tenant_filter_for_search(
+                {"filter": "metrics.loss < 0.5 and params.lr = '0.01'"}, "tenant-a", "tenant"
+            )
+        ),
+        "ensure_tenant_filter_for_search[uncached]": _loop(_filter_misses()),
+        "_normalize_tags_to_list[list]": _loop(
+            lambda: tenant._normalize_tags_to_list(
+                [{"key": f"k{i}", "value": str(i)} for i in range(5)]
+            )
+        ),
+        "_normalize_tags_to_list[dict]": _loop(
+            lambda: tenant._normalize_tags_to_list({f"k{i}": str(i) for i in range(5)})
+        ),
+        # Every predicate against every sample path: the worst case of route classification.
+        "is_*_path[all]": _loop(
+            lambda: [
+                getattr(tenant, name)(path) for name in ROUTE_PREDICATES for path in SAMPLE_PATHS
+            ]
+        ),
+        "extract_effective_role": _loop(
+            lambda: extract_effective_role(
+                ROLE_CLAIMS, "roles,groups", "ml-readers", "team-a-contributors", ""
+            )
+        ),
+        "enforce_rbac": _loop(
+            lambda: enforce_rbac(
+                "/api/2.0/mlflow/runs/log-batch",
+                ROLE_CLAIMS,
+                "roles,groups",
+                "ml-readers",
+                "team-a-contributors",
+                "",
+            )
+        ),
+        "extract_bearer_token": _loop(lambda: extract_bearer_token("Bearer abc.def.ghi")),
+        "JWTValidator.validate_token": _jwt_benchmark(),
+    }
+
+
+def measure(run: Callable[[int], None], repeat: int, min_seconds: float) -> float:
+    """Best-of-``repeat`` nanoseconds per call, with loops calibrated to ``min_seconds``."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        run(loops)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, int(min_seconds / elapsed) + 1)
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        run(loops)
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best * 1e9
+
+
+def check(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Benchmarks slower than ``baseline`` by more than ``threshold`` (relative)."""
+    slower = []
+    for name, ns in results.items():
+        previous = baseline.get(name)
+        if previous and ns / previous - 1 > threshold:
+            slower.append((name, previous, ns, ns / previous - 1))
+    return slower
+
+
+def _platform() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="Per measurement")
+    parser.add_argument("--filter", default="", help="Only benchmarks containing this text")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Compare against the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed relative slowdown for --check"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {
+        name: round(measure(run, args.repeat, args.min_seconds), 1)
+        for name, run in benchmarks().items()
+        if args.filter in name
+    }
+
+    baseline: dict[str, float] = {}
+    if args.check:
+        recorded = json.loads(args.baseline.read_text())
+        baseline = recorded["results"]
+        if recorded.get("platform") != _platform():
+            print(
+                f"warning: baseline was recorded on {recorded.get('platform')}, "
+                f"this is {_platform()}",
+                file=sys.stderr,
+            )
+
+    if args.json:
+        print(json.dumps({"platform": _platform(), "results": results}, indent=2))
+    else:
+        print(f"{'benchmark':<44} {'ns/call':>12} {'baseline':>12} {'change':>8}")
+        for name, ns in results.items():
+            previous = baseline.get(name)
+            change = f"{ns / previous - 1:+.1%}" if previous else ""
+            print(f"{name:<44} {ns:>12.1f} {previous or '':>12} {change:>8}")
+
+    if args.save_baseline:
+        args.baseline.write_text(
+            json.dumps({"platform": _platform(), "results": results}, indent=2) + "\n"
+        )
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+
+    if args.check:
+        slower = check(results, baseline, args.threshold)
+        for name, previous, ns, change in slower:
+            print(
+                f"SLOWER: {name} {previous:.1f} -> {ns:.1f} ns/call ({change:+.1%})",
+                file=sys.stderr,
+            )
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
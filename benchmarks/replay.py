@@ -0,0 +1,636 @@
+"""Replay production traffic from gateway audit logs against a gateway.
+
+Reads audit NDJSON (plain or gzip, with or without a logging prefix), keeps the
+allowed requests (``--include-denied`` keeps denials too) and replays their
+method, path, tenant and arrival times. Audit events carry no bodies, so every
+request gets a representative payload for its endpoint. The payload refers to
+an experiment, runs, a registered model and an artifact seeded per tenant
+through the gateway before the replay starts. Destructive endpoints (delete,
+restore, rename) act on throwaway resources created just before the request;
+that setup is not measured.
+
+Pacing:
+
+- default: original inter-arrival times
+- ``--speed 4``: four times faster (``0.5`` is half speed)
+- ``--max-rate``: ignore timestamps and send as fast as ``--concurrency`` allows
+
+Latency is reported per route class (``create``, ``get``, ``search``,
+``mutation``, ``artifact``, ``other``) along with the schedule lag, which is how
+late requests started because all ``--concurrency`` slots were busy.
+
+Usage::
+
+    python -m benchmarks.replay audit.log.gz --target-url http://gateway:8000 --speed 2
+    python -m benchmarks.replay audit.log --max-rate --concurrency 64 --json
+
+Without ``--target-url`` the gateway app runs in process (auth off) in front of
+``benchmarks.fake_mlflow``. Against a gateway with auth, pass ``--tokens`` with
+a JSON object mapping each tenant to a bearer token.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import statistics
+import time
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+from gateway.audit import iter_audit_events
+from gateway.mlflow.routes import ROUTE_CLASSES, route_class_for_path
+
+
+_API_PATH = re.compile(r"^(?P<prefix>/(?:ajax-)?api/2\.[01]/mlflow)/(?P<endpoint>.+)$")
+_ARTIFACT_PATH = re.compile(
+    r"^(?P<prefix>/(?:ajax-)?api/2\.0/mlflow-artifacts)/(?P<kind>artifacts|mpu/\w+)(?:/.*)?$"
+)
+RUNS_PER_TENANT = 10
+ARTIFACT_BYTES = b"x" * 1024
+
+
+@dataclass(frozen=True)
+class ReplayRequest:
+    offset: float  # seconds after the first replayed event
+    tenant: str
+    method: str
+    path: str
+
+
+@dataclass
+class TenantFixtures:
+    tenant: str
+    experiment_id: str
+    experiment_name: str
+    run_ids: list[str]
+    model_name: str
+    artifact_path: str
+
+    def run_id(self, index: int) -> str:
+        return self.run_ids[index % len(self.run_ids)]
+
+
+@dataclass
+class LoadStats:
+    events: int = 0
+    skipped_denied: int = 0
+    skipped_no_tenant: int = 0
+
+
+def load_requests(
+    paths: Iterable[str], *, include_denied: bool = False, limit: int | None = None
+) -> tuple[list[ReplayRequest], LoadStats]:
+    """Read audit logs into requests ordered by arrival, offsets relative to the first."""
+    stats = LoadStats()
+    timed: list[tuple[datetime, str, str, str]] = []
+    for path in paths:
+        for event in iter_audit_events(path):
+            stats.events += 1
+            if event.get("decision") != "allow" and not include_denied:
+                stats.skipped_denied += 1
+                continue
+            if not event.get("tenant"):
+                stats.skipped_no_tenant += 1
+                continue
+            timed.append(
+                (
+                    datetime.fromisoformat(event["timestamp"]),
+                    event["tenant"],
+                    event["method"],
+                    event["path"],
+                )
+            )
+    timed.sort(key=lambda item: item[0])
+    if limit is not None:
+        timed = timed[:limit]
+    if not timed:
+        return [], stats
+    first = timed[0][0]
+    return [
+        ReplayRequest((at - first).total_seconds(), tenant, method, path)
+        for at, tenant, method, path in timed
+    ], stats
+
+
+# Payload synthesis. Builders run before the request is timed, so they may create
+# throwaway resources for endpoints that would otherwise consume the fixtures.
+
+Payload = dict[str, Any]
+Builder = Callable[["Replayer", TenantFixtures, int], Awaitable[Payload]]
+
+
+def _unique(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+
+def _static(build: Callable[[TenantFixtures, int], Payload]) -> Builder:
+    async def builder(replayer: Replayer, fixtures: TenantFixtures, index: int) -> Payload:
+        return build(fixtures, index)
+
+    return builder
+
+
+async def _throwaway_experiment(r: Replayer, f: TenantFixtures, deleted: bool = False) -> str:
+    experiment_id = (
+        await r.setup(f.tenant, "experiments/create", {"name": _unique(f"replay-{f.tenant}")})
+    )["experiment_id"]
+    if deleted:
+        await r.setup(f.tenant, "experiments/delete", {"experiment_id": experiment_id})
+    return experiment_id
+
+
+async def _throwaway_run(r: Replayer, f: TenantFixtures, deleted: bool = False) -> str:
+    run_id = (await r.setup(f.tenant, "runs/create", {"experiment_id": f.experiment_id}))["run"][
+        "info"
+    ]["run_id"]
+    if deleted:
+        await r.setup(f.tenant, "runs/delete", {"run_id": run_id})
+    return run_id
+
+
+async def _throwaway_model(r: Replayer, f: TenantFixtures) -> str:
+    name = _unique(f"replay-{f.tenant}")
+    await r.setup(f.tenant, "registered-models/create", {"name": name})
+    return name
+
+
+async def _throwaway_version(r: Replayer, f: TenantFixtures) -> str:
+    created = await r.setup(
+        f.tenant,
+        "model-versions/create",
+        {"name": f.model_name, "source": "replay://model", "run_id": f.run_ids[0]},
+    )
+    return created["model_version"]["version"]
+
+
+async def _tagged(r: Replayer, f: TenantFixtures, endpoint: str, target: Payload) -> Payload:
+    key = _unique("replay")
+    await r.setup(f.tenant, endpoint, {**target, "key": key, "value": "1"})
+    return {**target, "key": key}
+
+
+async def _experiment_update(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"experiment_id": await _throwaway_experiment(r, f), "new_name": _unique("renamed")}
+
+
+async def _experiment_delete(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"experiment_id": await _throwaway_experiment(r, f)}
+
+
+async def _experiment_restore(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"experiment_id": await _throwaway_experiment(r, f, deleted=True)}
+
+
+async def _experiment_delete_tag(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return await _tagged(
+        r, f, "experiments/set-experiment-tag", {"experiment_id": f.experiment_id}
+    )
+
+
+async def _run_delete(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"run_id": await _throwaway_run(r, f)}
+
+
+async def _run_restore(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"run_id": await _throwaway_run(r, f, deleted=True)}
+
+
+async def _run_delete_tag(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return await _tagged(r, f, "runs/set-tag", {"run_id": f.run_id(index)})
+
+
+async def _model_rename(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"name": await _throwaway_model(r, f), "new_name": _unique(f"replay-{f.tenant}")}
+
+
+async def _model_delete(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"name": await _throwaway_model(r, f)}
+
+
+async def _model_delete_tag(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return await _tagged(r, f, "registered-models/set-tag", {"name": f.model_name})
+
+
+async def _version_delete(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return {"name": f.model_name, "version": await _throwaway_version(r, f)}
+
+
+async def _version_delete_tag(r: Replayer, f: TenantFixtures, index: int) -> Payload:
+    return await _tagged(r, f, "model-versions/set-tag", {"name": f.model_name, "version": "1"})
+
+
+BUILDERS: dict[str, Builder] = {
+    "experiments/create": _static(lambda f, i: {"name": _unique(f"replay-{f.tenant}")}),
+    "experiments/get": _static(lambda f, i: {"experiment_id": f.experiment_id}),
+    "experiments/get-by-name": _static(lambda f, i: {"experiment_name": f.experiment_name}),
+    "experiments/search": _static(lambda f, i: {"max_results": 25}),
+    "experiments/update": _experiment_update,
+    "experiments/delete": _experiment_delete,
+    "experiments/restore": _experiment_restore,
+    "experiments/set-experiment-tag": _static(
+        lambda f, i: {"experiment_id": f.experiment_id, "key": "replay", "value": str(i)}
+    ),
+    "experiments/delete-experiment-tag": _experiment_delete_tag,
+    "runs/create": _static(lambda f, i: {"experiment_id": f.experiment_id}),
+    "runs/get": _static(lambda f, i: {"run_id": f.run_id(i)}),
+    "runs/search": _static(
+        lambda f, i: {
+            "experiment_ids": [f.experiment_id],
+            "filter": "attributes.status = 'RUNNING'",
+            "max_results": 25,
+        }
+    ),
+    "runs/update": _static(lambda f, i: {"run_id": f.run_id(i), "run_name": f"replay-{i}"}),
+    "runs/delete": _run_delete,
+    "runs/restore": _run_restore,
+    "runs/log-metric": _static(
+        lambda f, i: {
+            "run_id": f.run_id(i),
+            "key": "loss",
+            "value": 1.0 / (i + 1),
+            "timestamp": 1_700_000_000_000 + i,
+            "step": i,
+        }
+    ),
+    "runs/log-parameter": _static(
+        lambda f, i: {"run_id": f.run_id(i), "key": _unique("param"), "value": str(i)}
+    ),
+    "runs/log-batch": _static(
+        lambda f, i: {
+            "run_id": f.run_id(i),
+            "metrics": [
+                {"key": f"metric_{m}", "value": m * 0.1, "timestamp": 1_700_000_000_000, "step": i}
+                for m in range(10)
+            ],
+        }
+    ),
+    "runs/set-tag": _static(lambda f, i: {"run_id": f.run_id(i), "key": "replay", "value": str(i)}),
+    "runs/delete-tag": _run_delete_tag,
+    "metrics/get-history": _static(lambda f, i: {"run_id": f.run_ids[0], "metric_key": "loss"}),
+    "registered-models/create": _static(lambda f, i: {"name": _unique(f"replay-{f.tenant}")}),
+    "registered-models/get": _static(lambda f, i: {"name": f.model_name}),
+    "registered-models/search": _static(lambda f, i: {"max_results": 25}),
+    "registered-models/update": _static(
+        lambda f, i: {"name": f.model_name, "description": f"replay {i}"}
+    ),
+    "registered-models/rename": _model_rename,
+    "registered-models/delete": _model_delete,
+    "registered-models/set-tag": _static(
+        lambda f, i: {"name": f.model_name, "key": "replay", "value": str(i)}
+    ),
+    "registered-models/delete-tag": _model_delete_tag,
+    "model-versions/create": _static(
+        lambda f, i: {"name": f.model_name, "source": "replay://model", "run_id": f.run_id(i)}
+    ),
+    "model-versions/get": _static(lambda f, i: {"name": f.model_name, "version": "1"}),
+    "model-versions/search": _static(
+        lambda f, i: {"filter": f"name = '{f.model_name}'", "max_results": 25}
+    ),
+    "model-versions/update": _static(
+        lambda f, i: {"name": f.model_name, "version": "1", "description": f"replay {i}"}
+    ),
+    "model-versions/transition-stage": _static(
+        lambda f, i: {
+            "name": f.model_name,
+            "version": "1",
+            "stage": "Staging",
+            "archive_existing_versions": False,
+        }
+    ),
+    "model-versions/delete": _version_delete,
+    "model-versions/set-tag": _static(
+        lambda f, i: {"name": f.model_name, "version": "1", "key": "replay", "value": str(i)}
+    ),
+    "model-versions/delete-tag": _version_delete_tag,
+}
+
+
+# (method, path, httpx request kwargs) actually sent for a replayed request.
+Outgoing = tuple[str, str, dict[str, Any]]
+
+
+def _request_kwargs(method: str, payload: Payload) -> dict[str, Any]:
+    # MLflow reads arrive as query parameters, everything else as a JSON body.
+    if method in ("GET", "HEAD"):
+        return {"params": payload}
+    return {"json": payload}
+
+
+def _artifact_request(
+    request: ReplayRequest, fixtures: TenantFixtures, index: int, prefix: str, kind: str
+) -> Outgoing:
+    if kind != "artifacts":
+        # Multipart upload control calls: keep the route, point it at a fresh path.
+        path = f"{fixtures.artifact_path.rsplit('/', 1)[0]}/replay-{index}.bin"
+        return request.method, f"{prefix}/{kind}/{path}", {"json": {"path": path}}
+    if request.path.rstrip("/").endswith("/artifacts") and request.method == "GET":
+        listing = fixtures.artifact_path.rsplit("/", 1)[0]
+        return request.method, f"{prefix}/artifacts", {"params": {"path": listing}}
+    if request.method in ("GET", "HEAD"):
+        return request.method, f"{prefix}/artifacts/{fixtures.artifact_path}", {}
+    path = f"{fixtures.artifact_path.rsplit('/', 1)[0]}/replay-{index}.bin"
+    kwargs = {"content": ARTIFACT_BYTES} if request.method in ("PUT", "POST") else {}
+    return request.method, f"{prefix}/artifacts/{path}", kwargs
+
+
+async def synthesize(
+    replayer: Replayer, request: ReplayRequest, fixtures: TenantFixtures, index: int
+) -> Outgoing:
+    """The request to send for a recorded one, with a payload built from ``fixtures``."""
+    artifact = _ARTIFACT_PATH.match(request.path)
+    if artifact:
+        return _artifact_request(request, fixtures, index, artifact["prefix"], artifact["kind"])
+    api = _API_PATH.match(request.path)
+    builder = BUILDERS.get(api["endpoint"]) if api else None
+    if builder is None:
+        # Unknown endpoint: replay it as recorded so the gateway still does its work.
+        body = {} if request.method not in ("GET", "HEAD") else None
+        return request.method, request.path, {"json": body} if body is not None else {}
+    payload = await builder(replayer, fixtures, index)
+    return request.method, request.path, _request_kwargs(request.method, payload)
+
+
+class ReplayError(RuntimeError):
+    pass
+
+
+@dataclass
+class _Sample:
+    route_class: str
+    latency_ms: float
+    status_code: int  # 0 when the request failed before a response
+
+
+@dataclass
+class Replayer:
+    client: httpx.AsyncClient
+    headers: Callable[[str], dict[str, str]]
+    fixtures: dict[str, TenantFixtures] = field(default_factory=dict)
+    runs_per_tenant: int = RUNS_PER_TENANT
+
+    async def setup(self, tenant: str, endpoint: str, payload: Payload) -> dict[str, Any]:
+        """An unmeasured write through the gateway, used to seed and prepare fixtures."""
+        response = await self.client.post(
+            f"/api/2.0/mlflow/{endpoint}", json=payload, headers=self.headers(tenant)
+        )
+        if response.status_code != 200:
+            raise ReplayError(
+                f"{endpoint} for tenant {tenant!r} failed with {response.status_code}: "
+                f"{response.text[:200]}"
+            )
+        return response.json()
+
+    async def seed(self, tenant: str) -> TenantFixtures:
+        experiment_name = _unique(f"replay-{tenant}")
+        experiment_id = (await self.setup(tenant, "experiments/create", {"name": experiment_name}))[
+            "experiment_id"
+        ]
+        run_ids = []
+        for _ in range(self.runs_per_tenant):
+            created = await self.setup(tenant, "runs/create", {"experiment_id": experiment_id})
+            run_ids.append(created["run"]["info"]["run_id"])
+        await self.setup(
+            tenant,
+            "runs/log-metric",
+            {"run_id": run_ids[0], "key": "loss", "value": 1.0, "timestamp": 0, "step": 0},
+        )
+        model_name = _unique(f"replay-{tenant}")
+        await self.setup(tenant, "registered-models/create", {"name": model_name})
+        await self.setup(
+            tenant,
+            "model-versions/create",
+            {"name": model_name, "source": "replay://model", "run_id": run_ids[0]},
+        )
+        artifact_path = f"{experiment_id}/{run_ids[0]}/artifacts/replay.bin"
+        uploaded = await self.client.put(
+            f"/api/2.0/mlflow-artifacts/artifacts/{artifact_path}",
+            content=ARTIFACT_BYTES,
+            headers=self.headers(tenant),
+        )
+        if uploaded.status_code >= 400:
+            logging.getLogger(__name__).warning(
+                "artifact seed for tenant %s failed with %s; artifact reads will error",
+                tenant,
+                uploaded.status_code,
+            )
+        return TenantFixtures(
+            tenant, experiment_id, experiment_name, run_ids, model_name, artifact_path
+        )
+
+    async def replay(
+        self, requests: list[ReplayRequest], *, speed: float | None, concurrency: int
+    ) -> dict[str, Any]:
+        """Send ``requests`` paced by ``speed`` (``None`` for max rate) and summarize them."""
+        for tenant in sorted({request.tenant for request in requests}):
+            if tenant not in self.fixtures:
+                self.fixtures[tenant] = await self.seed(tenant)
+
+        slots = asyncio.Semaphore(concurrency)
+        samples: list[_Sample] = []
+        lags: list[float] = []
+        setup_failures = 0
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def _send(index: int, request: ReplayRequest) -> None:
+            nonlocal setup_failures
+            try:
+                method, path, kwargs = await synthesize(
+                    self, request, self.fixtures[request.tenant], index
+                )
+            except ReplayError:
+                setup_failures += 1
+                slots.release()
+                return
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(
+                    method, path, headers=self.headers(request.tenant), **kwargs
+                )
+                status_code = response.status_code
+            except httpx.HTTPError:
+                status_code = 0
+            finally:
+                slots.release()
+            samples.append(
+                _Sample(
+                    route_class_for_path(request.path),
+                    (time.perf_counter() - started) * 1000,
+                    status_code,
+                )
+            )
+
+        started = time.perf_counter()
+        for index, request in enumerate(requests):
+            if speed is not None:
+                due = started + request.offset / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await slots.acquire()
+            if speed is not None:
+                lags.append(max(0.0, time.perf_counter() - (started + request.offset / speed)))
+            task = asyncio.create_task(_send(index, request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+        report = summarize(samples, elapsed, lags)
+        report["setup_failures"] = setup_failures
+        return report
+
+
+def _distribution(latencies: list[float]) -> dict[str, float]:
+    if len(latencies) == 1:
+        p50 = p95 = p99 = latencies[0]
+    else:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+    return {
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+        "max_ms": round(max(latencies), 3),
+    }
+
+
+def summarize(samples: list[_Sample], elapsed: float, lags: list[float]) -> dict[str, Any]:
+    by_class: dict[str, list[_Sample]] = defaultdict(list)
+    for sample in samples:
+        by_class[sample.route_class].append(sample)
+    classes = {}
+    for route_class in ROUTE_CLASSES:
+        group = by_class.get(route_class)
+        if not group:
+            continue
+        classes[route_class] = {
+            "requests": len(group),
+            "errors": sum(1 for s in group if not 200 <= s.status_code < 400),
+            **_distribution([s.latency_ms for s in group]),
+            "status_codes": dict(sorted(Counter(str(s.status_code) for s in group).items())),
+        }
+    return {
+        "requests": len(samples),
+        "errors": sum(c["errors"] for c in classes.values()),
+        "duration_s": round(elapsed, 3),
+        "rps": round(len(samples) / elapsed, 1) if elapsed > 0 else 0.0,
+        "max_lag_ms": round(max(lags) * 1000, 3) if lags else None,
+        "route_classes": classes,
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    lag = "" if report["max_lag_ms"] is None else f", max lag {report['max_lag_ms']} ms"
+    print(
+        f"{report['requests']} requests in {report['duration_s']}s "
+        f"({report['rps']} rps, {report['errors']} errors{lag})"
+    )
+    columns = ("requests", "errors", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+    print(f"{'route class':<12}" + "".join(f" {c:>10}" for c in columns))
+    for route_class, row in report["route_classes"].items():
+        print(f"{route_class:<12}" + "".join(f" {row[c]:>10}" for c in columns))
+
+
+def _header_factory(args: argparse.Namespace) -> Callable[[str], dict[str, str]]:
+    if args.tokens:
+        with open(args.tokens, encoding="utf-8") as handle:
+            tokens = json.load(handle)
+
+        def bearer(tenant: str) -> dict[str, str]:
+            if tenant not in tokens:
+                raise SystemExit(f"no token for tenant {tenant!r} in {args.tokens}")
+            return {"Authorization": f"Bearer {tokens[tenant]}"}
+
+        return bearer
+    return lambda tenant: {args.tenant_header: tenant}
+
+
+async def _run(args: argparse.Namespace, requests: list[ReplayRequest]) -> dict[str, Any]:
+    speed = None if args.max_rate else args.speed
+    if args.target_url:
+        async with httpx.AsyncClient(base_url=args.target_url, timeout=args.timeout) as client:
+            replayer = Replayer(client, _header_factory(args), runs_per_tenant=args.runs_per_tenant)
+            return await replayer.replay(requests, speed=speed, concurrency=args.concurrency)
+
+    from benchmarks.e2e import _configure_auth, _open_upstream
+    from gateway.config import settings
+    from gateway.main import app
+    from gateway.upstream import close_upstream_clients
+
+    base_url, upstream = await _open_upstream(args.upstream_url)
+    settings.target_base_url = base_url
+    settings.tenant_tag_key = "tenant"
+    _configure_auth("off")
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://gateway"
+        ) as client:
+            replayer = Replayer(
+                client, lambda tenant: {"X-Tenant": tenant}, runs_per_tenant=args.runs_per_tenant
+            )
+            return await replayer.replay(requests, speed=speed, concurrency=args.concurrency)
+    finally:
+        await upstream.aclose()
+        await close_upstream_clients()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", nargs="+", help="Audit log files (.gz ok, - for stdin)")
+    parser.add_argument("--target-url", help="Gateway to replay against (default: in process)")
+    parser.add_argument("--upstream-url", help="Fake MLflow server for the in-process gateway")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor")
+    parser.add_argument("--max-rate", action="store_true", help="Ignore original timing")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--limit", type=int, help="Replay only the first N requests")
+    parser.add_argument("--include-denied", action="store_true")
+    parser.add_argument("--runs-per-tenant", type=int, default=RUNS_PER_TENANT)
+    parser.add_argument("--tenant-header", default="X-Tenant", help="Used when auth is off")
+    parser.add_argument("--tokens", help="JSON file mapping tenant to bearer token")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    requests, stats = load_requests(args.logs, include_denied=args.include_denied, limit=args.limit)
+    if not requests:
+        parser.error(f"no replayable requests in {', '.join(args.logs)}")
+    logging.basicConfig(level=logging.WARNING)
+    # The in-process gateway still formats and writes its audit events, just not to the terminal.
+    audit_logger = logging.getLogger("gateway.audit")
+    audit_logger.setLevel(logging.INFO)
+    audit_logger.addHandler(logging.FileHandler(os.devnull))
+    audit_logger.propagate = False
+    report = asyncio.run(_run(args, requests))
+    report["source"] = {
+        "events": stats.events,
+        "replayed": len(requests),
+        "skipped_denied": stats.skipped_denied,
+        "skipped_no_tenant": stats.skipped_no_tenant,
+        "recorded_duration_s": round(requests[-1].offset, 3),
+        "speed": None if args.max_rate else args.speed,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
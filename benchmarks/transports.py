@@ -0,0 +1,211 @@
+"""Compare upstream transport throughput through the gateway's pooled client.
+
+Starts a small MLflow-like upstream in a subprocess per transport and drives
+``runs/get``-sized requests through ``gateway.upstream.get_upstream_client``:
+
+- ``http1``: HTTP/1.1 over TCP (uvicorn)
+- ``uds``: HTTP/1.1 over a Unix domain socket (uvicorn)
+- ``http2``: HTTP/2 prior knowledge over TCP (hypercorn; needs ``h2`` and ``hypercorn``)
+
+Usage::
+
+    python -m benchmarks.transports --requests 5000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+
+from gateway.config import settings
+from gateway.upstream import close_upstream_clients, get_upstream_client
+
+
+RUN_PAYLOAD = json.dumps(
+    {
+        "run": {
+            "info": {"run_id": "0" * 32, "experiment_id": "1", "status": "FINISHED"},
+            "data": {
+                "metrics": [{"key": f"m{i}", "value": i * 0.1, "step": i} for i in range(10)],
+                "params": [{"key": f"p{i}", "value": str(i)} for i in range(10)],
+                "tags": [{"key": "tenant", "value": "alpha"}],
+            },
+        }
+    }
+).encode()
+
+
+async def upstream_app(scope, receive, send) -> None:
+    """Minimal ASGI upstream answering every request with a fixed run payload."""
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    more_body = True
+    while more_body:
+        message = await receive()
+        more_body = message.get("more_body", False)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": RUN_PAYLOAD})
+
+
+def _serve_http2(port: int) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    # The default recycles connections every 1000 requests, which would be measured as errors.
+    config.keep_alive_max_requests = 10**9
+    config.loglevel = "WARNING"
+    asyncio.run(serve(upstream_app, config))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def _serve(
+    command: list[str], base_url: str, transport: httpx.HTTPTransport | None
+) -> Iterator[None]:
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                with httpx.Client(transport=transport) as client:
+                    client.get(f"{base_url}/health")
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError(f"Upstream did not start: {' '.join(command)}")
+                time.sleep(0.1)
+        yield
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def _drive(base_url: str, transport: str, requests: int, concurrency: int) -> dict:
+    settings.upstream_transports = {base_url: transport}
+    client = get_upstream_client(base_url)
+    url = f"{base_url}/api/2.0/mlflow/runs/get"
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def _worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.post(url, content=b'{"run_id": "r"}')
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    # Warm up the pool so connection setup is not measured.
+    await asyncio.gather(*(client.post(url, content=b"{}") for _ in range(concurrency)))
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await close_upstream_clients()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "transport": transport,
+        "requests": requests,
+        "concurrency": concurrency,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(quantiles[49], 3),
+        "p99_ms": round(quantiles[98], 3),
+    }
+
+
+def run(requests: int, concurrency: int) -> list[dict]:
+    results = []
+    python = sys.executable
+    app = "benchmarks.transports:upstream_app"
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    with _serve(
+        [python, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning"],
+        base_url,
+        None,
+    ):
+        results.append(asyncio.run(_drive(base_url, "http1", requests, concurrency)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sock = os.path.join(tmp, "mlflow.sock")
+        base_url = "http://mlflow-uds"
+        with _serve(
+            [python, "-m", "uvicorn", app, "--uds", sock, "--log-level", "warning"],
+            base_url,
+            httpx.HTTPTransport(uds=sock),
+        ):
+            results.append(asyncio.run(_drive(base_url, f"uds:{sock}", requests, concurrency)))
+
+    if importlib.util.find_spec("h2") and importlib.util.find_spec("hypercorn"):
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        with _serve(
+            [python, "-m", "benchmarks.transports", "--serve-http2", str(port)],
+            base_url,
+            None,
+        ):
+            results.append(asyncio.run(_drive(base_url, "http2", requests, concurrency)))
+    else:
+        print("Skipping http2: install 'h2' and 'hypercorn' to include it", file=sys.stderr)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--serve-http2", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve_http2:
+        _serve_http2(args.serve_http2)
+        return 0
+
+    results = run(args.requests, args.concurrency)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'transport':<40} {'rps':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for result in results:
+        print(
+            f"{result['transport']:<40} {result['rps']:>10} "
+            f"{result['p50_ms']:>10} {result['p99_ms']:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
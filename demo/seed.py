@@ -1,229 +1,470 @@
 #!/usr/bin/env python3
+"""Seed tenant-tagged MLflow data through the gateway.
+
+Defaults reproduce the demo dataset: tenants ``alpha`` and ``bravo``, one
+experiment with two runs and one registered model (plus a version) each. Larger
+datasets for search and preflight benchmarks come from the same script, e.g.::
+
+    python demo/seed.py --tenants 10 --experiments 20 --runs 1000 --concurrency 64
+
+Writes run concurrently (``--concurrency`` in flight, persistent connections)
+and the script prints progress and the achieved write throughput. The output
+manifest keeps the demo layout (``.alpha.experiment_id`` etc. refer to each
+tenant's first experiment) and adds every experiment, run and model per tenant
+plus a ``_meta`` summary.
+
+Standard library only, so it runs in a bare ``python:3.11-slim`` container.
+"""
 from __future__ import annotations
 
+import argparse
+import asyncio
+import http.client
 import json
 import os
+import sys
+import threading
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 
 
 GATEWAY_URL = os.getenv("GATEWAY_URL", "http://localhost:8000").rstrip("/")
 OUTPUT_PATH = os.getenv("DEMO_OUTPUT_PATH", "/demo/seed-output.json")
-TENANTS = ("alpha", "bravo")
+# Tenant names beyond these are numbered (tenant-027, ...).
+TENANT_NAMES = tuple(
+    "alpha bravo charlie delta echo foxtrot golf hotel india juliett kilo lima mike november "
+    "oscar papa quebec romeo sierra tango uniform victor whiskey xray yankee zulu".split()
+)
+# MLflow's log-batch limits.
+MAX_BATCH_METRICS = 1000
+MAX_BATCH_PARAMS = 100
 
 
 def _now_ms() -> int:
     return int(datetime.now(timezone.utc).timestamp() * 1000)
 
 
-def _request(
-    method: str,
-    path: str,
-    *,
-    tenant: str | None = None,
-    subject: str | None = None,
-    payload: dict | None = None,
-    query: dict | None = None,
-) -> tuple[int, dict]:
-    url = f"{GATEWAY_URL}{path}"
-    if query:
-        url = f"{url}?{urllib.parse.urlencode(query)}"
-
-    data = None
-    headers = {}
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-    if tenant:
-        headers["X-Tenant"] = tenant
-    if subject:
-        headers["X-Subject"] = subject
-
-    req = urllib.request.Request(url, data=data, headers=headers, method=method.upper())
-    try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            body = resp.read().decode("utf-8") or "{}"
-            return resp.getcode(), json.loads(body)
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8") or "{}"
-        try:
-            parsed = json.loads(body)
-        except json.JSONDecodeError:
-            parsed = {"detail": body}
-        return exc.code, parsed
-    except urllib.error.URLError as exc:
-        return 0, {"detail": str(exc)}
+def tenant_names(count: int) -> list[str]:
+    return [
+        TENANT_NAMES[index] if index < len(TENANT_NAMES) else f"tenant-{index + 1:03d}"
+        for index in range(count)
+    ]
 
 
-def wait_for_gateway_ready() -> None:
+def _numbered(base: str, index: int) -> str:
+    # The first resource keeps the original demo name so reruns reuse it.
+    return base if index == 0 else f"{base}-{index + 1}"
+
+
+class GatewayClient:
+    """Blocking JSON client with one keep-alive connection per worker thread."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0, attempts: int = 3):
+        self.base_url = base_url
+        parsed = urllib.parse.urlsplit(base_url)
+        self._connection_class = (
+            http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        )
+        self._netloc = parsed.netloc
+        self._prefix = parsed.path.rstrip("/")
+        self._timeout = timeout
+        self._attempts = attempts
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connection_class(self._netloc, timeout=self._timeout)
+            self._local.connection = connection
+        return connection
+
+    def _send(
+        self, method: str, url: str, data: bytes | None, headers: dict[str, str]
+    ) -> tuple[int, dict]:
+        connection = self._connection()
+        try:
+            connection.request(method, url, body=data, headers=headers)
+            response = connection.getresponse()
+            body = response.read().decode("utf-8") or "{}"
+        except (OSError, http.client.HTTPException) as exc:
+            connection.close()
+            self._local.connection = None
+            return 0, {"detail": str(exc)}
+        try:
+            return response.status, json.loads(body)
+        except json.JSONDecodeError:
+            return response.status, {"detail": body}
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        tenant: str | None = None,
+        subject: str | None = None,
+        payload: dict | None = None,
+        query: dict | None = None,
+    ) -> tuple[int, dict]:
+        url = f"{self._prefix}{path}"
+        if query:
+            url = f"{url}?{urllib.parse.urlencode(query)}"
+
+        data = None
+        headers = {}
+        if payload is not None:
+            data = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        if tenant:
+            headers["X-Tenant"] = tenant
+        if subject:
+            headers["X-Subject"] = subject
+
+        # Connection errors and 5xx are retried: stale keep-alive connections and a
+        # briefly overloaded upstream should not abort a long seeding run.
+        for attempt in range(self._attempts):
+            code, body = self._send(method.upper(), url, data, headers)
+            if (code != 0 and code < 500) or attempt == self._attempts - 1:
+                break
+            time.sleep(0.1 * 2**attempt)
+        return code, body
+
+
+def wait_for_gateway_ready(client: GatewayClient) -> None:
     for _ in range(120):
-        code, _ = _request("GET", "/readyz")
+        code, _ = client.request("GET", "/readyz")
         if code == 200:
             return
         time.sleep(1)
-    raise RuntimeError(f"Gateway not ready at {GATEWAY_URL}/readyz")
-
-
-def create_or_get_experiment(tenant: str, subject: str, name: str) -> str:
-    code, body = _request(
-        "POST",
-        "/api/2.0/mlflow/experiments/create",
-        tenant=tenant,
-        subject=subject,
-        payload={"name": name},
-    )
-    if code == 200:
-        return str(body["experiment_id"])
-
-    code, body = _request(
-        "GET",
-        "/api/2.0/mlflow/experiments/get-by-name",
-        tenant=tenant,
-        subject=subject,
-        query={"experiment_name": name},
-    )
-    if code == 200 and isinstance(body.get("experiment"), dict):
-        return str(body["experiment"]["experiment_id"])
-    raise RuntimeError(f"Failed to create/get experiment {name}: {code} {body}")
-
-
-def create_run(tenant: str, subject: str, experiment_id: str, idx: int) -> str:
-    tags = [
-        {"key": "tenant", "value": tenant},
-        {"key": "demo_seed", "value": "true"},
-        {"key": "seed_tenant", "value": tenant},
-        {"key": "seed_run", "value": str(idx)},
-    ]
-    code, body = _request(
-        "POST",
-        "/api/2.0/mlflow/runs/create",
-        tenant=tenant,
-        subject=subject,
-        payload={"experiment_id": experiment_id, "tags": tags},
-    )
-    if code != 200:
-        raise RuntimeError(f"Failed to create run for {tenant}: {code} {body}")
-    run_id = body.get("run", {}).get("info", {}).get("run_id")
-    if not isinstance(run_id, str) or not run_id:
-        raise RuntimeError(f"Missing run_id in response: {body}")
-    return run_id
-
-
-def log_run_data(tenant: str, subject: str, run_id: str, idx: int) -> None:
-    payload = {
-        "run_id": run_id,
-        "params": [
-            {"key": "learning_rate", "value": f"0.0{idx}"},
-            {"key": "tenant", "value": tenant},
-        ],
-        "metrics": [
-            {"key": "accuracy", "value": 0.8 + (idx * 0.05), "timestamp": _now_ms(), "step": idx}
-        ],
-        "tags": [{"key": "seed_source", "value": "docker-compose-demo"}],
-    }
-    code, body = _request(
-        "POST",
-        "/api/2.0/mlflow/runs/log-batch",
-        tenant=tenant,
-        subject=subject,
-        payload=payload,
-    )
-    if code != 200:
-        raise RuntimeError(f"Failed to log run data for {run_id}: {code} {body}")
-
-
-def create_or_get_registered_model(tenant: str, subject: str, model_name: str) -> None:
-    payload = {
-        "name": model_name,
-        "tags": [
-            {"key": "tenant", "value": tenant},
-            {"key": "demo_seed", "value": "true"},
-        ],
-    }
-    code, body = _request(
-        "POST",
-        "/api/2.0/mlflow/registered-models/create",
-        tenant=tenant,
-        subject=subject,
-        payload=payload,
-    )
-    if code == 200:
-        return
-
-    code, _ = _request(
-        "POST",
-        "/api/2.0/mlflow/registered-models/get",
-        tenant=tenant,
-        subject=subject,
-        payload={"name": model_name},
-    )
-    if code != 200:
-        raise RuntimeError(f"Failed to create/get registered model {model_name}: {code} {body}")
-
-
-def create_model_version(
-    tenant: str, subject: str, model_name: str, source_run_id: str
-) -> str:
-    payload = {
-        "name": model_name,
-        "source": f"runs:/{source_run_id}/model",
-        "run_id": source_run_id,
-        "tags": [
+    raise RuntimeError(f"Gateway not ready at {client.base_url}/readyz")
+
+
+class Seeder:
+    """Runs the blocking client on a thread pool sized to the concurrency limit."""
+
+    def __init__(self, client: GatewayClient, concurrency: int):
+        self.client = client
+        self.concurrency = concurrency
+        self.writes = 0
+        self.runs = 0
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def request(self, method: str, path: str, **kwargs) -> tuple[int, dict]:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._executor, partial(self.client.request, method, path, **kwargs)
+        )
+        if method.upper() == "POST":
+            self.writes += 1
+        return result
+
+    async def create_or_get_experiment(self, tenant: str, subject: str, name: str) -> str:
+        code, body = await self.request(
+            "POST",
+            "/api/2.0/mlflow/experiments/create",
+            tenant=tenant,
+            subject=subject,
+            payload={"name": name},
+        )
+        if code == 200:
+            return str(body["experiment_id"])
+
+        code, body = await self.request(
+            "GET",
+            "/api/2.0/mlflow/experiments/get-by-name",
+            tenant=tenant,
+            subject=subject,
+            query={"experiment_name": name},
+        )
+        if code == 200 and isinstance(body.get("experiment"), dict):
+            return str(body["experiment"]["experiment_id"])
+        raise RuntimeError(f"Failed to create/get experiment {name}: {code} {body}")
+
+    async def create_run(self, tenant: str, subject: str, experiment_id: str, idx: int) -> str:
+        tags = [
             {"key": "tenant", "value": tenant},
             {"key": "demo_seed", "value": "true"},
-        ],
-    }
-    code, body = _request(
-        "POST",
-        "/api/2.0/mlflow/model-versions/create",
-        tenant=tenant,
-        subject=subject,
-        payload=payload,
-    )
-    if code != 200:
-        raise RuntimeError(f"Failed to create model version for {model_name}: {code} {body}")
-    version = body.get("model_version", {}).get("version")
-    if not isinstance(version, str):
-        version = str(version)
-    return version
-
-
-def main() -> None:
-    print(f"Seeding demo data through gateway: {GATEWAY_URL}")
-    wait_for_gateway_ready()
-
-    out: dict[str, dict] = {}
-    for tenant in TENANTS:
-        subject = f"{tenant}-seed"
-        experiment_name = f"demo-{tenant}-exp"
-        model_name = f"demo-{tenant}-model"
-
-        experiment_id = create_or_get_experiment(tenant, subject, experiment_name)
-        run_ids: list[str] = []
-        for idx in (1, 2):
-            run_id = create_run(tenant, subject, experiment_id, idx)
-            log_run_data(tenant, subject, run_id, idx)
-            run_ids.append(run_id)
-
-        create_or_get_registered_model(tenant, subject, model_name)
-        model_version = create_model_version(tenant, subject, model_name, run_ids[0])
-
-        out[tenant] = {
-            "experiment_name": experiment_name,
-            "experiment_id": experiment_id,
-            "run_ids": run_ids,
-            "model_name": model_name,
-            "model_version": model_version,
+            {"key": "seed_tenant", "value": tenant},
+            {"key": "seed_run", "value": str(idx)},
+        ]
+        code, body = await self.request(
+            "POST",
+            "/api/2.0/mlflow/runs/create",
+            tenant=tenant,
+            subject=subject,
+            payload={"experiment_id": experiment_id, "start_time": _now_ms(), "tags": tags},
+        )
+        if code != 200:
+            raise RuntimeError(f"Failed to create run for {tenant}: {code} {body}")
+        run_id = body.get("run", {}).get("info", {}).get("run_id")
+        if not isinstance(run_id, str) or not run_id:
+            raise RuntimeError(f"Missing run_id in response: {body}")
+        return run_id
+
+    async def log_run_data(
+        self,
+        tenant: str,
+        subject: str,
+        run_id: str,
+        idx: int,
+        *,
+        params: int,
+        metric_steps: int,
+    ) -> None:
+        timestamp = _now_ms()
+        payload = {
+            "run_id": run_id,
+            "params": [
+                {"key": "learning_rate", "value": f"0.0{idx}"},
+                {"key": "tenant", "value": tenant},
+                *(
+                    {"key": f"param_{p}", "value": str((idx * 7 + p) % 97)}
+                    for p in range(params - 2)
+                ),
+            ][:MAX_BATCH_PARAMS],
+            "metrics": [
+                {
+                    "key": "accuracy",
+                    "value": min(0.99, 0.5 + (idx % 50) * 0.01 + step * 0.001),
+                    "timestamp": timestamp + step,
+                    "step": step,
+                }
+                for step in range(metric_steps)
+            ][:MAX_BATCH_METRICS],
+            "tags": [{"key": "seed_source", "value": "docker-compose-demo"}],
+        }
+        code, body = await self.request(
+            "POST",
+            "/api/2.0/mlflow/runs/log-batch",
+            tenant=tenant,
+            subject=subject,
+            payload=payload,
+        )
+        if code != 200:
+            raise RuntimeError(f"Failed to log run data for {run_id}: {code} {body}")
+
+    async def create_or_get_registered_model(
+        self, tenant: str, subject: str, model_name: str
+    ) -> None:
+        payload = {
+            "name": model_name,
+            "tags": [
+                {"key": "tenant", "value": tenant},
+                {"key": "demo_seed", "value": "true"},
+            ],
         }
+        code, body = await self.request(
+            "POST",
+            "/api/2.0/mlflow/registered-models/create",
+            tenant=tenant,
+            subject=subject,
+            payload=payload,
+        )
+        if code == 200:
+            return
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as fh:
+        code, _ = await self.request(
+            "POST",
+            "/api/2.0/mlflow/registered-models/get",
+            tenant=tenant,
+            subject=subject,
+            payload={"name": model_name},
+        )
+        if code != 200:
+            raise RuntimeError(
+                f"Failed to create/get registered model {model_name}: {code} {body}"
+            )
+
+    async def create_model_version(
+        self, tenant: str, subject: str, model_name: str, source_run_id: str
+    ) -> str:
+        payload = {
+            "name": model_name,
+            "source": f"runs:/{source_run_id}/model",
+            "run_id": source_run_id,
+            "tags": [
+                {"key": "tenant", "value": tenant},
+                {"key": "demo_seed", "value": "true"},
+            ],
+        }
+        code, body = await self.request(
+            "POST",
+            "/api/2.0/mlflow/model-versions/create",
+            tenant=tenant,
+            subject=subject,
+            payload=payload,
+        )
+        if code != 200:
+            raise RuntimeError(f"Failed to create model version for {model_name}: {code} {body}")
+        version = body.get("model_version", {}).get("version")
+        if not isinstance(version, str):
+            version = str(version)
+        return version
+
+    async def seed_runs(
+        self, jobs: list[tuple[str, dict, int]], *, params: int, metric_steps: int
+    ) -> None:
+        """Create and log every ``(tenant, experiment entry, index)`` with bounded concurrency."""
+        pending = iter(jobs)
+
+        async def _worker() -> None:
+            for tenant, experiment, idx in pending:
+                subject = f"{tenant}-seed"
+                run_id = await self.create_run(tenant, subject, experiment["experiment_id"], idx)
+                await self.log_run_data(
+                    tenant, subject, run_id, idx, params=params, metric_steps=metric_steps
+                )
+                experiment["run_ids"].append(run_id)
+                self.runs += 1
+
+        workers = [asyncio.create_task(_worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+
+async def _report_progress(seeder: Seeder, total_runs: int, started: float, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        elapsed = time.perf_counter() - started
+        print(
+            f"  {seeder.runs}/{total_runs} runs, {seeder.writes} writes, "
+            f"{seeder.writes / elapsed:.1f} writes/s",
+            flush=True,
+        )
+
+
+async def seed(args: argparse.Namespace, client: GatewayClient) -> dict:
+    seeder = Seeder(client, args.concurrency)
+    tenants = tenant_names(args.tenants)
+    started = time.perf_counter()
+    out: dict[str, dict] = {}
+    try:
+        for tenant in tenants:
+            subject = f"{tenant}-seed"
+            names = [_numbered(f"demo-{tenant}-exp", j) for j in range(args.experiments)]
+            experiment_ids = await asyncio.gather(
+                *(seeder.create_or_get_experiment(tenant, subject, name) for name in names)
+            )
+            out[tenant] = {
+                "experiments": [
+                    {"experiment_name": name, "experiment_id": experiment_id, "run_ids": []}
+                    for name, experiment_id in zip(names, experiment_ids)
+                ],
+                "models": [],
+            }
+
+        # Runs are interleaved across tenants and experiments so a partial run still
+        # leaves every experiment populated.
+        jobs = [
+            (tenant, experiment, idx)
+            for idx in range(1, args.runs + 1)
+            for tenant in tenants
+            for experiment in out[tenant]["experiments"]
+        ]
+        progress = asyncio.create_task(
+            _report_progress(seeder, len(jobs), started, args.progress_interval)
+        )
+        try:
+            await seeder.seed_runs(jobs, params=args.params, metric_steps=args.metric_steps)
+        finally:
+            progress.cancel()
+
+        for tenant in tenants:
+            subject = f"{tenant}-seed"
+            first_runs = out[tenant]["experiments"][0]["run_ids"]
+            for j in range(args.models):
+                model_name = _numbered(f"demo-{tenant}-model", j)
+                await seeder.create_or_get_registered_model(tenant, subject, model_name)
+                model_version = None
+                if first_runs:
+                    source_run = first_runs[j % len(first_runs)]
+                    model_version = await seeder.create_model_version(
+                        tenant, subject, model_name, source_run
+                    )
+                out[tenant]["models"].append({"name": model_name, "version": model_version})
+    finally:
+        seeder.close()
+    elapsed = time.perf_counter() - started
+
+    for tenant in tenants:
+        entry = out[tenant]
+        first = entry["experiments"][0]
+        # The original demo layout, which smoke_test.sh and the docs read.
+        entry.update(
+            experiment_name=first["experiment_name"],
+            experiment_id=first["experiment_id"],
+            run_ids=first["run_ids"],
+        )
+        if entry["models"]:
+            entry.update(
+                model_name=entry["models"][0]["name"],
+                model_version=entry["models"][0]["version"],
+            )
+    out["_meta"] = {
+        "gateway_url": args.gateway_url,
+        "tenants": args.tenants,
+        "experiments_per_tenant": args.experiments,
+        "runs_per_experiment": args.runs,
+        "params_per_run": args.params,
+        "metric_steps_per_run": args.metric_steps,
+        "models_per_tenant": args.models,
+        "runs": seeder.runs,
+        "writes": seeder.writes,
+        "seconds": round(elapsed, 3),
+        "writes_per_second": round(seeder.writes / elapsed, 1) if elapsed else None,
+        "runs_per_second": round(seeder.runs / elapsed, 1) if elapsed else None,
+    }
+    return out
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gateway-url", default=GATEWAY_URL)
+    parser.add_argument("--output", default=OUTPUT_PATH, help="Manifest path")
+    parser.add_argument("--tenants", type=int, default=2)
+    parser.add_argument("--experiments", type=int, default=1, help="Per tenant")
+    parser.add_argument("--runs", type=int, default=2, help="Per experiment")
+    parser.add_argument("--params", type=int, default=2, help="Per run (at least 2)")
+    parser.add_argument("--metric-steps", type=int, default=1, help="Accuracy points per run")
+    parser.add_argument("--models", type=int, default=1, help="Registered models per tenant")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--progress-interval", type=float, default=5.0)
+    parser.add_argument("--quiet", action="store_true", help="Do not print the manifest")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.tenants < 1 or args.experiments < 1 or args.runs < 0 or args.concurrency < 1:
+        raise SystemExit("--tenants, --experiments and --concurrency must be positive")
+    args.gateway_url = args.gateway_url.rstrip("/")
+    client = GatewayClient(args.gateway_url, timeout=args.timeout)
+
+    print(f"Seeding demo data through gateway: {args.gateway_url}")
+    wait_for_gateway_ready(client)
+    out = asyncio.run(seed(args, client))
+
+    with open(args.output, "w", encoding="utf-8") as fh:
         json.dump(out, fh, indent=2)
 
-    print(f"Seed complete. Output written to {OUTPUT_PATH}")
-    print(json.dumps(out, indent=2))
+    meta = out["_meta"]
+    print(
+        f"Seed complete: {meta['runs']} runs, {meta['writes']} writes in {meta['seconds']}s "
+        f"({meta['writes_per_second']} writes/s, {meta['runs_per_second']} runs/s). "
+        f"Output written to {args.output}",
+        file=sys.stderr if args.quiet else sys.stdout,
+    )
+    if not args.quiet:
+        print(json.dumps(out, indent=2))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import sys
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from typing import IO, Any
 
 
 audit_logger = logging.getLogger("gateway.audit")
@@ -19,6 +23,7 @@ def log_audit_event(
     upstream: str,
     decision: str,
     reason: str | None = None,
+    duration_ms: float | None = None,
 ) -> None:
     event = {
         "schema_version": "1",
@@ -34,4 +39,53 @@ def log_audit_event(
     }
     if reason:
         event["reason"] = reason
+    if duration_ms is not None:
+        event["duration_ms"] = round(duration_ms, 3)
     audit_logger.info(json.dumps(event, separators=(",", ":")))
+
+
+def log_usage_event(
+    tenant: str, window_start: datetime, window_end: datetime, usage: dict[str, Any]
+) -> None:
+    """Per-tenant usage summary for ``[window_start, window_end)``, written to the audit log."""
+    event = {
+        "schema_version": "1",
+        "event_type": "usage",
+        "timestamp": datetime.now(UTC).isoformat(),
+        "tenant": tenant,
+        "window_start": window_start.isoformat(),
+        "window_end": window_end.isoformat(),
+        **usage,
+    }
+    audit_logger.info(json.dumps(event, separators=(",", ":")))
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_decoder = json.JSONDecoder()
+
+
+def _open_audit_log(path: str) -> IO[bytes]:
+    raw = sys.stdin.buffer if path == "-" else open(path, "rb")
+    if raw.peek(2)[:2] == _GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=raw)
+    return raw
+
+
+def iter_audit_events(path: str) -> Iterator[dict[str, Any]]:
+    """Yield audit events from an NDJSON audit log, plain or gzip-compressed.
+
+    Lines may carry a logging prefix (timestamp, level, logger name) before the
+    JSON object. Lines without an audit event are skipped. ``-`` reads stdin.
+    """
+    with _open_audit_log(path) as handle:
+        for raw_line in handle:
+            line = raw_line.decode("utf-8", errors="replace")
+            start = line.find("{")
+            if start < 0:
+                continue
+            try:
+                event, _ = _decoder.raw_decode(line, start)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and "schema_version" in event and "path" in event:
+                yield event
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+"""Tag legacy MLflow resources with their tenant so the gateway can authorize them.
+
+Resources created before the gateway was adopted lack the tenant tag
+(``GW_TENANT_TAG_KEY``), so every ownership check on them is denied. The
+backfill talks to MLflow directly and, following a mapping file:
+
+- tags experiments (by ID, name, or name prefix),
+- tags the runs of every mapped experiment with the experiment's tenant (``runs/log-batch``),
+- tags registered models (by name prefix) and their model versions (``set-tag``).
+
+Resources that already carry a tenant tag are never rewritten; a tag that
+disagrees with the mapping is reported as a conflict. Progress is written to a
+checkpoint file after every page, so an interrupted backfill resumes where it
+stopped.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from gateway.mlflow.filters import Comparison, Value, render_filter
+from gateway.mlflow.tenant import (
+    extract_tenant_tag_from_experiment_response,
+    extract_tenant_tag_from_model_version_response,
+    extract_tenant_tag_from_registered_model_response,
+    extract_tenant_tag_from_run_response,
+)
+
+
+PAGE_SIZE = 1000
+OUTCOMES = ("tagged", "already_tagged", "unmapped", "conflict", "failed")
+
+
+class BackfillError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class TenantMapping:
+    """Rules assigning legacy resources to tenants.
+
+    ``experiments`` maps experiment IDs or names to tenants. ``name_prefixes``
+    maps experiment and registered model name prefixes to tenants; the longest
+    matching prefix wins.
+    """
+
+    experiments: dict[str, str] = field(default_factory=dict)
+    name_prefixes: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> TenantMapping:
+        if not isinstance(raw, dict):
+            raise BackfillError("Mapping must be a JSON object")
+        sections: dict[str, dict[str, str]] = {}
+        for section in ("experiments", "name_prefixes"):
+            value = raw.get(section, {})
+            if not isinstance(value, dict) or not all(
+                isinstance(key, str) and isinstance(tenant, str) and tenant.strip()
+                for key, tenant in value.items()
+            ):
+                raise BackfillError(f"Mapping '{section}' must map strings to tenant names")
+            sections[section] = {key: tenant.strip() for key, tenant in value.items()}
+        if not sections["experiments"] and not sections["name_prefixes"]:
+            raise BackfillError("Mapping has no 'experiments' or 'name_prefixes' rules")
+        prefixes = sorted(
+            sections["name_prefixes"].items(), key=lambda item: len(item[0]), reverse=True
+        )
+        return cls(experiments=sections["experiments"], name_prefixes=tuple(prefixes))
+
+    @classmethod
+    def load(cls, path: str) -> TenantMapping:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                raw = json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise BackfillError(f"Unable to read mapping file {path}: {exc}") from exc
+        return cls.from_dict(raw)
+
+    def tenant_for_name(self, name: str) -> str | None:
+        for prefix, tenant in self.name_prefixes:
+            if name.startswith(prefix):
+                return tenant
+        return None
+
+    def tenant_for_experiment(self, experiment_id: str, name: str) -> str | None:
+        tenant = self.experiments.get(experiment_id) or self.experiments.get(name)
+        return tenant or self.tenant_for_name(name)
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` requests per second (``0`` disables the limit)."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self.rate)
+
+
+class Checkpoint:
+    """Resume state: the next page token per listing, and listings already finished.
+
+    Listings are keyed ``runs:<experiment_id>``, ``registered_models`` and
+    ``model_versions:<model name>``. The file is replaced atomically on save.
+    """
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._cursors: dict[str, str] = {}
+        self._done: set[str] = set()
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    state = json.load(handle)
+                self._cursors = dict(state.get("cursors", {}))
+                self._done = set(state.get("done", []))
+            except (OSError, ValueError, AttributeError, TypeError) as exc:
+                raise BackfillError(f"Unable to read checkpoint {path}: {exc}") from exc
+
+    def is_done(self, key: str) -> bool:
+        return key in self._done
+
+    def cursor(self, key: str) -> str | None:
+        return self._cursors.get(key)
+
+    def advance(self, key: str, page_token: str | None) -> None:
+        if page_token:
+            self._cursors[key] = page_token
+        else:
+            self._cursors.pop(key, None)
+            self._done.add(key)
+        self.save()
+
+    def forget(self, keys: Iterable[str]) -> None:
+        self._done.difference_update(keys)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump({"cursors": self._cursors, "done": sorted(self._done)}, handle)
+        os.replace(temporary, self.path)
+
+
+class BackfillStats:
+    """Per-resource outcome counters with throughput since start."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.started = clock()
+        self.counts: dict[str, Counter[str]] = {}
+
+    def record(self, kind: str, outcome: str) -> None:
+        self.counts.setdefault(kind, Counter())[outcome] += 1
+
+    @property
+    def scanned(self) -> int:
+        return sum(sum(counter.values()) for counter in self.counts.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(counter["failed"] for counter in self.counts.values())
+
+    def throughput(self) -> float:
+        elapsed = self._clock() - self.started
+        return self.scanned / elapsed if elapsed > 0 else 0.0
+
+    def progress_line(self) -> str:
+        parts = []
+        for kind, counter in self.counts.items():
+            detail = " ".join(f"{outcome}={counter[outcome]}" for outcome in OUTCOMES)
+            parts.append(f"{kind}: {detail}")
+        return f"{'; '.join(parts)} ({self.throughput():.1f} resources/s)"
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "elapsed_seconds": round(self._clock() - self.started, 3),
+            "scanned": self.scanned,
+            "resources_per_second": round(self.throughput(), 1),
+            **{
+                kind: {outcome: counter[outcome] for outcome in OUTCOMES}
+                for kind, counter in self.counts.items()
+            },
+        }
+
+
+def _name_equals_filter(name: str) -> str:
+    return render_filter(Comparison(None, "name", "=", Value("string", name)))
+
+
+class Backfill:
+    """Page through an MLflow server and tag resources according to a ``TenantMapping``."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        mapping: TenantMapping,
+        *,
+        tenant_tag_key: str = "tenant",
+        concurrency: int = 8,
+        rate_limiter: RateLimiter | None = None,
+        checkpoint: Checkpoint | None = None,
+        dry_run: bool = False,
+        report: Callable[[str], None] | None = None,
+        progress_interval_seconds: float = 5.0,
+    ):
+        self.client = client
+        self.mapping = mapping
+        self.tenant_tag_key = tenant_tag_key
+        self.rate_limiter = rate_limiter or RateLimiter(0)
+        self.checkpoint = checkpoint or Checkpoint(None)
+        self.dry_run = dry_run
+        self.report = report
+        self.progress_interval_seconds = progress_interval_seconds
+        self.stats = BackfillStats()
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._last_report = self.stats.started
+
+    async def run(self) -> BackfillStats:
+        experiment_tenants = await self._backfill_experiments()
+        for experiment_id, tenant in experiment_tenants.items():
+            await self._backfill_runs(experiment_id, tenant)
+        await self._backfill_registered_models()
+        self._maybe_report(force=True)
+        return self.stats
+
+    async def _call(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        await self.rate_limiter.acquire()
+        return await self.client.request(method, path, **kwargs)
+
+    async def _read(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        try:
+            response = await self._call(method, path, **kwargs)
+        except httpx.HTTPError as exc:
+            raise BackfillError(f"{method} {path} failed: {exc}") from exc
+        if response.status_code != 200:
+            raise BackfillError(f"{method} {path} returned {response.status_code}")
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise BackfillError(f"{method} {path} returned invalid JSON") from exc
+
+    async def _write(self, kind: str, path: str, payload: dict[str, Any]) -> None:
+        if self.dry_run:
+            self.stats.record(kind, "tagged")
+            return
+        async with self._semaphore:
+            try:
+                response = await self._call("POST", path, json=payload)
+            except httpx.HTTPError:
+                self.stats.record(kind, "failed")
+                return
+        self.stats.record(kind, "tagged" if response.status_code == 200 else "failed")
+
+    def _classify(self, kind: str, current: str | None, wanted: str | None) -> bool:
+        """Record the outcome for a resource that needs no write; ``True`` if it needs one."""
+        if wanted is None:
+            self.stats.record(kind, "already_tagged" if current is not None else "unmapped")
+            return False
+        if current is None:
+            return True
+        self.stats.record(kind, "already_tagged" if current == wanted else "conflict")
+        return False
+
+    def _maybe_report(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if self.report is None or (
+            not force and now - self._last_report < self.progress_interval_seconds
+        ):
+            return
+        self._last_report = now
+        self.report(self.stats.progress_line())
+
+    def _tag(self, value: str) -> dict[str, str]:
+        return {"key": self.tenant_tag_key, "value": value}
+
+    async def _backfill_experiments(self) -> dict[str, str]:
+        """Tag experiments and return the tenant of every experiment whose runs get tagged.
+
+        Experiments are always re-listed, also on resume, because run tenants derive from them.
+        """
+        experiment_tenants: dict[str, str] = {}
+        page_token: str | None = None
+        while True:
+            payload: dict[str, Any] = {"max_results": PAGE_SIZE, "view_type": "ALL"}
+            if page_token:
+                payload["page_token"] = page_token
+            page = await self._read("POST", "/api/2.0/mlflow/experiments/search", json=payload)
+            writes = []
+            for experiment in page.get("experiments", []):
+                experiment_id = str(experiment.get("experiment_id", ""))
+                current = extract_tenant_tag_from_experiment_response(
+                    {"experiment": experiment}, self.tenant_tag_key
+                )
+                wanted = self.mapping.tenant_for_experiment(
+                    experiment_id, str(experiment.get("name", ""))
+                )
+                owner = current or wanted
+                if owner is not None:
+                    experiment_tenants[experiment_id] = owner
+                if self._classify("experiments", current, wanted):
+                    writes.append(
+                        self._write(
+                            "experiments",
+                            "/api/2.0/mlflow/experiments/set-experiment-tag",
+                            {"experiment_id": experiment_id, **self._tag(wanted)},
+                        )
+                    )
+            await asyncio.gather(*writes)
+            self._maybe_report()
+            page_token = page.get("next_page_token")
+            if not page_token:
+                return experiment_tenants
+
+    async def _backfill_runs(self, experiment_id: str, tenant: str) -> None:
+        key = f"runs:{experiment_id}"
+        if self.checkpoint.is_done(key):
+            return
+        page_token = self.checkpoint.cursor(key)
+        while True:
+            payload: dict[str, Any] = {
+                "experiment_ids": [experiment_id],
+                "max_results": PAGE_SIZE,
+                "run_view_type": "ALL",
+            }
+            if page_token:
+                payload["page_token"] = page_token
+            page = await self._read("POST", "/api/2.0/mlflow/runs/search", json=payload)
+            writes = []
+            for run in page.get("runs", []):
+                current = extract_tenant_tag_from_run_response({"run": run}, self.tenant_tag_key)
+                if self._classify("runs", current, tenant):
+                    run_id = (run.get("info") or {}).get("run_id")
+                    writes.append(
+                        self._write(
+                            "runs",
+                            "/api/2.0/mlflow/runs/log-batch",
+                            {"run_id": run_id, "tags": [self._tag(tenant)]},
+                        )
+                    )
+            await asyncio.gather(*writes)
+            page_token = page.get("next_page_token")
+            self.checkpoint.advance(key, page_token)
+            self._maybe_report()
+            if not page_token:
+                return
+
+    async def _backfill_registered_models(self) -> None:
+        key = "registered_models"
+        if self.checkpoint.is_done(key):
+            return
+        page_token = self.checkpoint.cursor(key)
+        while True:
+            payload: dict[str, Any] = {"max_results": PAGE_SIZE}
+            if page_token:
+                payload["page_token"] = page_token
+            page = await self._read(
+                "GET", "/api/2.0/mlflow/registered-models/search", params=payload
+            )
+            models = page.get("registered_models", [])
+            writes = []
+            owners: dict[str, str] = {}
+            for model in models:
+                name = str(model.get("name", ""))
+                current = extract_tenant_tag_from_registered_model_response(
+                    {"registered_model": model}, self.tenant_tag_key
+                )
+                wanted = self.mapping.tenant_for_name(name)
+                if current or wanted:
+                    owners[name] = current or wanted
+                if self._classify("registered_models", current, wanted):
+                    writes.append(
+                        self._write(
+                            "registered_models",
+                            "/api/2.0/mlflow/registered-models/set-tag",
+                            {"name": name, **self._tag(wanted)},
+                        )
+                    )
+            await asyncio.gather(*writes)
+            for name, tenant in owners.items():
+                await self._backfill_model_versions(name, tenant)
+            page_token = page.get("next_page_token")
+            # Version listings of this page are finished once the model cursor moves past it.
+            self.checkpoint.forget(f"model_versions:{name}" for name in owners)
+            self.checkpoint.advance(key, page_token)
+            self._maybe_report()
+            if not page_token:
+                return
+
+    async def _backfill_model_versions(self, model_name: str, tenant: str) -> None:
+        key = f"model_versions:{model_name}"
+        if self.checkpoint.is_done(key):
+            return
+        page_token = self.checkpoint.cursor(key)
+        while True:
+            params: dict[str, Any] = {
+                "filter": _name_equals_filter(model_name),
+                "max_results": PAGE_SIZE,
+            }
+            if page_token:
+                params["page_token"] = page_token
+            page = await self._read("GET", "/api/2.0/mlflow/model-versions/search", params=params)
+            writes = []
+            for version in page.get("model_versions", []):
+                current = extract_tenant_tag_from_model_version_response(
+                    {"model_version": version}, self.tenant_tag_key
+                )
+                if self._classify("model_versions", current, tenant):
+                    writes.append(
+                        self._write(
+                            "model_versions",
+                            "/api/2.0/mlflow/model-versions/set-tag",
+                            {
+                                "name": model_name,
+                                "version": str(version.get("version", "")),
+                                **self._tag(tenant),
+                            },
+                        )
+                    )
+            await asyncio.gather(*writes)
+            page_token = page.get("next_page_token")
+            self.checkpoint.advance(key, page_token)
+            if not page_token:
+                return
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+"""Parsing and sub-request construction for the ``/gateway/v1/batch`` endpoint."""
+
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+
+BATCH_PATH = "/gateway/v1/batch"
+BATCH_METHODS = frozenset({"GET", "POST", "PATCH", "DELETE"})
+# Artifact routes (``mlflow-artifacts``) are streamed and therefore not batchable.
+MLFLOW_API_PREFIXES = ("/api/2.0/mlflow/", "/api/2.1/mlflow/")
+
+
+class BatchRequestError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    method: str
+    path: str
+    query: list[tuple[str, str]]
+    body: bytes
+
+
+def _parse_query(raw: Any, index: int) -> list[tuple[str, str]]:
+    if raw is None:
+        return []
+    if not isinstance(raw, dict):
+        raise BatchRequestError(f"requests[{index}].query must be an object")
+    query: list[tuple[str, str]] = []
+    for key, value in raw.items():
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if isinstance(item, bool):
+                item = "true" if item else "false"
+            if not isinstance(item, (str, int, float)):
+                raise BatchRequestError(f"requests[{index}].query.{key} must be a scalar or list")
+            query.append((key, str(item)))
+    return query
+
+
+def _parse_item(raw: Any, index: int) -> BatchItem:
+    if not isinstance(raw, dict):
+        raise BatchRequestError(f"requests[{index}] must be an object")
+
+    method = raw.get("method")
+    if not isinstance(method, str) or method.upper() not in BATCH_METHODS:
+        raise BatchRequestError(
+            f"requests[{index}].method must be one of {', '.join(sorted(BATCH_METHODS))}"
+        )
+
+    path = raw.get("path")
+    if not isinstance(path, str) or not path.startswith(MLFLOW_API_PREFIXES):
+        raise BatchRequestError(f"requests[{index}].path must be an MLflow REST API path")
+    if "?" in path or "#" in path:
+        raise BatchRequestError(f"requests[{index}].path must not contain a query string")
+    if ".." in path.split("/"):
+        raise BatchRequestError(f"requests[{index}].path must not contain '..' segments")
+
+    body = raw.get("body")
+    if body is not None and not isinstance(body, dict):
+        raise BatchRequestError(f"requests[{index}].body must be an object")
+
+    return BatchItem(
+        method=method.upper(),
+        path=path,
+        query=_parse_query(raw.get("query"), index),
+        body=json.dumps(body).encode() if body is not None else b"",
+    )
+
+
+def parse_batch_payload(payload: dict[str, Any], max_requests: int) -> list[BatchItem]:
+    """Validate a batch payload ``{"requests": [{"method", "path", "query", "body"}, ...]}``."""
+    raw_items = payload.get("requests")
+    if not isinstance(raw_items, list) or not raw_items:
+        raise BatchRequestError("requests must be a non-empty list")
+    if len(raw_items) > max_requests:
+        raise BatchRequestError(f"Batch exceeds {max_requests} requests")
+    return [_parse_item(raw, index) for index, raw in enumerate(raw_items)]
+
+
+# Headers describing the batch body itself; each sub-request gets its own.
+_BATCH_BODY_HEADERS = frozenset(
+    {
+        b"content-length",
+        b"content-type",
+        b"content-encoding",
+        b"transfer-encoding",
+        b"accept-encoding",
+    }
+)
+
+
+def sub_request_scope(
+    parent_scope: dict[str, Any], item: BatchItem, state: dict[str, Any]
+) -> dict[str, Any]:
+    """Build an ASGI HTTP scope for ``item`` that inherits the batch request's credentials."""
+    headers = [
+        (name, value) for name, value in parent_scope["headers"] if name not in _BATCH_BODY_HEADERS
+    ]
+    headers.append((b"accept-encoding", b"identity"))
+    if item.body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(item.body)).encode()))
+    query_string = urlencode(item.query).encode()
+    return {
+        **parent_scope,
+        "method": item.method,
+        "path": item.path,
+        "raw_path": item.path.encode(),
+        "query_string": query_string,
+        "headers": headers,
+        "state": state,
+    }
+
+
+def body_receiver(body: bytes) -> Callable[[], Awaitable[dict[str, Any]]]:
+    """ASGI ``receive`` callable delivering ``body`` as a single message."""
+    sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return receive
+
+
+def decode_sub_response_body(body: bytes, content_type: str | None) -> Any:
+    """Return JSON sub-response bodies as objects and anything else as text."""
+    if not body:
+        return None
+    if content_type and "json" in content_type:
+        try:
+            return json.loads(body)
+        except ValueError:
+            pass
+    return body.decode("utf-8", errors="replace")
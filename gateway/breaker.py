@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"Circuit for upstream {upstream} is open")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+@dataclass
+class CircuitCall:
+    """Outcome of one guarded upstream call; set ``failed`` for error responses."""
+
+    trial: bool
+    failed: bool = False
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one upstream endpoint.
+
+    While closed, outcomes from the last ``window_seconds`` are kept; once at
+    least ``minimum_calls`` were made, the circuit opens when the failure rate
+    or the rate of calls slower than ``slow_call_ms`` reaches its threshold.
+    After ``open_seconds`` it lets ``half_open_max_calls`` trial calls through:
+    if they all succeed the circuit closes, any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_seconds: float = 30.0,
+        minimum_calls: int = 20,
+        failure_rate_threshold: float = 0.5,
+        slow_call_ms: float = 0.0,
+        slow_call_rate_threshold: float = 1.0,
+        open_seconds: float = 10.0,
+        half_open_max_calls: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.minimum_calls = max(1, minimum_calls)
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_ms = slow_call_ms
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+        self.state = CLOSED
+        self._window: deque[tuple[float, bool, bool]] = deque()
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._trials_in_flight = 0
+        self._trial_successes = 0
+
+    def _acquire(self) -> CircuitCall:
+        now = self._clock()
+        if self.state == OPEN:
+            remaining = self._opened_at + self.open_seconds - now
+            if remaining > 0:
+                raise CircuitOpenError(self.name, remaining)
+            self.state = HALF_OPEN
+            self._trials_in_flight = 0
+            self._trial_successes = 0
+            logger.warning("Circuit for upstream %s is half-open; sending trial calls", self.name)
+        if self.state == HALF_OPEN:
+            if self._trials_in_flight >= self.half_open_max_calls:
+                raise CircuitOpenError(self.name, self.open_seconds)
+            self._trials_in_flight += 1
+            return CircuitCall(trial=True)
+        return CircuitCall(trial=False)
+
+    def _record(self, call: CircuitCall, failed: bool, duration_ms: float) -> None:
+        slow = bool(self.slow_call_ms) and duration_ms > self.slow_call_ms
+        if call.trial:
+            self._trials_in_flight = max(0, self._trials_in_flight - 1)
+            if self.state != HALF_OPEN:
+                return
+            if failed or slow:
+                self._open()
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_max_calls:
+                logger.warning("Circuit for upstream %s closed after successful trials", self.name)
+                self.state = CLOSED
+            return
+        if self.state != CLOSED:
+            return
+
+        now = self._clock()
+        self._window.append((now, failed, slow))
+        self._failures += failed
+        self._slow += slow
+        cutoff = now - self.window_seconds
+        while self._window and self._window[0][0] < cutoff:
+            _, old_failed, old_slow = self._window.popleft()
+            self._failures -= old_failed
+            self._slow -= old_slow
+        calls = len(self._window)
+        if calls < self.minimum_calls:
+            return
+        if (
+            self._failures / calls >= self.failure_rate_threshold
+            or (self.slow_call_ms and self._slow / calls >= self.slow_call_rate_threshold)
+        ):
+            self._open()
+
+    def _release(self, call: CircuitCall) -> None:
+        if call.trial:
+            self._trials_in_flight = max(0, self._trials_in_flight - 1)
+
+    def _open(self) -> None:
+        logger.warning("Opening circuit for upstream %s", self.name)
+        self.state = OPEN
+        self._opened_at = self._clock()
+        self._window.clear()
+        self._failures = 0
+        self._slow = 0
+
+    @contextmanager
+    def guard(
+        self, failures: tuple[type[BaseException], ...] = (Exception,)
+    ) -> Iterator[CircuitCall]:
+        """Guard one upstream call; raises ``CircuitOpenError`` when it may not be sent.
+
+        Exceptions of the ``failures`` types raised inside the block count as
+        failures. Any other exception (a client disconnect, a rejected request
+        body) says nothing about the upstream and releases the call unrecorded.
+        """
+        call = self._acquire()
+        started = self._clock()
+        try:
+            yield call
+        except failures:
+            self._record(call, True, (self._clock() - started) * 1000)
+            raise
+        except BaseException:
+            self._release(call)
+            raise
+        self._record(call, call.failed, (self._clock() - started) * 1000)
+
+
+class CircuitBreakerRegistry:
+    """One lazily created breaker per upstream base URL."""
+
+    def __init__(self, factory: Callable[[str], CircuitBreaker]):
+        self._factory = factory
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, upstream: str) -> CircuitBreaker:
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            breaker = self._breakers[upstream] = self._factory(upstream)
+        return breaker
+
+    def clear(self) -> None:
+        self._breakers.clear()
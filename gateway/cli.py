@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+"""``mlflow-gateway`` command line tools.
+
+Usage::
+
+    mlflow-gateway backfill --mapping tenants.json --checkpoint backfill.json
+    mlflow-gateway audit-stats audit.log.gz --group-by tenant,route --bucket 1h
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+
+import httpx
+
+from gateway.audit import iter_audit_events
+from gateway.audit_stats import (
+    GROUP_BY_FIELDS,
+    AuditStats,
+    AuditStatsError,
+    parse_bucket,
+    parse_time,
+)
+from gateway.backfill import Backfill, BackfillError, Checkpoint, RateLimiter, TenantMapping
+from gateway.config import settings
+
+
+def _mlflow_auth_headers() -> dict[str, str]:
+    # Same environment variables as the MLflow client.
+    token = os.getenv("MLFLOW_TRACKING_TOKEN")
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def _mlflow_basic_auth() -> tuple[str, str] | None:
+    username = os.getenv("MLFLOW_TRACKING_USERNAME")
+    password = os.getenv("MLFLOW_TRACKING_PASSWORD")
+    return (username, password) if username and password else None
+
+
+async def _run_backfill(args: argparse.Namespace) -> int:
+    mapping = TenantMapping.load(args.mapping)
+    limits = httpx.Limits(max_connections=max(1, args.concurrency) + 1)
+    async with httpx.AsyncClient(
+        base_url=args.mlflow_url.rstrip("/"),
+        headers=_mlflow_auth_headers(),
+        auth=_mlflow_basic_auth(),
+        limits=limits,
+        timeout=args.timeout,
+    ) as client:
+        backfill = Backfill(
+            client,
+            mapping,
+            tenant_tag_key=args.tenant_tag_key,
+            concurrency=args.concurrency,
+            rate_limiter=RateLimiter(args.rate_limit),
+            checkpoint=Checkpoint(args.checkpoint),
+            dry_run=args.dry_run,
+            report=lambda line: print(line, file=sys.stderr, flush=True),
+            progress_interval_seconds=args.progress_interval,
+        )
+        stats = await backfill.run()
+    print(json.dumps(stats.summary(), indent=2))
+    return 1 if stats.failed else 0
+
+
+def _backfill(args: argparse.Namespace) -> int:
+    try:
+        return asyncio.run(_run_backfill(args))
+    except BackfillError as exc:
+        print(f"backfill: {exc}", file=sys.stderr)
+        if args.checkpoint:
+            print(f"backfill: rerun with --checkpoint {args.checkpoint} to resume", file=sys.stderr)
+        return 2
+
+
+def _format_cell(value: object) -> str:
+    return "-" if value is None else str(value)
+
+
+def _print_stats_table(rows: list[dict], out) -> None:
+    columns = list(rows[0])
+    widths = [
+        max(len(column), *(len(_format_cell(row[column])) for row in rows)) for column in columns
+    ]
+    numeric = [isinstance(rows[-1][column], (int, float)) for column in columns]
+    print(
+        "  ".join(
+            column.rjust(width) if is_numeric else column.ljust(width)
+            for column, width, is_numeric in zip(columns, widths, numeric)
+        ),
+        file=out,
+    )
+    for row in rows:
+        print(
+            "  ".join(
+                _format_cell(row[column]).rjust(width)
+                if isinstance(row[column], (int, float))
+                else _format_cell(row[column]).ljust(width)
+                for column, width in zip(columns, widths)
+            ),
+            file=out,
+        )
+
+
+def _audit_stats(args: argparse.Namespace) -> int:
+    group_by = [field.strip() for field in args.group_by.split(",") if field.strip()]
+    if args.bucket and "bucket" not in group_by:
+        group_by.append("bucket")
+    try:
+        stats = AuditStats(
+            group_by,
+            bucket_seconds=parse_bucket(args.bucket) if args.bucket else None,
+            tenants=args.tenant,
+            routes=args.route,
+            since=parse_time(args.since) if args.since else None,
+            until=parse_time(args.until) if args.until else None,
+        )
+        for path in args.files:
+            stats.consume(iter_audit_events(path))
+    except (AuditStatsError, OSError) as exc:
+        print(f"audit-stats: {exc}", file=sys.stderr)
+        return 2
+
+    rows = stats.rows()
+    total = {**dict.fromkeys(stats.group_by, "total" if stats.group_by else None), **stats.total()}
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            summary = {"events": stats.events, "matched": stats.matched}
+            print(json.dumps({**summary, "total": total, "groups": rows}, indent=2), file=out)
+        elif args.format == "csv":
+            writer = csv.DictWriter(out, fieldnames=list(total))
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            _print_stats_table([*rows, total] if stats.group_by else [total], out)
+    finally:
+        if args.output:
+            out.close()
+    print(f"audit-stats: {stats.matched} of {stats.events} events matched", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mlflow-gateway")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backfill = commands.add_parser(
+        "backfill",
+        help="Tag existing MLflow experiments, runs, registered models and versions with tenants",
+        description=(
+            "Talks to MLflow directly (not through the gateway). Resources that already carry "
+            "the tenant tag are left untouched."
+        ),
+    )
+    backfill.add_argument(
+        "--mapping",
+        required=True,
+        help=(
+            'JSON file: {"experiments": {"<id or name>": "<tenant>"}, '
+            '"name_prefixes": {"<prefix>": "<tenant>"}}'
+        ),
+    )
+    backfill.add_argument("--mlflow-url", default=settings.target_base_url)
+    backfill.add_argument("--tenant-tag-key", default=settings.tenant_tag_key)
+    backfill.add_argument("--concurrency", type=int, default=8, help="Concurrent tag writes")
+    backfill.add_argument(
+        "--rate-limit", type=float, default=50.0, help="MLflow requests per second (0: unlimited)"
+    )
+    backfill.add_argument("--checkpoint", help="Resume state file, updated after every page")
+    backfill.add_argument("--dry-run", action="store_true", help="Report without writing tags")
+    backfill.add_argument("--progress-interval", type=float, default=5.0, help="Seconds")
+    backfill.add_argument("--timeout", type=float, default=30.0, help="Per-request seconds")
+    backfill.set_defaults(handler=_backfill)
+
+    audit_stats = commands.add_parser(
+        "audit-stats",
+        help="Summarize audit logs: counts, decisions, status classes and latency percentiles",
+        description=(
+            "Streams audit NDJSON (plain or gzip, '-' for stdin) in constant memory per group. "
+            "Latency comes from the duration_ms field; events without it are counted but untimed."
+        ),
+    )
+    audit_stats.add_argument("files", nargs="+", help="Audit log files")
+    audit_stats.add_argument(
+        "--group-by",
+        default="tenant,route",
+        help=f"Comma-separated subset of {', '.join(GROUP_BY_FIELDS)} (empty: totals only)",
+    )
+    audit_stats.add_argument("--bucket", help="Also group by time buckets of this width: 15m, 1h")
+    audit_stats.add_argument("--tenant", action="append", default=[], help="Only this tenant")
+    audit_stats.add_argument(
+        "--route", action="append", default=[], help="Only this route, e.g. runs/search"
+    )
+    audit_stats.add_argument("--since", help="ISO timestamp, inclusive")
+    audit_stats.add_argument("--until", help="ISO timestamp, exclusive")
+    audit_stats.add_argument("--format", choices=("table", "json", "csv"), default="table")
+    audit_stats.add_argument("--output", help="Write the summary here instead of stdout")
+    audit_stats.set_defaults(handler=_audit_stats)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,33 @@
+from typing import Literal
+
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Per route class request body limits in bytes; 0 disables the limit (streamed bodies).
+DEFAULT_REQUEST_BODY_LIMITS = {
+    "get": 64 * 1024,
+    "search": 1024 * 1024,
+    "create": 1024 * 1024,
+    "mutation": 16 * 1024 * 1024,
+    "artifact": 0,
+    "other": 4 * 1024 * 1024,
+}
+
+# Per route class upstream timeouts in seconds. ``deadline`` bounds all upstream
+# calls of one request together (preflights included). Classes not listed (and
+# missing keys) fall back to ``request_timeout_seconds``, or to
+# ``DEFAULT_REQUEST_TIMEOUT_SECONDS`` when it is unset.
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
+DEFAULT_REQUEST_TIMEOUTS = {
+    "get": {"connect": 2.0, "read": 10.0, "write": 10.0, "pool": 2.0, "deadline": 15.0},
+    "search": {"connect": 2.0, "read": 30.0, "write": 10.0, "pool": 2.0, "deadline": 30.0},
+    "create": {"connect": 2.0, "read": 15.0, "write": 15.0, "pool": 2.0, "deadline": 20.0},
+    "mutation": {"connect": 2.0, "read": 60.0, "write": 60.0, "pool": 5.0, "deadline": 90.0},
+    "artifact": {"connect": 5.0, "read": 300.0, "write": 300.0, "pool": 5.0, "deadline": 600.0},
+}
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_prefix="GW_", extra="ignore")
 
@@ -12,7 +38,50 @@ class Settings(BaseSettings):
     listen_port: int = 8000
 
     target_base_url: str = "http://mlflow:5000"
-    request_timeout_seconds: float = 30.0
+    # When set, applies to every route class instead of DEFAULT_REQUEST_TIMEOUTS, as it did
+    # before per-class defaults existed; request_timeouts still overrides it.
+    request_timeout_seconds: float | None = None
+    request_max_decompressed_bytes: int = 64 * 1024 * 1024
+    request_body_limits: dict[str, int] = Field(
+        default_factory=lambda: dict(DEFAULT_REQUEST_BODY_LIMITS)
+    )
+    request_timeouts: dict[str, dict[str, float]] = Field(default_factory=dict)
+    # Encoding of bodies sent to MLflow; anything else fails at startup, not per request.
+    upstream_request_encoding: Literal["identity", "gzip"] = "identity"
+    # Tenant sharding: pinned tenant -> backend map, then a consistent-hash pool.
+    tenant_backends: dict[str, str] = Field(default_factory=dict)
+    upstream_backends: list[str] = Field(default_factory=list)
+    # Read replicas per primary base URL; get/search traffic is balanced across them.
+    upstream_read_replicas: dict[str, list[str]] = Field(default_factory=dict)
+    read_your_writes_seconds: float = 5.0
+    # Active health checks; 0 disables the background checker.
+    health_check_interval_seconds: float = 5.0
+    health_check_timeout_seconds: float = 2.0
+    health_check_failure_threshold: int = 3
+    health_check_ejection_seconds: float = 30.0
+    health_check_max_latency_ms: float = 0.0
+    health_check_path: str = "/"
+    # Per-upstream circuit breaker on error rate and slow-call rate.
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_window_seconds: float = 30.0
+    circuit_breaker_minimum_calls: int = 20
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_ms: float = 10_000.0
+    circuit_breaker_slow_call_rate: float = 0.8
+    circuit_breaker_open_seconds: float = 10.0
+    circuit_breaker_half_open_calls: int = 3
+    # Retries and hedging for idempotent reads, bounded by a shared retry budget.
+    retry_max_attempts: int = 2
+    retry_backoff_base_ms: float = 25.0
+    retry_backoff_max_ms: float = 250.0
+    retry_budget_ratio: float = 0.2
+    retry_budget_min_per_second: float = 5.0
+    hedge_percentile: float = 0.0
+    hedge_min_samples: int = 100
+    # Per base URL: "http1" (default), "http2", or "uds:/path/to/mlflow.sock".
+    upstream_transports: dict[str, str] = Field(default_factory=dict)
+    upstream_max_connections: int = 100
+    upstream_max_keepalive_connections: int = 20
 
     auth_enabled: bool = True
     auth_mode: str = Field(
@@ -45,6 +114,27 @@ class Settings(BaseSettings):
         default=False,
         validation_alias=AliasChoices("GW_RBAC_DEFAULT_DENY", "RBAC_DEFAULT_DENY"),
     )
+    ownership_cache_ttl_seconds: float = 300.0
+    ownership_cache_max_entries: int = 100_000
+    preflight_concurrency: int = 8
+    # /gateway/v1/batch: sub-requests per batch and how many run concurrently.
+    batch_max_requests: int = 100
+    batch_concurrency: int = 16
+    search_response_verification: str = "off"
+    # model-versions/search scoping: "tag" (tenant tag on versions) or "name" (name IN the
+    # tenant's registered models, from a per-tenant name index).
+    model_versions_search_scope: str = "tag"
+    # "name" scope falls back to the tenant tag above this many names, so the inlined
+    # IN list stays within upstream request-line limits (0: no bound).
+    model_versions_search_max_names: int = 100
+    model_name_index_ttl_seconds: float = 60.0
+    model_name_index_max_tenants: int = 10_000
+    # Per-tenant usage: summary audit events every interval (0: only at shutdown), and the
+    # number of tenants tracked before the rest are accounted as "_overflow".
+    usage_flush_interval_seconds: float = 60.0
+    usage_max_tenants: int = 10_000
+    # Artifact paths are "<experiment_id>/<run_id>/..." below this prefix of the artifact root.
+    artifact_path_prefix: str = ""
     tenant_tag_key: str = Field(
         default="tenant",
         validation_alias=AliasChoices("GW_TENANT_TAG_KEY", "TENANT_TAG_KEY"),
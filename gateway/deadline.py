@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import httpx
+
+
+TIMEOUT_PHASES = ("connect", "read", "write", "pool")
+
+
+class Deadline:
+    """Overall time budget for one gateway request's upstream calls.
+
+    Preflights and the forwarded call draw from the same budget: every httpx
+    timeout phase is capped at the time remaining, so a slow preflight leaves
+    less time for the main call instead of doubling the worst case.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        phases: dict[str, float],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self.expires_at = clock() + seconds
+        self.phases = phases
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self) -> httpx.Timeout:
+        remaining = self.remaining()
+        capped = {phase: min(self.phases[phase], remaining) for phase in TIMEOUT_PHASES}
+        return httpx.Timeout(**capped)
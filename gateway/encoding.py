@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import gzip
+import zlib
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def accepts_encoding(accept_encoding: str | None, content_encoding: str) -> bool:
+    """Return whether a client ``Accept-Encoding`` header allows ``content_encoding``.
+
+    A missing header is treated conservatively as identity-only, so encoded
+    upstream bodies are decoded for clients that did not opt in.
+    """
+    if not accept_encoding:
+        return False
+    accepted = _parse_accept_encoding(accept_encoding)
+    coding = content_encoding.strip().lower()
+    if coding in accepted:
+        return accepted[coding] > 0
+    return accepted.get("*", 0.0) > 0
+
+
+class RequestBodyDecodingError(Exception):
+    pass
+
+
+class RequestBodyTooLargeError(RequestBodyDecodingError):
+    pass
+
+
+class UnsupportedContentEncodingError(RequestBodyDecodingError):
+    pass
+
+
+_REQUEST_ENCODING_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "x-gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+
+def _inflate(body: bytes, wbits: int, max_bytes: int) -> bytes:
+    output = bytearray()
+    data = body
+    while data:
+        decompressor = zlib.decompressobj(wbits)
+        while data:
+            # Bounded output per call keeps a zip bomb from inflating past the cap.
+            output += decompressor.decompress(data, max_bytes + 1 - len(output))
+            if len(output) > max_bytes:
+                raise RequestBodyTooLargeError(
+                    f"Decompressed request body exceeds {max_bytes} bytes"
+                )
+            data = decompressor.unconsumed_tail
+        if not decompressor.eof:
+            raise RequestBodyDecodingError("Truncated compressed request body")
+        # gzip allows concatenated members; anything trailing a deflate stream is invalid.
+        data = decompressor.unused_data
+        if data and wbits != _REQUEST_ENCODING_WBITS["gzip"]:
+            raise RequestBodyDecodingError("Trailing data after deflate stream")
+    return bytes(output)
+
+
+def decode_request_body(body: bytes, content_encoding: str, max_bytes: int) -> bytes:
+    """Decompress a ``gzip``/``deflate`` request body, capped at ``max_bytes`` inflated bytes."""
+    coding = content_encoding.strip().lower()
+    if coding in {"", "identity"}:
+        return body
+    wbits = _REQUEST_ENCODING_WBITS.get(coding)
+    if wbits is None:
+        raise UnsupportedContentEncodingError(f"Unsupported Content-Encoding: {content_encoding}")
+    if not body:
+        return body
+    try:
+        return _inflate(body, wbits, max_bytes)
+    except zlib.error as exc:
+        if coding == "deflate":
+            # Some clients send raw deflate without the zlib wrapper.
+            try:
+                return _inflate(body, -zlib.MAX_WBITS, max_bytes)
+            except zlib.error:
+                pass
+        raise RequestBodyDecodingError("Invalid compressed request body") from exc
+
+
+def encode_request_body(body: bytes, content_encoding: str) -> bytes:
+    coding = content_encoding.strip().lower()
+    if coding in {"", "identity"}:
+        return body
+    if coding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    raise UnsupportedContentEncodingError(f"Unsupported Content-Encoding: {content_encoding}")
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointHealth:
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    latency_ewma_ms: float | None = None
+    last_checked: float | None = None
+    last_error: str | None = None
+
+
+class UpstreamHealthChecker:
+    """Track upstream endpoint health from periodic probes.
+
+    An endpoint is ejected for ``ejection_seconds`` after ``failure_threshold``
+    consecutive failed probes and is reinstated by the next successful probe.
+    A probe fails on a transport error, a ``5xx`` status, or (when
+    ``max_latency_ms`` is set) a response slower than that.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_seconds: float,
+        failure_threshold: int,
+        ejection_seconds: float,
+        timeout_seconds: float,
+        probe_path: str = "/",
+        max_latency_ms: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval_seconds = interval_seconds
+        self.failure_threshold = max(1, failure_threshold)
+        self.ejection_seconds = ejection_seconds
+        self.timeout_seconds = timeout_seconds
+        self.probe_path = probe_path
+        self.max_latency_ms = max_latency_ms
+        self._clock = clock
+        self._endpoints: dict[str, EndpointHealth] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def state(self, base_url: str) -> EndpointHealth:
+        return self._endpoints.setdefault(base_url, EndpointHealth())
+
+    def is_available(self, base_url: str) -> bool:
+        endpoint = self._endpoints.get(base_url)
+        return endpoint is None or endpoint.ejected_until <= self._clock()
+
+    def is_fresh(self, base_urls: Iterable[str]) -> bool:
+        """Whether every endpoint was probed recently enough to answer from cached state."""
+        max_age = self.interval_seconds * 3
+        now = self._clock()
+        for base_url in base_urls:
+            endpoint = self._endpoints.get(base_url)
+            if endpoint is None or endpoint.last_checked is None:
+                return False
+            if now - endpoint.last_checked > max_age:
+                return False
+        return True
+
+    def record_success(self, base_url: str, latency_ms: float) -> None:
+        endpoint = self.state(base_url)
+        endpoint.latency_ewma_ms = (
+            latency_ms
+            if endpoint.latency_ewma_ms is None
+            else 0.7 * endpoint.latency_ewma_ms + 0.3 * latency_ms
+        )
+        endpoint.last_checked = self._clock()
+        endpoint.last_error = None
+        if endpoint.ejected_until:
+            logger.warning("Upstream %s passed health check; reinstating", base_url)
+        endpoint.consecutive_failures = 0
+        endpoint.ejected_until = 0.0
+
+    def record_failure(self, base_url: str, error: str) -> None:
+        endpoint = self.state(base_url)
+        now = self._clock()
+        endpoint.last_checked = now
+        endpoint.last_error = error
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= self.failure_threshold:
+            if endpoint.ejected_until <= now:
+                logger.warning(
+                    "Ejecting upstream %s after %d failed health checks: %s",
+                    base_url,
+                    endpoint.consecutive_failures,
+                    error,
+                )
+            endpoint.ejected_until = now + self.ejection_seconds
+
+    async def probe(self, client: httpx.AsyncClient, base_url: str) -> bool:
+        started = time.perf_counter()
+        try:
+            response = await client.get(
+                f"{base_url}{self.probe_path}", timeout=httpx.Timeout(self.timeout_seconds)
+            )
+        except httpx.HTTPError as exc:
+            self.record_failure(base_url, type(exc).__name__)
+            return False
+        latency_ms = (time.perf_counter() - started) * 1000
+        if response.status_code >= 500:
+            self.record_failure(base_url, f"status {response.status_code}")
+            return False
+        if self.max_latency_ms and latency_ms > self.max_latency_ms:
+            self.record_failure(base_url, f"latency {latency_ms:.0f}ms")
+            return False
+        self.record_success(base_url, latency_ms)
+        return True
+
+    async def probe_all(
+        self, base_urls: Iterable[str], client_for: Callable[[str], httpx.AsyncClient]
+    ) -> None:
+        urls = list(base_urls)
+        await asyncio.gather(*(self.probe(client_for(url), url) for url in urls))
+
+    def start(
+        self,
+        base_urls: Callable[[], Iterable[str]],
+        client_for: Callable[[str], httpx.AsyncClient],
+    ) -> None:
+        async def _run() -> None:
+            while True:
+                try:
+                    await self.probe_all(base_urls(), client_for)
+                except Exception:
+                    logger.exception("Upstream health check round failed")
+                await asyncio.sleep(self.interval_seconds)
+
+        self._task = asyncio.create_task(_run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def clear(self) -> None:
+        self._endpoints.clear()
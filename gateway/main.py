@@ -2,45 +2,180 @@ from __future__ import annotations
 
 """Policy Enforcement Gateway (PEP) request handling for MLflow extension layer."""
 
+import asyncio
 import json
 import logging
-from typing import Any
+import math
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
 from uuid import uuid4
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from gateway.audit import log_audit_event
+from gateway.audit import log_audit_event, log_usage_event
+from gateway.batch import (
+    BATCH_PATH,
+    BatchItem,
+    BatchRequestError,
+    body_receiver,
+    decode_sub_response_body,
+    parse_batch_payload,
+    sub_request_scope,
+)
 from gateway.auth import AuthConfig, AuthError, JWTValidator, extract_bearer_token, extract_tenant
-from gateway.config import settings
+from gateway.breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from gateway.config import (
+    DEFAULT_REQUEST_BODY_LIMITS,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_REQUEST_TIMEOUTS,
+    settings,
+)
+from gateway.deadline import TIMEOUT_PHASES, Deadline
+from gateway.encoding import (
+    RequestBodyDecodingError,
+    RequestBodyTooLargeError,
+    UnsupportedContentEncodingError,
+    accepts_encoding,
+    decode_request_body,
+    encode_request_body,
+)
+from gateway.health import UpstreamHealthChecker
 from gateway.mlflow.tenant import (
     TenantPayloadError,
+    ensure_name_filter_for_model_versions_search,
+    ensure_tenant_filter_for_experiments_search,
+    ensure_tenant_filter_for_model_versions_search,
     ensure_tenant_filter_for_search,
     ensure_tenant_filter_for_registered_models_search,
     ensure_tenant_tag_for_create,
+    extract_experiment_id_from_response,
+    extract_tenant_tag_from_experiment_response,
     extract_tenant_tag_from_model_version_response,
     extract_tenant_tag_from_registered_model_response,
     extract_tenant_tag_from_run_response,
+    is_experiment_create_path,
+    is_experiment_get_by_name_path,
+    is_experiment_get_path,
+    is_experiment_mutation_path,
+    is_experiments_search_path,
     is_model_version_create_path,
     is_model_version_get_path,
     is_model_version_mutation_path,
+    is_model_versions_search_path,
     is_registered_model_create_path,
     is_registered_model_get_path,
     is_registered_model_mutation_path,
     is_registered_models_search_path,
     is_runs_create_path,
     is_runs_get_path,
+    is_runs_metrics_history_path,
     is_runs_mutation_path,
     is_runs_search_path,
 )
-from gateway.rbac import RBACError, enforce_rbac
+from gateway.mlflow.artifacts import (
+    ArtifactPathError,
+    artifact_owner_for_path,
+    artifact_path_for_request,
+)
+from gateway.mlflow.ownership import OwnershipCache, RegisteredModelNameIndex
+from gateway.mlflow.routes import route_class_for_path
+from gateway.mlflow.verify import (
+    SearchVerificationError,
+    SearchVerificationStats,
+    verify_search_response,
+)
+from gateway.rbac import RBACError, enforce_rbac, extract_effective_role
+from gateway.retry import (
+    RETRYABLE_ERRORS,
+    LatencyTracker,
+    RetryBudget,
+    backoff_delay,
+    first_response,
+)
+from gateway.upstream import (
+    LeastOutstandingBalancer,
+    RecentWrites,
+    close_upstream_clients,
+    configured_upstream_base_urls,
+    get_upstream_client,
+    primary_upstream_base_urls,
+    read_replicas_for,
+    rebase_request,
+    sibling_replicas,
+    upstream_base_url_for_tenant,
+)
+from gateway.usage import USAGE_PATH, TenantUsage, UsageAccounting, current_usage, elapsed_us
 
 
 logging.basicConfig(level=getattr(logging, settings.log_level.upper(), logging.INFO))
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.app_name)
+T = TypeVar("T")
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.health_check_interval_seconds > 0:
+        _health_checker.start(configured_upstream_base_urls, get_upstream_client)
+    _usage.start()
+    yield
+    await _usage.stop()
+    await _health_checker.stop()
+    await close_upstream_clients()
+
+
+app = FastAPI(title=settings.app_name, lifespan=_lifespan)
+
+_ownership_cache = OwnershipCache(
+    settings.ownership_cache_max_entries, settings.ownership_cache_ttl_seconds
+)
+
+_search_verification_stats = SearchVerificationStats()
+_inflight_lookups: dict[tuple[str, ...], asyncio.Future[Any]] = {}
+_model_names = RegisteredModelNameIndex(
+    settings.model_name_index_max_tenants, settings.model_name_index_ttl_seconds
+)
+
+READ_ROUTE_CLASSES = frozenset({"get", "search"})
+WRITE_ROUTE_CLASSES = frozenset({"create", "mutation"})
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_read_balancer = LeastOutstandingBalancer()
+_recent_writes = RecentWrites(settings.read_your_writes_seconds)
+
+_circuit_breakers = CircuitBreakerRegistry(
+    lambda upstream: CircuitBreaker(
+        upstream,
+        window_seconds=settings.circuit_breaker_window_seconds,
+        minimum_calls=settings.circuit_breaker_minimum_calls,
+        failure_rate_threshold=settings.circuit_breaker_failure_rate,
+        slow_call_ms=settings.circuit_breaker_slow_call_ms,
+        slow_call_rate_threshold=settings.circuit_breaker_slow_call_rate,
+        open_seconds=settings.circuit_breaker_open_seconds,
+        half_open_max_calls=settings.circuit_breaker_half_open_calls,
+    )
+)
+
+_retry_budget = RetryBudget(settings.retry_budget_ratio, settings.retry_budget_min_per_second)
+_usage = UsageAccounting(
+    max_tenants=settings.usage_max_tenants,
+    flush_interval_seconds=settings.usage_flush_interval_seconds,
+    emit=log_usage_event,
+)
+_read_latency = LatencyTracker()
+
+_health_checker = UpstreamHealthChecker(
+    interval_seconds=settings.health_check_interval_seconds,
+    failure_threshold=settings.health_check_failure_threshold,
+    ejection_seconds=settings.health_check_ejection_seconds,
+    timeout_seconds=settings.health_check_timeout_seconds,
+    probe_path=settings.health_check_path,
+    max_latency_ms=settings.health_check_max_latency_ms,
+)
 
 _validator = JWTValidator(
     AuthConfig(
@@ -64,17 +199,29 @@ async def healthz(request: Request) -> dict[str, str]:
 
 @app.get("/readyz")
 async def readyz(request: Request) -> dict[str, str]:
-    probe_url = f"{settings.target_base_url.rstrip('/')}/"
-    request.state.audit_upstream = probe_url
-    timeout = httpx.Timeout(min(settings.request_timeout_seconds, 2.0))
+    base_urls = primary_upstream_base_urls()
+    probe_urls = [f"{base_url}{settings.health_check_path}" for base_url in base_urls]
+    request.state.audit_upstream = ",".join(probe_urls)
+    if _health_checker.is_fresh(base_urls):
+        # Answer from the background health checker instead of probing per kubelet call.
+        if not all(_health_checker.is_available(base_url) for base_url in base_urls):
+            raise HTTPException(status_code=503, detail="Upstream MLflow is unavailable")
+        _log_request_audit(request, status_code=200, upstream=request.state.audit_upstream)
+        return {"status": "ready"}
+
+    timeout = httpx.Timeout(min(_request_timeout_seconds(), 2.0))
     try:
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=False) as client:
-            probe_response = await client.get(probe_url)
+        probe_responses = await asyncio.gather(
+            *(
+                get_upstream_client(base_url).get(probe_url, timeout=timeout)
+                for base_url, probe_url in zip(base_urls, probe_urls)
+            )
+        )
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=503, detail="Upstream MLflow is unavailable") from exc
-    if probe_response.status_code == 500:
+    if any(probe_response.status_code == 500 for probe_response in probe_responses):
         raise HTTPException(status_code=503, detail="Upstream MLflow is unavailable")
-    _log_request_audit(request, status_code=200, upstream=probe_url)
+    _log_request_audit(request, status_code=200, upstream=request.state.audit_upstream)
     return {"status": "ready"}
 
 
@@ -82,6 +229,7 @@ async def readyz(request: Request) -> dict[str, str]:
 async def request_id_middleware(request: Request, call_next):
     request_id = str(uuid4())
     request.state.request_id = request_id
+    request.state.started_at = time.perf_counter()
     response = await call_next(request)
     response.headers["X-Request-ID"] = request_id
     return response
@@ -106,6 +254,7 @@ def _log_request_audit(
     tenant = getattr(request.state, "audit_tenant", None)
     subject = getattr(request.state, "audit_subject", None)
     resolved_upstream = upstream or getattr(request.state, "audit_upstream", "policy")
+    started_at = getattr(request.state, "started_at", None)
     log_audit_event(
         method=request.method,
         path=request.url.path,
@@ -116,6 +265,9 @@ def _log_request_audit(
         upstream=resolved_upstream if isinstance(resolved_upstream, str) else "policy",
         decision=_decision_for_status(status_code),
         reason=reason,
+        duration_ms=(
+            (time.perf_counter() - started_at) * 1000 if isinstance(started_at, float) else None
+        ),
     )
 
 
@@ -129,6 +281,34 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail}, headers=headers)
 
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_exception_handler(request: Request, exc: CircuitOpenError) -> JSONResponse:
+    _log_request_audit(request, status_code=503, reason="upstream_circuit_open")
+    headers = {"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+    request_id = getattr(request.state, "request_id", None)
+    if isinstance(request_id, str):
+        headers["X-Request-ID"] = request_id
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Upstream MLflow is unavailable"},
+        headers=headers,
+    )
+
+
+@app.exception_handler(httpx.TimeoutException)
+async def upstream_timeout_exception_handler(
+    request: Request, exc: httpx.TimeoutException
+) -> JSONResponse:
+    _log_request_audit(request, status_code=504, reason="upstream_timeout")
+    request_id = getattr(request.state, "request_id", None)
+    headers = {"X-Request-ID": request_id} if isinstance(request_id, str) else {}
+    return JSONResponse(
+        status_code=504,
+        content={"detail": "Upstream MLflow timed out"},
+        headers=headers,
+    )
+
+
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     logger.exception("Unhandled gateway exception", exc_info=exc)
@@ -172,6 +352,381 @@ def _load_json_payload(raw_body: bytes) -> dict[str, Any]:
     return payload
 
 
+def _hop_by_hop_excluded_headers(*, decoded: bool) -> set[str]:
+    excluded = {"transfer-encoding", "connection"}
+    if decoded:
+        excluded |= {"content-encoding", "content-length"}
+    return excluded
+
+
+async def _stream_upstream_body(
+    upstream_response: httpx.Response, *, decode: bool, usage: TenantUsage
+) -> AsyncIterator[bytes]:
+    try:
+        chunks = upstream_response.aiter_bytes() if decode else upstream_response.aiter_raw()
+        async for chunk in chunks:
+            usage.response_bytes += len(chunk)
+            yield chunk
+    finally:
+        await upstream_response.aclose()
+
+
+def _request_body_limit(route_class: str) -> int:
+    limits = {**DEFAULT_REQUEST_BODY_LIMITS, **settings.request_body_limits}
+    return limits.get(route_class, limits["other"])
+
+
+def _request_timeout_seconds() -> float:
+    if settings.request_timeout_seconds is None:
+        return DEFAULT_REQUEST_TIMEOUT_SECONDS
+    return settings.request_timeout_seconds
+
+
+def _request_deadline(route_class: str) -> Deadline:
+    fallback = _request_timeout_seconds()
+    timeouts = {phase: fallback for phase in (*TIMEOUT_PHASES, "deadline")}
+    if settings.request_timeout_seconds is None:
+        # An explicit GW_REQUEST_TIMEOUT_SECONDS keeps covering every route class.
+        timeouts.update(DEFAULT_REQUEST_TIMEOUTS.get(route_class, {}))
+    timeouts.update(settings.request_timeouts.get(route_class, {}))
+    return Deadline(timeouts.pop("deadline"), timeouts)
+
+
+def _request_body_too_large(limit: int, route_class: str) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Request body exceeds {limit} bytes for route class {route_class}",
+    )
+
+
+async def _read_request_body(request: Request, limit: int, route_class: str) -> bytes:
+    if limit <= 0:
+        return await request.body()
+
+    declared_length = request.headers.get("content-length")
+    if declared_length and declared_length.isdigit() and int(declared_length) > limit:
+        raise _request_body_too_large(limit, route_class)
+
+    # Chunked bodies carry no Content-Length, so the limit is also enforced while reading.
+    chunks: list[bytes] = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > limit:
+            raise _request_body_too_large(limit, route_class)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _request_body_stream(request: Request, limit: int, route_class: str) -> AsyncIterator[bytes]:
+    """Stream ``request``'s body upstream, enforcing ``limit`` without buffering it."""
+    declared_length = request.headers.get("content-length")
+    if limit > 0 and declared_length and declared_length.isdigit() and int(declared_length) > limit:
+        raise _request_body_too_large(limit, route_class)
+    usage = current_usage.get()
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if limit > 0 and received > limit:
+                raise _request_body_too_large(limit, route_class)
+            usage.request_bytes += len(chunk)
+            yield chunk
+
+    return _chunks()
+
+
+def _decode_request_body(raw_body: bytes, content_encoding: str, limit: int) -> bytes:
+    # The route class limit also caps the inflated size, so a small compressed body
+    # cannot expand past it.
+    max_bytes = settings.request_max_decompressed_bytes
+    if limit > 0:
+        max_bytes = min(limit, max_bytes)
+    try:
+        return decode_request_body(raw_body, content_encoding, max_bytes)
+    except RequestBodyTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
+    except UnsupportedContentEncodingError as exc:
+        raise HTTPException(status_code=415, detail=str(exc)) from exc
+    except RequestBodyDecodingError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+async def _send_within_deadline(
+    client: httpx.AsyncClient,
+    upstream_request: httpx.Request,
+    *,
+    stream: bool,
+    deadline: Deadline | None,
+) -> httpx.Response:
+    if deadline is None:
+        return await client.send(upstream_request, stream=stream)
+    if deadline.expired():
+        raise httpx.TimeoutException("Request deadline exceeded", request=upstream_request)
+    # Re-cap the phase timeouts: retries and hedges are sent later than the request was built.
+    upstream_request.extensions["timeout"] = deadline.timeout().as_dict()
+    try:
+        async with asyncio.timeout(deadline.remaining()):
+            return await client.send(upstream_request, stream=stream)
+    except TimeoutError as exc:
+        raise httpx.TimeoutException(
+            "Request deadline exceeded", request=upstream_request
+        ) from exc
+
+
+async def _send_once(
+    base_url: str,
+    upstream_request: httpx.Request,
+    *,
+    stream: bool,
+    deadline: Deadline | None = None,
+) -> httpx.Response:
+    client = get_upstream_client(base_url)
+    usage = current_usage.get()
+    usage.upstream_calls += 1
+    started = time.perf_counter()
+    try:
+        with _read_balancer.track(base_url):
+            if not settings.circuit_breaker_enabled:
+                return await _send_within_deadline(
+                    client, upstream_request, stream=stream, deadline=deadline
+                )
+            # Only connection errors, timeouts and 5xx count against the upstream.
+            breaker = _circuit_breakers.get(base_url)
+            with breaker.guard(failures=(httpx.TransportError,)) as call:
+                response = await _send_within_deadline(
+                    client, upstream_request, stream=stream, deadline=deadline
+                )
+                call.failed = response.status_code >= 500
+        return response
+    finally:
+        usage.upstream_us += elapsed_us(started)
+
+
+async def _send_hedged(
+    base_url: str,
+    upstream_request: httpx.Request,
+    alternates: list[str],
+    *,
+    stream: bool,
+    deadline: Deadline | None,
+) -> httpx.Response:
+    """Send a read, racing a second copy to another replica if it is slower than usual."""
+    hedge_after_ms = None
+    hedging_enabled = settings.hedge_percentile > 0 and alternates
+    if hedging_enabled and len(_read_latency) >= settings.hedge_min_samples:
+        hedge_after_ms = _read_latency.percentile(settings.hedge_percentile)
+
+    started = time.perf_counter()
+    if hedge_after_ms is None:
+        response = await _send_once(base_url, upstream_request, stream=stream, deadline=deadline)
+    else:
+        first = asyncio.create_task(
+            _send_once(base_url, upstream_request, stream=stream, deadline=deadline)
+        )
+        done, _ = await asyncio.wait({first}, timeout=hedge_after_ms / 1000)
+        if done or not _retry_budget.try_acquire():
+            response = await first
+        else:
+            hedge_base_url = _read_balancer.pick(alternates)
+            hedge = asyncio.create_task(
+                _send_once(
+                    hedge_base_url,
+                    rebase_request(upstream_request, base_url, hedge_base_url),
+                    stream=stream,
+                    deadline=deadline,
+                )
+            )
+            response = await first_response([first, hedge])
+    _read_latency.observe((time.perf_counter() - started) * 1000)
+    return response
+
+
+async def _send_upstream(
+    base_url: str,
+    upstream_request: httpx.Request,
+    *,
+    stream: bool = False,
+    idempotent: bool = False,
+    deadline: Deadline | None = None,
+) -> httpx.Response:
+    """Send one upstream call through the backend's pool, load accounting and circuit breaker.
+
+    Idempotent calls are retried with jittered backoff on connection-level
+    failures, preferring another replica, and may be hedged; both draw from
+    the shared retry budget.
+    """
+    if not idempotent:
+        return await _send_once(base_url, upstream_request, stream=stream, deadline=deadline)
+
+    _retry_budget.record_request()
+    attempt = 0
+    while True:
+        alternates = [
+            replica
+            for replica in sibling_replicas(base_url)
+            if _health_checker.is_available(replica)
+        ]
+        try:
+            return await _send_hedged(
+                base_url, upstream_request, alternates, stream=stream, deadline=deadline
+            )
+        except RETRYABLE_ERRORS as exc:
+            delay = backoff_delay(
+                attempt, settings.retry_backoff_base_ms, settings.retry_backoff_max_ms
+            )
+            if (
+                attempt >= settings.retry_max_attempts
+                or (deadline is not None and deadline.remaining() <= delay)
+                or not _retry_budget.try_acquire()
+            ):
+                raise
+            logger.warning(
+                "Retrying idempotent upstream call to %s after %s", base_url, type(exc).__name__
+            )
+        await asyncio.sleep(delay)
+        attempt += 1
+        if alternates:
+            retry_base_url = _read_balancer.pick(alternates)
+            upstream_request = rebase_request(upstream_request, base_url, retry_base_url)
+            base_url = retry_base_url
+
+
+async def _send_passthrough(
+    request: Request,
+    base_url: str,
+    upstream_request: httpx.Request,
+    upstream_url: str,
+    *,
+    idempotent: bool = False,
+    deadline: Deadline | None = None,
+) -> StreamingResponse:
+    upstream_response = await _send_upstream(
+        base_url, upstream_request, stream=True, idempotent=idempotent, deadline=deadline
+    )
+    return _passthrough_response(request, upstream_response, upstream_url)
+
+
+def _passthrough_response(
+    request: Request, upstream_response: httpx.Response, upstream_url: str
+) -> StreamingResponse:
+    # Pass encoded bodies through untouched when the client can decode them itself.
+    content_encoding = upstream_response.headers.get("content-encoding")
+    decode = content_encoding is not None and not accepts_encoding(
+        request.headers.get("accept-encoding"), content_encoding
+    )
+    excluded = _hop_by_hop_excluded_headers(decoded=decode)
+    response_headers = {
+        k: v for k, v in upstream_response.headers.items() if k.lower() not in excluded
+    }
+
+    _log_request_audit(
+        request,
+        status_code=upstream_response.status_code,
+        reason="upstream_server_error" if upstream_response.status_code >= 500 else None,
+        upstream=upstream_url,
+    )
+
+    return StreamingResponse(
+        _stream_upstream_body(upstream_response, decode=decode, usage=current_usage.get()),
+        status_code=upstream_response.status_code,
+        headers=response_headers,
+        media_type=upstream_response.headers.get("content-type"),
+    )
+
+
+def _buffered_response(
+    request: Request, upstream_response: httpx.Response, upstream_url: str
+) -> Response:
+    """Return an upstream response whose body was already read (and decoded) by the gateway."""
+    _log_request_audit(
+        request,
+        status_code=upstream_response.status_code,
+        reason="upstream_server_error" if upstream_response.status_code >= 500 else None,
+        upstream=upstream_url,
+    )
+    current_usage.get().response_bytes += len(upstream_response.content)
+    excluded = _hop_by_hop_excluded_headers(decoded=True)
+    return Response(
+        content=upstream_response.content,
+        status_code=upstream_response.status_code,
+        headers={k: v for k, v in upstream_response.headers.items() if k.lower() not in excluded},
+        media_type=upstream_response.headers.get("content-type"),
+    )
+
+
+async def _send_verified_search(
+    request: Request,
+    base_url: str,
+    upstream_request: httpx.Request,
+    upstream_url: str,
+    tenant: str,
+    field: str,
+    row_tenant: Callable[[dict[str, Any]], str | None],
+    deadline: Deadline,
+) -> Response:
+    upstream_response = await _send_upstream(
+        base_url, upstream_request, stream=True, idempotent=True, deadline=deadline
+    )
+    if upstream_response.status_code != 200:
+        return _passthrough_response(request, upstream_response, upstream_url)
+
+    dropped_before = _search_verification_stats.rows_dropped
+    verified = verify_search_response(
+        _stream_upstream_body(upstream_response, decode=True, usage=current_usage.get()),
+        field,
+        row_tenant,
+        tenant,
+        _search_verification_stats,
+    )
+    excluded = _hop_by_hop_excluded_headers(decoded=True)
+    response_headers = {
+        k: v for k, v in upstream_response.headers.items() if k.lower() not in excluded
+    }
+
+    if settings.search_response_verification.lower() == "fail":
+        try:
+            content = b"".join([chunk async for chunk in verified])
+        except SearchVerificationError as exc:
+            raise HTTPException(status_code=502, detail="Invalid upstream response") from exc
+        finally:
+            await upstream_response.aclose()
+        if _search_verification_stats.rows_dropped > dropped_before:
+            _search_verification_stats.responses_failed += 1
+            raise HTTPException(
+                status_code=502, detail="Search response failed tenant verification"
+            )
+        _log_request_audit(request, status_code=200, upstream=upstream_url)
+        return Response(
+            content=content,
+            status_code=200,
+            headers=response_headers,
+            media_type=upstream_response.headers.get("content-type"),
+        )
+
+    request_id = getattr(request.state, "request_id", None)
+
+    async def _report_dropped_rows() -> AsyncIterator[bytes]:
+        async for chunk in verified:
+            yield chunk
+        dropped = _search_verification_stats.rows_dropped - dropped_before
+        if dropped:
+            logger.warning(
+                "Dropped %d search rows failing tenant verification (request_id=%s)",
+                dropped,
+                request_id,
+            )
+
+    _log_request_audit(request, status_code=200, upstream=upstream_url)
+    return StreamingResponse(
+        _report_dropped_rows(),
+        status_code=200,
+        headers=response_headers,
+        media_type=upstream_response.headers.get("content-type"),
+    )
+
+
 def _api_version_for_path(path: str) -> str:
     return "2.1" if "/api/2.1/" in path else "2.0"
 
@@ -188,67 +743,540 @@ def _extract_field_from_request(
     return None
 
 
-@app.api_route("/", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"])
-@app.api_route("/{full_path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"])
-async def policy_enforcement_gateway_handler(full_path: str, request: Request) -> Response:
-    tenant = None
-    subject = None
-    claims: dict[str, Any] | None = None
-    auth_is_enabled = settings.auth_enabled and settings.auth_mode.lower() != "off"
-    request.state.audit_upstream = "policy"
+def _replace_query_param(request: Request, name: str, value: str) -> list[tuple[str, str]]:
+    params = [(key, item) for key, item in request.query_params.multi_items() if key != name]
+    params.append((name, value))
+    return params
 
-    if auth_is_enabled:
-        if request.headers.get("x-tenant"):
-            request.state.audit_upstream = "auth"
-            raise HTTPException(
-                status_code=400,
-                detail="X-Tenant header is not allowed when AUTH_MODE=oidc",
+
+def _touches_tenant_tag(payload: dict[str, Any]) -> bool:
+    if payload.get("key") == settings.tenant_tag_key:
+        return True
+    tags = payload.get("tags")
+    return isinstance(tags, list) and any(
+        isinstance(tag, dict) and tag.get("key") == settings.tenant_tag_key for tag in tags
+    )
+
+
+def _extract_list_field_from_request(
+    payload: dict[str, Any], request: Request, field_names: tuple[str, ...]
+) -> list[str]:
+    values: list[str] = []
+    for field_name in field_names:
+        raw = payload.get(field_name)
+        if isinstance(raw, str):
+            raw = [raw]
+        if isinstance(raw, list):
+            values.extend(item.strip() for item in raw if isinstance(item, str) and item.strip())
+        values.extend(
+            item.strip() for item in request.query_params.getlist(field_name) if item.strip()
+        )
+    return list(dict.fromkeys(values))
+
+
+def _read_base_url(primary_base_url: str, tenant: str) -> str:
+    """Pick a read replica of ``primary_base_url`` unless ``tenant`` wrote recently."""
+    replicas = [
+        replica
+        for replica in read_replicas_for(primary_base_url)
+        if _health_checker.is_available(replica)
+    ]
+    if not replicas or _recent_writes.active(tenant):
+        return primary_base_url
+    return _read_balancer.pick(replicas)
+
+
+async def _enforce_run_ownership(
+    base_url: str,
+    run_ids: list[str],
+    tenant: str,
+    headers: dict[str, str],
+    version: str,
+    deadline: Deadline,
+) -> None:
+    """Check that every run belongs to ``tenant``, failing fast on the first foreign run.
+
+    Owners are resolved from the ownership cache first; the remaining runs are
+    looked up with concurrent preflights bounded by ``GW_PREFLIGHT_CONCURRENCY``.
+    """
+    pending: list[str] = []
+    for run_id in run_ids:
+        owner = _ownership_cache.get("run", run_id)
+        if owner is None:
+            pending.append(run_id)
+        elif owner != tenant:
+            raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
+    current_usage.get().cache_hits += len(run_ids) - len(pending)
+    if not pending:
+        return
+
+    client = get_upstream_client(base_url)
+    preflight_url = f"{base_url}/api/{version}/mlflow/runs/get"
+    semaphore = asyncio.Semaphore(max(1, settings.preflight_concurrency))
+
+    async def _check(run_id: str) -> None:
+        async with semaphore:
+            current_usage.get().preflights += 1
+            response = await _send_upstream(
+                base_url,
+                client.build_request(
+                    method="GET",
+                    url=preflight_url,
+                    headers=headers,
+                    params={"run_id": run_id},
+                    timeout=deadline.timeout(),
+                ),
+                idempotent=True,
+                deadline=deadline,
             )
+        if response.status_code == 404:
+            # Nothing is returned for a run that does not exist, so there is nothing to leak.
+            return
+        if response.status_code != 200:
+            raise HTTPException(status_code=502, detail="Unable to verify run ownership")
         try:
-            token = extract_bearer_token(request.headers.get("authorization"))
-            claims = await _validator.validate_token(token)
-            tenant = extract_tenant(claims, settings.tenant_claim)
-            subject = claims.get("sub") if isinstance(claims.get("sub"), str) else None
-            request.state.audit_tenant = tenant
-            request.state.audit_subject = subject
-            try:
-                enforce_rbac(
-                    request.url.path,
-                    claims,
-                    settings.role_claim,
-                    settings.rbac_viewer_aliases,
-                    settings.rbac_contributor_aliases,
-                    settings.rbac_admin_aliases,
-                    settings.rbac_default_deny,
-                )
-            except RBACError as exc:
-                request.state.audit_upstream = "policy"
-                raise HTTPException(status_code=403, detail=str(exc)) from exc
-        except AuthError as exc:
-            request.state.audit_upstream = "auth"
-            raise HTTPException(status_code=401, detail=str(exc)) from exc
-    else:
+            resource_payload = response.json()
+        except ValueError as exc:
+            raise HTTPException(status_code=502, detail="Invalid upstream response") from exc
+        owner = extract_tenant_tag_from_run_response(resource_payload, settings.tenant_tag_key)
+        if owner is not None:
+            _ownership_cache.put("run", run_id, owner)
+        if owner != tenant:
+            raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
+
+    tasks = [asyncio.create_task(_check(run_id)) for run_id in pending]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            await completed
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _authenticate(request: Request) -> tuple[str, dict[str, Any] | None]:
+    """Resolve the caller's tenant (and token claims when auth is enabled) for ``request``."""
+    auth_is_enabled = settings.auth_enabled and settings.auth_mode.lower() != "off"
+    if not auth_is_enabled:
         if _has_authorization_header(request):
             logger.warning("Authorization header ignored because AUTH_MODE=off")
         tenant = _require_tenant_from_headers(request)
-        subject = _optional_subject_from_headers(request)
         request.state.audit_tenant = tenant
-        request.state.audit_subject = subject
+        request.state.audit_subject = _optional_subject_from_headers(request)
+        return tenant, None
+
+    if request.headers.get("x-tenant"):
+        request.state.audit_upstream = "auth"
+        raise HTTPException(
+            status_code=400,
+            detail="X-Tenant header is not allowed when AUTH_MODE=oidc",
+        )
+    try:
+        token = extract_bearer_token(request.headers.get("authorization"))
+        claims = await _validator.validate_token(token)
+        tenant = extract_tenant(claims, settings.tenant_claim)
+    except AuthError as exc:
+        request.state.audit_upstream = "auth"
+        raise HTTPException(status_code=401, detail=str(exc)) from exc
+    request.state.audit_tenant = tenant
+    request.state.audit_subject = claims.get("sub") if isinstance(claims.get("sub"), str) else None
+    return tenant, claims
+
+
+def _enforce_route_rbac(request: Request, claims: dict[str, Any]) -> None:
+    try:
+        enforce_rbac(
+            request.url.path,
+            claims,
+            settings.role_claim,
+            settings.rbac_viewer_aliases,
+            settings.rbac_contributor_aliases,
+            settings.rbac_admin_aliases,
+            settings.rbac_default_deny,
+            method=request.method,
+        )
+    except RBACError as exc:
+        request.state.audit_upstream = "policy"
+        raise HTTPException(status_code=403, detail=str(exc)) from exc
+
+
+async def _execute_batch_item(
+    request: Request, item: BatchItem, tenant: str, claims: dict[str, Any] | None
+) -> dict[str, Any]:
+    state = {
+        "request_id": getattr(request.state, "request_id", None),
+        "audit_upstream": "policy",
+        "audit_tenant": tenant,
+        "audit_subject": getattr(request.state, "audit_subject", None),
+    }
+    sub_request = Request(sub_request_scope(request.scope, item, state), body_receiver(item.body))
+    try:
+        if claims is not None:
+            _enforce_route_rbac(sub_request, claims)
+        response = await _forward_with_policy(
+            item.path.lstrip("/"), sub_request, tenant, auth_is_enabled=claims is not None
+        )
+        if isinstance(response, StreamingResponse):
+            body = b"".join([chunk async for chunk in response.body_iterator])
+        else:
+            body = response.body
+    except Exception as exc:
+        # Same handlers as for a standalone request, so sub-requests are audited alike.
+        handler = next(
+            app.exception_handlers[cls]
+            for cls in type(exc).__mro__
+            if cls in app.exception_handlers
+        )
+        response = await handler(sub_request, exc)
+        body = response.body
+    return {
+        "status_code": response.status_code,
+        "body": decode_sub_response_body(body, response.headers.get("content-type")),
+    }
+
+
+@app.post(BATCH_PATH)
+async def batch_gateway_handler(request: Request) -> JSONResponse:
+    """Execute many MLflow calls in one round trip.
+
+    The caller is authenticated once; each sub-request then goes through the
+    same RBAC and tenant policies as a standalone call. Sub-requests run
+    concurrently (bounded by ``GW_BATCH_CONCURRENCY``) and results are returned
+    in request order.
+    """
+    request.state.audit_upstream = "policy"
+    tenant, claims = await _authenticate(request)
+    body_limit = _request_body_limit("batch")
+    raw_body = await _read_request_body(request, body_limit, "batch")
+    content_encoding = request.headers.get("content-encoding", "identity").strip().lower()
+    payload = _load_json_payload(_decode_request_body(raw_body, content_encoding, body_limit))
+    try:
+        items = parse_batch_payload(payload, settings.batch_max_requests)
+    except BatchRequestError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid batch payload: {exc}") from exc
+
+    semaphore = asyncio.Semaphore(max(1, settings.batch_concurrency))
+
+    async def _run(item: BatchItem) -> dict[str, Any]:
+        async with semaphore:
+            return await _execute_batch_item(request, item, tenant, claims)
+
+    responses = await asyncio.gather(*(_run(item) for item in items))
+    _log_request_audit(request, status_code=200)
+    return JSONResponse({"responses": responses})
+
+
+@app.get(USAGE_PATH)
+async def usage_handler(request: Request) -> JSONResponse:
+    """Per-tenant usage since start (``?tenant=`` for one); admin only when auth is enabled."""
+    request.state.audit_upstream = "policy"
+    if settings.auth_enabled and settings.auth_mode.lower() != "off":
+        _, claims = await _authenticate(request)
+        try:
+            role = extract_effective_role(
+                claims or {},
+                settings.role_claim,
+                settings.rbac_viewer_aliases,
+                settings.rbac_contributor_aliases,
+                settings.rbac_admin_aliases,
+            )
+        except RBACError as exc:
+            raise HTTPException(status_code=403, detail=str(exc)) from exc
+        if role != "admin":
+            raise HTTPException(
+                status_code=403, detail=f"Insufficient role: required admin, got {role}"
+            )
+    snapshot = _usage.snapshot(request.query_params.get("tenant"))
+    _log_request_audit(request, status_code=200)
+    return JSONResponse(snapshot)
+
+
+def _experiment_cache_id(primary_base_url: str, experiment_id: str) -> str:
+    """Ownership cache ID of an experiment.
+
+    Each MLflow database numbers its experiments independently, so tenants routed to
+    different backends can have experiments with the same ID.
+    """
+    return f"{primary_base_url}#{experiment_id}"
+
+
+async def _lookup_experiment_owner(
+    base_url: str,
+    experiment_id: str,
+    cache_id: str,
+    headers: dict[str, str],
+    version: str,
+    deadline: Deadline,
+) -> str | None:
+    client = get_upstream_client(base_url)
+    current_usage.get().preflights += 1
+    response = await _send_upstream(
+        base_url,
+        client.build_request(
+            method="GET",
+            url=f"{base_url}/api/{version}/mlflow/experiments/get",
+            headers=headers,
+            params={"experiment_id": experiment_id},
+            timeout=deadline.timeout(),
+        ),
+        idempotent=True,
+        deadline=deadline,
+    )
+    if response.status_code == 404:
+        return None
+    if response.status_code != 200:
+        raise HTTPException(status_code=502, detail="Unable to verify experiment ownership")
+    try:
+        resource_payload = response.json()
+    except ValueError as exc:
+        raise HTTPException(status_code=502, detail="Invalid upstream response") from exc
+    owner = extract_tenant_tag_from_experiment_response(resource_payload, settings.tenant_tag_key)
+    if owner is not None:
+        _ownership_cache.put("experiment", cache_id, owner)
+    return owner
+
+
+async def _experiment_owner(
+    primary_base_url: str,
+    base_url: str,
+    experiment_id: str,
+    headers: dict[str, str],
+    version: str,
+    deadline: Deadline,
+) -> str | None:
+    """Tenant owning ``experiment_id``, or ``None`` if it is untagged or does not exist.
+
+    Served from the ownership cache when possible. Concurrent misses for the same
+    experiment (a sweep creating many runs at once) share a single upstream lookup.
+    """
+    cache_id = _experiment_cache_id(primary_base_url, experiment_id)
+    owner = _ownership_cache.get("experiment", cache_id)
+    if owner is not None:
+        current_usage.get().cache_hits += 1
+        return owner
+    return await _coalesced(
+        ("experiment", base_url, experiment_id),
+        lambda: _lookup_experiment_owner(
+            base_url, experiment_id, cache_id, headers, version, deadline
+        ),
+    )
+
+
+# Headers describing the artifact transfer itself, dropped from the ownership lookups.
+_ARTIFACT_BODY_HEADERS = frozenset(
+    {"content-type", "content-length", "content-encoding", "range", "if-range"}
+)
 
-    upstream_url = f"{settings.target_base_url.rstrip('/')}/{full_path}"
+
+async def _enforce_artifact_ownership(
+    request: Request,
+    base_url: str,
+    tenant: str,
+    headers: dict[str, str],
+    deadline: Deadline,
+) -> None:
+    """Check that the experiment (and run) an artifact path lives under belongs to ``tenant``."""
+    try:
+        artifact_path = artifact_path_for_request(request.url.path, request.query_params)
+        owner = artifact_owner_for_path(artifact_path, settings.artifact_path_prefix)
+    except ArtifactPathError as exc:
+        request.state.audit_upstream = "policy"
+        raise HTTPException(status_code=403, detail=str(exc)) from exc
+
+    lookup_headers = {
+        name: value
+        for name, value in headers.items()
+        if name not in _ARTIFACT_BODY_HEADERS
+    }
+    experiment_owner = await _experiment_owner(
+        upstream_base_url_for_tenant(tenant),
+        base_url,
+        owner.experiment_id,
+        lookup_headers,
+        "2.0",
+        deadline,
+    )
+    if experiment_owner != tenant:
+        request.state.audit_upstream = "policy"
+        raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
+    if owner.run_id is not None:
+        await _enforce_run_ownership(
+            base_url, [owner.run_id], tenant, lookup_headers, "2.0", deadline
+        )
+
+
+async def _load_registered_model_names(
+    base_url: str, tenant: str, headers: dict[str, str], version: str, deadline: Deadline
+) -> frozenset[str]:
+    client = get_upstream_client(base_url)
+    names: set[str] = set()
+    page_token: str | None = None
+    while True:
+        # MLflow serves registered-models/search as a GET with query parameters only.
+        tenant_filter = ensure_tenant_filter_for_registered_models_search(
+            {}, tenant, settings.tenant_tag_key
+        )["filter_string"]
+        params = [("filter", tenant_filter), ("max_results", "1000")]
+        if page_token:
+            params.append(("page_token", page_token))
+        current_usage.get().preflights += 1
+        response = await _send_upstream(
+            base_url,
+            client.build_request(
+                method="GET",
+                url=f"{base_url}/api/{version}/mlflow/registered-models/search",
+                headers=headers,
+                params=params,
+                timeout=deadline.timeout(),
+            ),
+            idempotent=True,
+            deadline=deadline,
+        )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=502, detail="Unable to resolve tenant registered models"
+            )
+        try:
+            result = response.json()
+        except ValueError as exc:
+            raise HTTPException(status_code=502, detail="Invalid upstream response") from exc
+        for model in result.get("registered_models") or []:
+            if isinstance(model, dict) and isinstance(model.get("name"), str):
+                names.add(model["name"])
+        page_token = result.get("next_page_token")
+        if not isinstance(page_token, str) or not page_token:
+            break
+    _model_names.seed(tenant, names)
+    return frozenset(names)
+
+
+async def _registered_model_names(
+    base_url: str, tenant: str, headers: dict[str, str], version: str, deadline: Deadline
+) -> frozenset[str]:
+    """Names of ``tenant``'s registered models, seeded lazily from MLflow and then cached."""
+    names = _model_names.get(tenant)
+    if names is not None:
+        current_usage.get().cache_hits += 1
+        return names
+    return await _coalesced(
+        ("registered-model-names", base_url, tenant),
+        lambda: _load_registered_model_names(base_url, tenant, headers, version, deadline),
+    )
+
+
+def _update_model_name_index(request: Request, payload: dict[str, Any], tenant: str) -> None:
+    name = _extract_field_from_request(payload, request, "name")
+    if name is None:
+        return
+    request_path = request.url.path
+    if is_registered_model_create_path(request_path):
+        _model_names.add(tenant, name)
+    elif request_path.endswith("/registered-models/rename"):
+        _model_names.discard(tenant, name)
+        new_name = _extract_field_from_request(payload, request, "new_name")
+        if new_name:
+            _model_names.add(tenant, new_name)
+    elif request_path.endswith("/registered-models/delete"):
+        _model_names.discard(tenant, name)
+
+
+async def _coalesced(key: tuple[str, ...], lookup: Callable[[], Awaitable[T]]) -> T:
+    """Run ``lookup`` once for all concurrent callers with the same ``key``."""
+    future = _inflight_lookups.get(key)
+    if future is None:
+        future = asyncio.ensure_future(lookup())
+        _inflight_lookups[key] = future
+
+        def _forget(done: asyncio.Future[Any]) -> None:
+            _inflight_lookups.pop(key, None)
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(_forget)
+    # Shielded so one caller going away does not cancel the lookup for the others.
+    return await asyncio.shield(future)
+
+
+@app.api_route("/", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"])
+@app.api_route("/{full_path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"])
+async def policy_enforcement_gateway_handler(full_path: str, request: Request) -> Response:
+    request.state.audit_upstream = "policy"
+    tenant, claims = await _authenticate(request)
+    if claims is not None:
+        _enforce_route_rbac(request, claims)
+    return await _forward_with_policy(
+        full_path, request, tenant, auth_is_enabled=claims is not None
+    )
+
+
+async def _forward_with_policy(
+    full_path: str, request: Request, tenant: str, *, auth_is_enabled: bool
+) -> Response:
+    """Apply the tenant policies for ``request``'s route and forward it to MLflow."""
+    request_path = request.url.path
+    route_class = route_class_for_path(request_path)
+    usage = _usage.for_tenant(tenant)
+    current_usage.set(usage)
+    usage.count_request(route_class)
+    is_write = route_class in WRITE_ROUTE_CLASSES or (
+        route_class not in READ_ROUTE_CLASSES and request.method not in SAFE_METHODS
+    )
+    primary_base_url = upstream_base_url_for_tenant(tenant)
+    read_base_url = _read_base_url(primary_base_url, tenant)
+    base_url = read_base_url if route_class in READ_ROUTE_CLASSES else primary_base_url
+    client = get_upstream_client(base_url)
+    upstream_url = f"{base_url}/{full_path}"
     request.state.audit_upstream = upstream_url
 
     forward_headers = dict(request.headers)
     forward_headers.pop("host", None)
     forward_headers.pop("content-length", None)
+    forward_headers.pop("transfer-encoding", None)
+    forward_headers["accept-encoding"] = request.headers.get("accept-encoding", "identity")
     if not auth_is_enabled:
         forward_headers.pop("authorization", None)
 
-    body = await request.body()
-    request_path = request.url.path
+    body_limit = _request_body_limit(route_class)
+
+    if route_class == "artifact":
+        # Artifact bodies are streamed in both directions, never buffered in the gateway.
+        deadline = _request_deadline(route_class)
+        # Uploads and deletes are checked against the primary they are written to.
+        ownership_base_url = read_base_url if request.method in SAFE_METHODS else primary_base_url
+        await _enforce_artifact_ownership(
+            request, ownership_base_url, tenant, forward_headers, deadline
+        )
+        has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+        if request.headers.get("content-length"):
+            forward_headers["content-length"] = request.headers["content-length"]
+        upstream_request = client.build_request(
+            method=request.method,
+            url=upstream_url,
+            params=request.query_params,
+            headers=forward_headers,
+            content=_request_body_stream(request, body_limit, route_class) if has_body else None,
+            timeout=deadline.timeout(),
+        )
+        response = await _send_passthrough(
+            request, base_url, upstream_request, upstream_url, deadline=deadline
+        )
+        if is_write:
+            _recent_writes.mark(tenant)
+        return response
+
+    raw_body = await _read_request_body(request, body_limit, route_class)
+    usage.request_bytes += len(raw_body)
+    request_content_encoding = request.headers.get("content-encoding", "identity").strip().lower()
+    body = _decode_request_body(raw_body, request_content_encoding, body_limit)
+    decoded_body = body
+    forward_headers.pop("content-encoding", None)
+
+    deadline = _request_deadline(route_class)
+    upstream_params: Any = request.query_params
 
     if (
         is_runs_create_path(request_path)
+        or is_experiment_create_path(request_path)
         or is_registered_model_create_path(request_path)
         or is_model_version_create_path(request_path)
     ):
@@ -259,6 +1287,20 @@ async def policy_enforcement_gateway_handler(full_path: str, request: Request) -
             raise HTTPException(status_code=403, detail=str(exc)) from exc
         except TenantPayloadError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if is_runs_create_path(request_path):
+            experiment_id = _extract_field_from_request(payload, request, "experiment_id")
+            if not experiment_id:
+                raise HTTPException(status_code=400, detail="Missing required field: experiment_id")
+            owner = await _experiment_owner(
+                primary_base_url,
+                primary_base_url,
+                experiment_id,
+                forward_headers,
+                _api_version_for_path(request_path),
+                deadline,
+            )
+            if owner != tenant:
+                raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
         body = json.dumps(payload).encode()
     elif is_runs_search_path(request_path):
         payload = _load_json_payload(body)
@@ -267,126 +1309,367 @@ async def policy_enforcement_gateway_handler(full_path: str, request: Request) -
         except TenantPayloadError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         body = json.dumps(payload).encode()
+    elif is_experiments_search_path(request_path):
+        # Served on GET (query parameters) as well as POST; MLflow ignores the body on GET.
+        in_query = request.method in SAFE_METHODS
+        payload = (
+            {"filter": request.query_params.get("filter", "")}
+            if in_query
+            else _load_json_payload(body)
+        )
+        try:
+            payload = ensure_tenant_filter_for_experiments_search(
+                payload, tenant, settings.tenant_tag_key
+            )
+        except TenantPayloadError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if in_query:
+            upstream_params = _replace_query_param(request, "filter", payload["filter"])
+        else:
+            body = json.dumps(payload).encode()
+    elif is_model_versions_search_path(request_path):
+        # MLflow clients send this search as a GET with query parameters.
+        in_query = request.method in SAFE_METHODS
+        payload = (
+            {"filter": request.query_params.get("filter", "")}
+            if in_query
+            else _load_json_payload(body)
+        )
+        try:
+            if settings.model_versions_search_scope.lower() == "name":
+                model_names = await _registered_model_names(
+                    read_base_url,
+                    tenant,
+                    forward_headers,
+                    _api_version_for_path(request_path),
+                    deadline,
+                )
+                payload = ensure_name_filter_for_model_versions_search(
+                    payload,
+                    model_names,
+                    max_names=settings.model_versions_search_max_names,
+                    tenant=tenant,
+                    tenant_tag_key=settings.tenant_tag_key,
+                )
+            else:
+                payload = ensure_tenant_filter_for_model_versions_search(
+                    payload, tenant, settings.tenant_tag_key
+                )
+        except TenantPayloadError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if payload is None:
+            # No registered model of the tenant can match; MLflow does not need to be asked.
+            _log_request_audit(request, status_code=200, upstream="policy")
+            return JSONResponse({"model_versions": []})
+        if in_query:
+            upstream_params = _replace_query_param(request, "filter", payload["filter"])
+        else:
+            body = json.dumps(payload).encode()
     elif is_registered_models_search_path(request_path):
-        payload = _load_json_payload(body)
+        # MLflow serves this search as a GET whose query parameter is named ``filter``.
+        in_query = request.method in SAFE_METHODS
+        payload = (
+            {"filter_string": request.query_params.get("filter", "")}
+            if in_query
+            else _load_json_payload(body)
+        )
         try:
             payload = ensure_tenant_filter_for_registered_models_search(
                 payload, tenant, settings.tenant_tag_key
             )
         except TenantPayloadError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-        body = json.dumps(payload).encode()
+        if in_query:
+            upstream_params = _replace_query_param(request, "filter", payload["filter_string"])
+        else:
+            body = json.dumps(payload).encode()
 
-    timeout = httpx.Timeout(settings.request_timeout_seconds)
+    preflight_endpoint = None
+    preflight_params: dict[str, Any] | None = None
+    response_tenant_extractor = None
+    cache_kind: str | None = None
+    cache_id: str | None = None
+    changes_owner = False
+    # Mutations are checked against the primary they are sent to: a lagging replica may not
+    # have the resource yet.
+    preflight_base_url = base_url
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=False) as client:
-        preflight_endpoint = None
-        preflight_body: bytes | None = None
-        response_tenant_extractor = None
+    if is_runs_metrics_history_path(request_path):
+        lookup_payload = _load_json_payload(body)
+        run_ids = _extract_list_field_from_request(
+            lookup_payload, request, ("run_id", "run_ids", "run_uuid")
+        )
+        if not run_ids:
+            raise HTTPException(status_code=400, detail="Missing required field: run_id")
+        await _enforce_run_ownership(
+            read_base_url,
+            run_ids,
+            tenant,
+            forward_headers,
+            _api_version_for_path(request_path),
+            deadline,
+        )
 
-        if (
-            is_runs_get_path(request_path)
-            or is_runs_mutation_path(request_path)
-            or is_registered_model_get_path(request_path)
-            or is_registered_model_mutation_path(request_path)
-            or is_model_version_get_path(request_path)
-            or is_model_version_mutation_path(request_path)
+    if (
+        is_runs_get_path(request_path)
+        or is_runs_mutation_path(request_path)
+        or is_experiment_get_path(request_path)
+        or is_experiment_get_by_name_path(request_path)
+        or is_experiment_mutation_path(request_path)
+        or is_registered_model_get_path(request_path)
+        or is_registered_model_mutation_path(request_path)
+        or is_model_version_get_path(request_path)
+        or is_model_version_mutation_path(request_path)
+    ):
+        lookup_payload = _load_json_payload(body)
+        version = _api_version_for_path(request_path)
+
+        if is_runs_get_path(request_path) or is_runs_mutation_path(request_path):
+            run_id = _extract_field_from_request(lookup_payload, request, "run_id")
+            if not run_id:
+                raise HTTPException(status_code=400, detail="Missing required field: run_id")
+            preflight_endpoint = f"/api/{version}/mlflow/runs/get"
+            preflight_params = {"run_id": run_id}
+            response_tenant_extractor = lambda payload: extract_tenant_tag_from_run_response(
+                payload, settings.tenant_tag_key
+            )
+            cache_kind, cache_id = "run", run_id
+        elif is_experiment_get_path(request_path) or is_experiment_mutation_path(request_path):
+            experiment_id = _extract_field_from_request(lookup_payload, request, "experiment_id")
+            if not experiment_id:
+                raise HTTPException(status_code=400, detail="Missing required field: experiment_id")
+            preflight_endpoint = f"/api/{version}/mlflow/experiments/get"
+            preflight_params = {"experiment_id": experiment_id}
+            response_tenant_extractor = lambda payload: extract_tenant_tag_from_experiment_response(
+                payload, settings.tenant_tag_key
+            )
+            cache_kind = "experiment"
+            cache_id = _experiment_cache_id(primary_base_url, experiment_id)
+        elif is_experiment_get_by_name_path(request_path):
+            experiment_name = _extract_field_from_request(
+                lookup_payload, request, "experiment_name"
+            )
+            if not experiment_name:
+                raise HTTPException(
+                    status_code=400, detail="Missing required field: experiment_name"
+                )
+            preflight_endpoint = f"/api/{version}/mlflow/experiments/get-by-name"
+            preflight_params = {"experiment_name": experiment_name}
+            response_tenant_extractor = lambda payload: extract_tenant_tag_from_experiment_response(
+                payload, settings.tenant_tag_key
+            )
+            # Names can be reused after a delete, so only the returned ID is cached.
+            cache_kind = "experiment"
+        elif is_registered_model_get_path(request_path) or is_registered_model_mutation_path(
+            request_path
         ):
-            lookup_payload = _load_json_payload(body)
-            version = _api_version_for_path(request_path)
-
-            if is_runs_get_path(request_path) or is_runs_mutation_path(request_path):
-                run_id = _extract_field_from_request(lookup_payload, request, "run_id")
-                if not run_id:
-                    raise HTTPException(status_code=400, detail="Missing required field: run_id")
-                preflight_endpoint = f"/api/{version}/mlflow/runs/get"
-                preflight_body = json.dumps({"run_id": run_id}).encode()
-                response_tenant_extractor = lambda payload: extract_tenant_tag_from_run_response(
+            model_name = _extract_field_from_request(lookup_payload, request, "name")
+            if not model_name:
+                raise HTTPException(status_code=400, detail="Missing required field: name")
+            preflight_endpoint = f"/api/{version}/mlflow/registered-models/get"
+            preflight_params = {"name": model_name}
+            response_tenant_extractor = (
+                lambda payload: extract_tenant_tag_from_registered_model_response(
                     payload, settings.tenant_tag_key
                 )
-            elif is_registered_model_get_path(request_path) or is_registered_model_mutation_path(
-                request_path
-            ):
-                model_name = _extract_field_from_request(lookup_payload, request, "name")
-                if not model_name:
-                    raise HTTPException(status_code=400, detail="Missing required field: name")
-                preflight_endpoint = f"/api/{version}/mlflow/registered-models/get"
-                preflight_body = json.dumps({"name": model_name}).encode()
-                response_tenant_extractor = (
-                    lambda payload: extract_tenant_tag_from_registered_model_response(
-                        payload, settings.tenant_tag_key
+            )
+        elif is_model_version_get_path(request_path) or is_model_version_mutation_path(
+            request_path
+        ):
+            model_name = _extract_field_from_request(lookup_payload, request, "name")
+            model_version = _extract_field_from_request(lookup_payload, request, "version")
+            if not model_name:
+                raise HTTPException(status_code=400, detail="Missing required field: name")
+            if not model_version:
+                raise HTTPException(status_code=400, detail="Missing required field: version")
+            preflight_endpoint = f"/api/{version}/mlflow/model-versions/get"
+            preflight_params = {"name": model_name, "version": model_version}
+            response_tenant_extractor = lambda payload: extract_tenant_tag_from_model_version_response(
+                payload, settings.tenant_tag_key
+            )
+
+        if cache_kind is not None and cache_id is not None and (
+            is_runs_mutation_path(request_path) or is_experiment_mutation_path(request_path)
+        ):
+            if _touches_tenant_tag(lookup_payload):
+                # The owner seen before a tenant tag change must not be cached.
+                changes_owner = True
+                _ownership_cache.invalidate(cache_kind, cache_id)
+            else:
+                cached_owner = _ownership_cache.get(cache_kind, cache_id)
+                if cached_owner is not None and cached_owner != tenant:
+                    raise HTTPException(
+                        status_code=403, detail="Resource is not accessible for tenant"
                     )
-                )
-            elif is_model_version_get_path(request_path) or is_model_version_mutation_path(
-                request_path
-            ):
-                model_name = _extract_field_from_request(lookup_payload, request, "name")
-                model_version = _extract_field_from_request(lookup_payload, request, "version")
-                if not model_name:
-                    raise HTTPException(status_code=400, detail="Missing required field: name")
-                if not model_version:
-                    raise HTTPException(status_code=400, detail="Missing required field: version")
-                preflight_endpoint = f"/api/{version}/mlflow/model-versions/get"
-                preflight_body = json.dumps({"name": model_name, "version": model_version}).encode()
-                response_tenant_extractor = lambda payload: extract_tenant_tag_from_model_version_response(
-                    payload, settings.tenant_tag_key
-                )
+                if cached_owner == tenant:
+                    usage.cache_hits += 1
+                    preflight_endpoint = None
 
-        if preflight_endpoint is not None and response_tenant_extractor is not None and preflight_body is not None:
-            preflight_url = f"{settings.target_base_url.rstrip('/')}{preflight_endpoint}"
-            preflight_response = await client.request(
-                method="POST",
+    if (
+        preflight_endpoint is not None
+        and response_tenant_extractor is not None
+        and preflight_params is not None
+    ):
+        preflight_url = f"{preflight_base_url}{preflight_endpoint}"
+        # Gets are answered from the preflight response; only mutations pay for an extra call.
+        answers_request = (
+            is_runs_get_path(request_path)
+            or is_experiment_get_path(request_path)
+            or is_experiment_get_by_name_path(request_path)
+            or is_registered_model_get_path(request_path)
+            or is_model_version_get_path(request_path)
+        )
+        if not answers_request:
+            usage.preflights += 1
+        preflight_response = await _send_upstream(
+            preflight_base_url,
+            # MLflow serves the get endpoints as GETs with query parameters only.
+            get_upstream_client(preflight_base_url).build_request(
+                method="GET",
                 url=preflight_url,
-                headers=forward_headers,
-                content=preflight_body,
-            )
-            if preflight_response.status_code == 200:
-                try:
-                    resource_payload = preflight_response.json()
-                except ValueError as exc:
-                    raise HTTPException(status_code=502, detail="Invalid upstream response") from exc
-                resource_tenant = response_tenant_extractor(resource_payload)
-                if resource_tenant != tenant:
-                    raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
-
+                headers={
+                    name: value for name, value in forward_headers.items() if name != "content-type"
+                },
+                params=preflight_params,
+                timeout=deadline.timeout(),
+            ),
+            idempotent=True,
+            deadline=deadline,
+        )
+        if preflight_response.status_code == 200:
+            try:
+                resource_payload = preflight_response.json()
+            except ValueError as exc:
+                raise HTTPException(status_code=502, detail="Invalid upstream response") from exc
+            resource_tenant = response_tenant_extractor(resource_payload)
+            if cache_kind == "experiment" and cache_id is None:
+                returned_id = extract_experiment_id_from_response(resource_payload)
+                if returned_id is not None:
+                    cache_id = _experiment_cache_id(primary_base_url, returned_id)
             if (
-                is_runs_get_path(request_path)
-                or is_registered_model_get_path(request_path)
-                or is_model_version_get_path(request_path)
+                cache_kind is not None
+                and cache_id is not None
+                and resource_tenant is not None
+                and not changes_owner
             ):
-                upstream_response = preflight_response
-            else:
-                upstream_response = await client.request(
-                    method=request.method,
-                    url=upstream_url,
-                    params=request.query_params,
-                    headers=forward_headers,
-                    content=body,
-                )
-        else:
-            upstream_response = await client.request(
-                method=request.method,
-                url=upstream_url,
-                params=request.query_params,
-                headers=forward_headers,
-                content=body,
-            )
+                _ownership_cache.put(cache_kind, cache_id, resource_tenant)
+            if resource_tenant != tenant:
+                raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
+        elif not answers_request:
+            # Ownership could not be verified, so the mutation must not be forwarded.
+            if preflight_response.status_code == 404:
+                raise HTTPException(status_code=403, detail="Resource is not accessible for tenant")
+            raise HTTPException(status_code=502, detail="Unable to verify resource ownership")
 
-    excluded = {"content-encoding", "transfer-encoding", "connection", "content-length"}
-    response_headers = {
-        k: v for k, v in upstream_response.headers.items() if k.lower() not in excluded
-    }
+        if answers_request:
+            # The preflight body was already decoded for inspection; return it as-is.
+            return _buffered_response(request, preflight_response, upstream_url)
 
-    _log_request_audit(
-        request,
-        status_code=upstream_response.status_code,
-        reason="upstream_server_error" if upstream_response.status_code >= 500 else None,
-        upstream=upstream_url,
+    upstream_encoding = settings.upstream_request_encoding
+    if body and upstream_encoding != "identity":
+        if body is decoded_body and request_content_encoding == upstream_encoding:
+            # Untouched by policy rewrites: forward the client's compressed bytes as received.
+            body = raw_body
+        else:
+            body = encode_request_body(body, upstream_encoding)
+        forward_headers["content-encoding"] = upstream_encoding
+
+    upstream_request = client.build_request(
+        method=request.method,
+        url=upstream_url,
+        params=upstream_params,
+        headers=forward_headers,
+        content=body,
+        timeout=deadline.timeout(),
     )
+    if settings.search_response_verification.lower() in {"drop", "fail"}:
+        if is_runs_search_path(request_path):
+            return await _send_verified_search(
+                request,
+                base_url,
+                upstream_request,
+                upstream_url,
+                tenant,
+                "runs",
+                lambda row: extract_tenant_tag_from_run_response(
+                    {"run": row}, settings.tenant_tag_key
+                ),
+                deadline,
+            )
+        if is_experiments_search_path(request_path):
+            return await _send_verified_search(
+                request,
+                base_url,
+                upstream_request,
+                upstream_url,
+                tenant,
+                "experiments",
+                lambda row: extract_tenant_tag_from_experiment_response(
+                    {"experiment": row}, settings.tenant_tag_key
+                ),
+                deadline,
+            )
+        if (
+            is_model_versions_search_path(request_path)
+            and settings.model_versions_search_scope.lower() != "name"
+        ):
+            return await _send_verified_search(
+                request,
+                base_url,
+                upstream_request,
+                upstream_url,
+                tenant,
+                "model_versions",
+                lambda row: extract_tenant_tag_from_model_version_response(
+                    {"model_version": row}, settings.tenant_tag_key
+                ),
+                deadline,
+            )
+        if is_registered_models_search_path(request_path):
+            return await _send_verified_search(
+                request,
+                base_url,
+                upstream_request,
+                upstream_url,
+                tenant,
+                "registered_models",
+                lambda row: extract_tenant_tag_from_registered_model_response(
+                    {"registered_model": row}, settings.tenant_tag_key
+                ),
+                deadline,
+            )
+    if is_experiment_create_path(request_path):
+        # Buffered so the new experiment's owner can be cached for the runs created in it.
+        upstream_response = await _send_upstream(base_url, upstream_request, deadline=deadline)
+        if upstream_response.status_code == 200:
+            try:
+                experiment_id = extract_experiment_id_from_response(upstream_response.json())
+            except ValueError:
+                experiment_id = None
+            if experiment_id is not None:
+                _ownership_cache.put(
+                    "experiment", _experiment_cache_id(primary_base_url, experiment_id), tenant
+                )
+        _recent_writes.mark(tenant)
+        return _buffered_response(request, upstream_response, upstream_url)
 
-    return Response(
-        content=upstream_response.content,
-        status_code=upstream_response.status_code,
-        headers=response_headers,
-        media_type=upstream_response.headers.get("content-type"),
+    response = await _send_passthrough(
+        request,
+        base_url,
+        upstream_request,
+        upstream_url,
+        idempotent=route_class in READ_ROUTE_CLASSES,
+        deadline=deadline,
     )
+    if is_write:
+        # The window starts once MLflow has committed, so it covers replica lag after the write.
+        _recent_writes.mark(tenant)
+    if changes_owner:
+        # A concurrent preflight may have cached the previous owner while the change was in flight.
+        _ownership_cache.invalidate(cache_kind, cache_id)
+    if response.status_code == 200 and (
+        is_registered_model_create_path(request_path)
+        or is_registered_model_mutation_path(request_path)
+    ):
+        _update_model_name_index(request, _load_json_payload(decoded_body), tenant)
+    return response
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+"""Resolve which experiment and run an artifact proxy request touches."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+
+ARTIFACT_PREFIXES = ("/api/2.0/mlflow-artifacts/", "/ajax-api/2.0/mlflow-artifacts/")
+# Operations addressed as ``<operation>/<artifact path>`` below the prefix.
+_PATH_OPERATIONS = ("artifacts", "mpu/create", "mpu/complete", "mpu/abort")
+
+
+class ArtifactPathError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ArtifactOwner:
+    """Experiment (and run, when the path is below one) owning an artifact path."""
+
+    experiment_id: str
+    run_id: str | None = None
+
+
+def artifact_path_for_request(path: str, query_params: Mapping[str, str]) -> str:
+    """Return the artifact path (relative to the artifact root) addressed by a request.
+
+    Downloads, uploads, deletes and multipart uploads carry it in the URL
+    (``artifacts/<path>``, ``mpu/create/<path>``); listings pass it as the
+    ``path`` query parameter of ``artifacts``.
+    """
+    for prefix in ARTIFACT_PREFIXES:
+        if path.startswith(prefix):
+            remainder = path[len(prefix):]
+            break
+    else:
+        raise ArtifactPathError("Not an artifact proxy path")
+
+    if remainder == "artifacts":
+        return query_params.get("path", "")
+    for operation in _PATH_OPERATIONS:
+        if remainder.startswith(f"{operation}/"):
+            return remainder[len(operation) + 1:]
+    raise ArtifactPathError("Unsupported artifact operation")
+
+
+def artifact_owner_for_path(artifact_path: str, root_prefix: str = "") -> ArtifactOwner:
+    """Map an artifact path to its owning experiment and run.
+
+    With MLflow's proxied artifact storage, run artifacts live under
+    ``<experiment_id>/<run_id>/artifacts/...`` and logged models under
+    ``<experiment_id>/models/<model_id>/...``, optionally below ``root_prefix``
+    (the part of ``--default-artifact-root`` after ``mlflow-artifacts:/``).
+    Paths that do not resolve to an experiment cannot be authorized.
+    """
+    parts = [part for part in artifact_path.split("/") if part]
+    if ".." in parts or "." in parts:
+        raise ArtifactPathError("Artifact path must not contain relative segments")
+
+    prefix_parts = [part for part in root_prefix.split("/") if part]
+    if parts[: len(prefix_parts)] != prefix_parts:
+        raise ArtifactPathError("Artifact path is outside the artifact root")
+    parts = parts[len(prefix_parts):]
+
+    if not parts:
+        raise ArtifactPathError("Artifact path does not identify an experiment")
+    if len(parts) == 1 or parts[1] == "models":
+        return ArtifactOwner(experiment_id=parts[0])
+    return ArtifactOwner(experiment_id=parts[0], run_id=parts[1])
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Union
+
+
+class FilterParseError(ValueError):
+    pass
+
+
+ENTITY_ALIASES = {
+    "attribute": "attributes",
+    "attributes": "attributes",
+    "attr": "attributes",
+    "run": "attributes",
+    "metric": "metrics",
+    "metrics": "metrics",
+    "param": "params",
+    "params": "params",
+    "parameter": "params",
+    "parameters": "params",
+    "tag": "tags",
+    "tags": "tags",
+    "dataset": "datasets",
+    "datasets": "datasets",
+}
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>'(?:[^']|'')*')
+      | (?P<dstring>"(?:[^"\\]|\\.)*")
+      | (?P<backtick>`[^`]*`)
+      | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<op><=|>=|!=|<>|=|<|>)
+      | (?P<punct>[(),.])
+      | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    )
+    """,
+    re.VERBOSE,
+)
+_PLAIN_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+@dataclass(frozen=True)
+class Value:
+    """A literal operand. ``kind`` is ``string``, ``number``, ``tuple`` or ``null``."""
+
+    kind: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class Comparison:
+    entity: str | None
+    key: str
+    op: str
+    value: Value
+
+
+@dataclass(frozen=True)
+class And:
+    clauses: tuple[Node, ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    clauses: tuple[Node, ...]
+
+
+Node = Union[Comparison, And, Or]
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    stripped_end = len(text.rstrip())
+    while pos < stripped_end:
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos:
+            raise FilterParseError(f"Unexpected character at position {pos}")
+        kind = match.lastgroup
+        assert kind is not None
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.index = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def _next(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise FilterParseError("Unexpected end of filter")
+        self.index += 1
+        return token
+
+    def _peek_word(self, *words: str) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == "word" and token[1].upper() in words
+
+    def _expect_punct(self, punct: str) -> None:
+        kind, text = self._next()
+        if kind != "punct" or text != punct:
+            raise FilterParseError(f"Expected '{punct}', got '{text}'")
+
+    def parse(self) -> Node:
+        node = self._parse_or()
+        if self._peek() is not None:
+            raise FilterParseError(f"Unexpected token '{self._peek()[1]}'")
+        return node
+
+    def _parse_or(self) -> Node:
+        clauses = [self._parse_and()]
+        while self._peek_word("OR"):
+            self.index += 1
+            clauses.append(self._parse_and())
+        return clauses[0] if len(clauses) == 1 else _flatten(Or, clauses)
+
+    def _parse_and(self) -> Node:
+        clauses = [self._parse_primary()]
+        while self._peek_word("AND"):
+            self.index += 1
+            clauses.append(self._parse_primary())
+        return clauses[0] if len(clauses) == 1 else _flatten(And, clauses)
+
+    def _parse_primary(self) -> Node:
+        token = self._peek()
+        if token == ("punct", "("):
+            self.index += 1
+            node = self._parse_or()
+            self._expect_punct(")")
+            return node
+        return self._parse_comparison()
+
+    def _parse_identifier(self) -> tuple[str | None, str]:
+        kind, text = self._next()
+        if kind == "backtick":
+            return None, text[1:-1]
+        if kind == "dstring":
+            return None, _unquote_double(text)
+        if kind != "word" or text.upper() in {"AND", "OR", "NOT", "IN", "LIKE", "ILIKE", "IS"}:
+            raise FilterParseError(f"Expected identifier, got '{text}'")
+        if self._peek() != ("punct", "."):
+            return None, text
+        entity = ENTITY_ALIASES.get(text.lower(), text.lower())
+        parts: list[str] = []
+        while self._peek() == ("punct", "."):
+            self.index += 1
+            part_kind, part_text = self._next()
+            if part_kind in {"word", "number"}:
+                parts.append(part_text)
+            elif part_kind == "backtick":
+                parts.append(part_text[1:-1])
+            elif part_kind == "dstring":
+                parts.append(_unquote_double(part_text))
+            else:
+                raise FilterParseError(f"Invalid key after '{text}.'")
+        return entity, ".".join(parts)
+
+    def _parse_operator(self) -> str:
+        kind, text = self._next()
+        if kind == "op":
+            return "!=" if text == "<>" else text
+        upper = text.upper() if kind == "word" else ""
+        if upper in {"LIKE", "ILIKE", "IN"}:
+            return upper
+        if upper == "NOT":
+            follow = self._next()
+            if follow[0] == "word" and follow[1].upper() in {"IN", "LIKE", "ILIKE"}:
+                return f"NOT {follow[1].upper()}"
+        if upper == "IS":
+            if self._peek_word("NOT"):
+                self.index += 1
+                return "IS NOT"
+            return "IS"
+        raise FilterParseError(f"Expected comparison operator, got '{text}'")
+
+    def _parse_value(self) -> Value:
+        kind, text = self._next()
+        if kind == "string":
+            return Value("string", text[1:-1].replace("''", "'"))
+        if kind == "dstring":
+            return Value("string", _unquote_double(text))
+        if kind == "number":
+            return Value("number", text)
+        if (kind, text) == ("punct", "("):
+            items = [self._parse_value()]
+            while self._peek() == ("punct", ","):
+                self.index += 1
+                items.append(self._parse_value())
+            self._expect_punct(")")
+            return Value("tuple", tuple(items))
+        raise FilterParseError(f"Expected value, got '{text}'")
+
+    def _parse_comparison(self) -> Comparison:
+        entity, key = self._parse_identifier()
+        op = self._parse_operator()
+        if op in {"IS", "IS NOT"}:
+            kind, text = self._next()
+            if kind != "word" or text.upper() != "NULL":
+                raise FilterParseError("Expected NULL after IS")
+            return Comparison(entity, key, f"{op} NULL", Value("null", None))
+        value = self._parse_value()
+        if (op in {"IN", "NOT IN"}) != (value.kind == "tuple"):
+            raise FilterParseError(f"Operator {op} does not accept this value")
+        return Comparison(entity, key, op, value)
+
+
+def _unquote_double(text: str) -> str:
+    return re.sub(r"\\(.)", r"\1", text[1:-1])
+
+
+def _flatten(node_type: type[And] | type[Or], clauses: list[Node]) -> Node:
+    flat: list[Node] = []
+    for clause in clauses:
+        if isinstance(clause, node_type):
+            flat.extend(clause.clauses)
+        else:
+            flat.append(clause)
+    return node_type(tuple(flat))
+
+
+@lru_cache(maxsize=4096)
+def parse_filter(text: str) -> Node:
+    """Parse an MLflow search filter string into an AST. Results are cached."""
+    return _Parser(text).parse()
+
+
+def _render_value(value: Value) -> str:
+    if value.kind == "string":
+        escaped = value.value.replace("'", "''")
+        return f"'{escaped}'"
+    if value.kind == "tuple":
+        return "(" + ", ".join(_render_value(item) for item in value.value) + ")"
+    return str(value.value)
+
+
+def _render_identifier(entity: str | None, key: str) -> str:
+    rendered_key = key if _PLAIN_KEY.fullmatch(key) else f"`{key}`"
+    return f"{entity}.{rendered_key}" if entity else rendered_key
+
+
+def render_filter(node: Node) -> str:
+    """Render an AST as a canonical filter string."""
+    if isinstance(node, Comparison):
+        identifier = _render_identifier(node.entity, node.key)
+        if node.value.kind == "null":
+            return f"{identifier} {node.op}"
+        return f"{identifier} {node.op} {_render_value(node.value)}"
+    if isinstance(node, And):
+        return " and ".join(
+            f"({render_filter(clause)})" if isinstance(clause, Or) else render_filter(clause)
+            for clause in node.clauses
+        )
+    return " or ".join(render_filter(clause) for clause in node.clauses)
+
+
+def tenant_predicate(tenant: str, tenant_tag_key: str = "tenant") -> Comparison:
+    return Comparison("tags", tenant_tag_key, "=", Value("string", tenant))
+
+
+def conjoin(node: Node | None, predicate: Comparison) -> Node:
+    """AND ``predicate`` onto ``node`` unless it is already a top-level conjunct."""
+    if node is None:
+        return predicate
+    clauses = node.clauses if isinstance(node, And) else (node,)
+    if predicate in clauses:
+        return node
+    return And((*clauses, predicate))
+
+
+@lru_cache(maxsize=4096)
+def tenant_scoped_filter(raw_filter: str, tenant: str, tenant_tag_key: str = "tenant") -> str:
+    """Return the canonical form of ``raw_filter`` restricted to ``tenant``.
+
+    The tenant predicate only counts as present when it is a top-level
+    conjunct; a match nested under ``or`` does not restrict the result set.
+    """
+    node = parse_filter(raw_filter) if raw_filter.strip() else None
+    return render_filter(conjoin(node, tenant_predicate(tenant, tenant_tag_key)))
+
+
+def _top_level_name_equals(node: Node | None) -> str | None:
+    clauses = node.clauses if isinstance(node, And) else ((node,) if node is not None else ())
+    for clause in clauses:
+        if (
+            isinstance(clause, Comparison)
+            and clause.entity is None
+            and clause.key == "name"
+            and clause.op == "="
+            and clause.value.kind == "string"
+        ):
+            return clause.value.value
+    return None
+
+
+def name_scoped_filter(
+    raw_filter: str,
+    names: frozenset[str],
+    *,
+    max_names: int = 0,
+    fallback: Comparison | None = None,
+) -> str | None:
+    """Return ``raw_filter`` restricted to registered model ``names``.
+
+    Used for model version searches, which are scoped by the tenant's registered
+    models. Returns ``None`` when no allowed name can match, so the caller can
+    answer without asking MLflow. A top-level ``name = '<allowed>'`` conjunct
+    already restricts the search and is left as the only name predicate.
+
+    When more than ``max_names`` names would be inlined, ``fallback`` is appended
+    instead of the ``name IN (...)`` list, which could overflow request-line limits.
+    """
+    node = parse_filter(raw_filter) if raw_filter.strip() else None
+    requested = _top_level_name_equals(node)
+    if requested is not None:
+        return render_filter(node) if requested in names else None
+    if not names:
+        return None
+    if fallback is not None and 0 < max_names < len(names):
+        return render_filter(conjoin(node, fallback))
+    predicate = Comparison(
+        None, "name", "IN", Value("tuple", tuple(Value("string", name) for name in sorted(names)))
+    )
+    return render_filter(conjoin(node, predicate))
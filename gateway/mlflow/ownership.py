@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class OwnershipCache:
+    """Bounded LRU cache of resource ownership with per-entry expiry.
+
+    Only resources with immutable, never-reused identifiers (run and experiment
+    IDs) should be cached: a name-keyed entry could outlive a delete and be
+    re-created by another tenant within the TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, resource_id: str) -> str | None:
+        key = (kind, resource_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        tenant, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return tenant
+
+    def put(self, kind: str, resource_id: str, tenant: str) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (kind, resource_id)
+        self._entries[key] = (tenant, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, resource_id: str) -> None:
+        self._entries.pop((kind, resource_id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RegisteredModelNameIndex:
+    """Per-tenant sets of registered model names with per-tenant expiry.
+
+    Seeded from a tenant-filtered ``registered-models/search`` and kept current
+    from create/rename/delete traffic through this gateway replica. Changes made
+    through other replicas become visible when the entry expires.
+    """
+
+    def __init__(
+        self,
+        max_tenants: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_tenants = max_tenants
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[set[str], float]] = OrderedDict()
+
+    def get(self, tenant: str) -> frozenset[str] | None:
+        entry = self._entries.get(tenant)
+        if entry is None:
+            return None
+        names, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[tenant]
+            return None
+        self._entries.move_to_end(tenant)
+        return frozenset(names)
+
+    def seed(self, tenant: str, names: set[str]) -> None:
+        if self.max_tenants <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[tenant] = (set(names), self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(tenant)
+        while len(self._entries) > self.max_tenants:
+            self._entries.popitem(last=False)
+
+    def add(self, tenant: str, name: str) -> None:
+        entry = self._entries.get(tenant)
+        if entry is not None:
+            entry[0].add(name)
+
+    def discard(self, tenant: str, name: str) -> None:
+        entry = self._entries.get(tenant)
+        if entry is not None:
+            entry[0].discard(name)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from gateway.mlflow.tenant import (
+    is_artifact_path,
+    is_experiment_create_path,
+    is_experiment_get_by_name_path,
+    is_experiment_get_path,
+    is_experiment_mutation_path,
+    is_experiments_search_path,
+    is_model_version_create_path,
+    is_model_version_get_path,
+    is_model_version_mutation_path,
+    is_model_versions_search_path,
+    is_registered_model_create_path,
+    is_registered_model_get_path,
+    is_registered_model_mutation_path,
+    is_registered_models_search_path,
+    is_runs_create_path,
+    is_runs_get_path,
+    is_runs_metrics_history_path,
+    is_runs_mutation_path,
+    is_runs_search_path,
+)
+
+
+ROUTE_CLASSES = ("create", "get", "search", "mutation", "artifact", "other")
+
+
+def route_class_for_path(path: str) -> str:
+    """Classify a gateway request path into one of ``ROUTE_CLASSES``.
+
+    Route classes group endpoints with similar cost and semantics so limits and
+    upstream behavior can be configured per class rather than per endpoint.
+    """
+    if (
+        is_runs_create_path(path)
+        or is_registered_model_create_path(path)
+        or is_model_version_create_path(path)
+        or is_experiment_create_path(path)
+    ):
+        return "create"
+    if (
+        is_runs_get_path(path)
+        or is_registered_model_get_path(path)
+        or is_model_version_get_path(path)
+        or is_runs_metrics_history_path(path)
+        or is_experiment_get_path(path)
+        or is_experiment_get_by_name_path(path)
+    ):
+        return "get"
+    if (
+        is_runs_search_path(path)
+        or is_registered_models_search_path(path)
+        or is_model_versions_search_path(path)
+        or is_experiments_search_path(path)
+    ):
+        return "search"
+    if (
+        is_runs_mutation_path(path)
+        or is_registered_model_mutation_path(path)
+        or is_model_version_mutation_path(path)
+        or is_experiment_mutation_path(path)
+    ):
+        return "mutation"
+    if is_artifact_path(path):
+        return "artifact"
+    return "other"
@@ -2,6 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
+from gateway.mlflow.filters import (
+    FilterParseError,
+    name_scoped_filter,
+    tenant_predicate,
+    tenant_scoped_filter,
+)
+
 
 class TenantPayloadError(Exception):
     pass
@@ -39,6 +46,20 @@ MODEL_VERSION_MUTATION_SUFFIXES = {
     "model-versions/delete-tag",
 }
 
+EXPERIMENT_MUTATION_SUFFIXES = {
+    "experiments/update",
+    "experiments/delete",
+    "experiments/restore",
+    "experiments/set-experiment-tag",
+    "experiments/delete-experiment-tag",
+}
+
+RUNS_METRICS_HISTORY_SUFFIXES = {
+    "metrics/get-history",
+    "metrics/get-history-bulk",
+    "metrics/get-history-bulk-interval",
+}
+
 
 def _normalize_tags_to_list(tags: Any) -> list[dict[str, Any]]:
     if tags is None:
@@ -146,6 +167,54 @@ def is_model_version_mutation_path(path: str) -> bool:
     }
 
 
+def is_experiment_create_path(path: str) -> bool:
+    return path in {
+        "/api/2.0/mlflow/experiments/create",
+        "/api/2.1/mlflow/experiments/create",
+    }
+
+
+def is_experiment_get_path(path: str) -> bool:
+    return path in {
+        "/api/2.0/mlflow/experiments/get",
+        "/api/2.1/mlflow/experiments/get",
+    }
+
+
+def is_experiment_get_by_name_path(path: str) -> bool:
+    return path in {
+        "/api/2.0/mlflow/experiments/get-by-name",
+        "/api/2.1/mlflow/experiments/get-by-name",
+    }
+
+
+def is_experiments_search_path(path: str) -> bool:
+    return path in {
+        "/api/2.0/mlflow/experiments/search",
+        "/api/2.1/mlflow/experiments/search",
+    }
+
+
+def is_experiment_mutation_path(path: str) -> bool:
+    return path in {
+        *(_v_path("2.0", suffix) for suffix in EXPERIMENT_MUTATION_SUFFIXES),
+        *(_v_path("2.1", suffix) for suffix in EXPERIMENT_MUTATION_SUFFIXES),
+    }
+
+
+def is_runs_metrics_history_path(path: str) -> bool:
+    """Metric history reads, which may reference many runs in a single request."""
+    return path in {
+        *(_v_path("2.0", suffix) for suffix in RUNS_METRICS_HISTORY_SUFFIXES),
+        *(_v_path("2.1", suffix) for suffix in RUNS_METRICS_HISTORY_SUFFIXES),
+        *(f"/ajax-api/2.0/mlflow/{suffix}" for suffix in RUNS_METRICS_HISTORY_SUFFIXES),
+    }
+
+
+def is_artifact_path(path: str) -> bool:
+    return path.startswith(("/api/2.0/mlflow-artifacts/", "/ajax-api/2.0/mlflow-artifacts/"))
+
+
 def ensure_tenant_tag_for_create(
     payload: dict[str, Any], tenant: str, tenant_tag_key: str = "tenant"
 ) -> dict[str, Any]:
@@ -170,56 +239,77 @@ def tenant_filter_clause(tenant: str, tenant_tag_key: str = "tenant") -> str:
     return f"tags.{tenant_tag_key} = '{safe_tenant}'"
 
 
-def ensure_tenant_filter_for_search(
-    payload: dict[str, Any], tenant: str, tenant_tag_key: str = "tenant"
+def _ensure_tenant_filter(
+    payload: dict[str, Any], field_name: str, tenant: str, tenant_tag_key: str
 ) -> dict[str, Any]:
-    clause = tenant_filter_clause(tenant, tenant_tag_key)
-    raw_filter = payload.get("filter")
+    raw_filter = payload.get(field_name)
 
     if raw_filter is None:
-        payload["filter"] = clause
-        return payload
-
+        raw_filter = ""
     if not isinstance(raw_filter, str):
-        raise TenantPayloadError("Invalid MLflow payload: filter must be a string")
+        raise TenantPayloadError(f"Invalid MLflow payload: {field_name} must be a string")
 
-    existing = raw_filter.strip()
-    if not existing:
-        payload["filter"] = clause
-        return payload
+    try:
+        payload[field_name] = tenant_scoped_filter(raw_filter, tenant, tenant_tag_key)
+    except FilterParseError as exc:
+        raise TenantPayloadError(f"Invalid MLflow payload: unsupported {field_name}: {exc}") from exc
+    return payload
 
-    if clause in existing:
-        payload["filter"] = existing
-        return payload
 
-    payload["filter"] = f"({existing}) and {clause}"
-    return payload
+def ensure_tenant_filter_for_search(
+    payload: dict[str, Any], tenant: str, tenant_tag_key: str = "tenant"
+) -> dict[str, Any]:
+    return _ensure_tenant_filter(payload, "filter", tenant, tenant_tag_key)
 
 
-def ensure_tenant_filter_for_registered_models_search(
+def ensure_tenant_filter_for_experiments_search(
     payload: dict[str, Any], tenant: str, tenant_tag_key: str = "tenant"
 ) -> dict[str, Any]:
-    clause = tenant_filter_clause(tenant, tenant_tag_key)
-    raw_filter = payload.get("filter_string")
+    return _ensure_tenant_filter(payload, "filter", tenant, tenant_tag_key)
 
-    if raw_filter is None:
-        payload["filter_string"] = clause
-        return payload
 
+def ensure_tenant_filter_for_model_versions_search(
+    payload: dict[str, Any], tenant: str, tenant_tag_key: str = "tenant"
+) -> dict[str, Any]:
+    return _ensure_tenant_filter(payload, "filter", tenant, tenant_tag_key)
+
+
+def ensure_name_filter_for_model_versions_search(
+    payload: dict[str, Any],
+    model_names: frozenset[str],
+    *,
+    max_names: int = 0,
+    tenant: str | None = None,
+    tenant_tag_key: str = "tenant",
+) -> dict[str, Any] | None:
+    """Restrict a model version search to ``model_names``; ``None`` if nothing can match.
+
+    With ``tenant`` set, tenants with more than ``max_names`` models are scoped by
+    the tenant tag instead of an inlined name list.
+    """
+    raw_filter = payload.get("filter")
+    if raw_filter is None:
+        raw_filter = ""
     if not isinstance(raw_filter, str):
-        raise TenantPayloadError("Invalid MLflow payload: filter_string must be a string")
+        raise TenantPayloadError("Invalid MLflow payload: filter must be a string")
 
-    existing = raw_filter.strip()
-    if not existing:
-        payload["filter_string"] = clause
-        return payload
+    fallback = tenant_predicate(tenant, tenant_tag_key) if tenant is not None else None
+    try:
+        scoped = name_scoped_filter(
+            raw_filter, model_names, max_names=max_names, fallback=fallback
+        )
+    except FilterParseError as exc:
+        raise TenantPayloadError(f"Invalid MLflow payload: unsupported filter: {exc}") from exc
+    if scoped is None:
+        return None
+    payload["filter"] = scoped
+    return payload
 
-    if clause in existing:
-        payload["filter_string"] = existing
-        return payload
 
-    payload["filter_string"] = f"({existing}) and {clause}"
-    return payload
+def ensure_tenant_filter_for_registered_models_search(
+    payload: dict[str, Any], tenant: str, tenant_tag_key: str = "tenant"
+) -> dict[str, Any]:
+    return _ensure_tenant_filter(payload, "filter_string", tenant, tenant_tag_key)
 
 
 def extract_tenant_tag_from_run_response(
@@ -250,3 +340,23 @@ def extract_tenant_tag_from_model_version_response(
     if not isinstance(model_version, dict):
         return None
     return _extract_tenant_from_tags(model_version.get("tags"), tenant_tag_key)
+
+
+def extract_tenant_tag_from_experiment_response(
+    payload: dict[str, Any], tenant_tag_key: str = "tenant"
+) -> str | None:
+    experiment = payload.get("experiment")
+    if not isinstance(experiment, dict):
+        return None
+    return _extract_tenant_from_tags(experiment.get("tags"), tenant_tag_key)
+
+
+def extract_experiment_id_from_response(payload: dict[str, Any]) -> str | None:
+    """Experiment ID from an ``experiments/create`` or ``experiments/get*`` response."""
+    experiment = payload.get("experiment")
+    raw = experiment.get("experiment_id") if isinstance(experiment, dict) else None
+    if raw is None:
+        raw = payload.get("experiment_id")
+    if isinstance(raw, (str, int)) and not isinstance(raw, bool) and str(raw).strip():
+        return str(raw).strip()
+    return None
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+class SearchVerificationError(Exception):
+    pass
+
+
+_STRUCTURAL = re.compile(r'[{}\[\]",:]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_ELEMENT_SEPARATORS = re.compile(r"[\s,]*")
+
+_PREFIX, _ARRAY, _TAIL = range(3)
+
+
+class JSONArrayFieldScanner:
+    """Incrementally split the elements of one top-level array field out of a JSON object.
+
+    ``feed`` returns ``("raw", text, None)`` events for everything outside the
+    array (including its brackets) and ``("element", text, value)`` events for
+    each decoded array element, so only one element is materialised at a time.
+    Separators between elements are not emitted; callers re-join the elements
+    they keep.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._mode = _PREFIX
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._expect_key = False
+        self._last_key: str | None = None
+        self._value_key: str | None = None
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> list[tuple[str, str, Any]]:
+        return self._feed_text(self._utf8.decode(chunk))
+
+    def _feed_text(self, text: str) -> list[tuple[str, str, Any]]:
+        events: list[tuple[str, str, Any]] = []
+        if self._mode == _TAIL:
+            if text:
+                events.append(("raw", text, None))
+            return events
+        self._buf += text
+        if self._mode == _PREFIX:
+            self._scan_prefix(events)
+        if self._mode == _ARRAY:
+            self._scan_array(events, final=False)
+        return events
+
+    def close(self) -> list[tuple[str, str, Any]]:
+        events = self._feed_text(self._utf8.decode(b"", final=True))
+        if self._mode == _ARRAY:
+            self._scan_array(events, final=True)
+        if self._mode == _ARRAY or self._in_string:
+            raise SearchVerificationError("Truncated or malformed search response")
+        if self._mode == _PREFIX and self._buf:
+            events.append(("raw", self._buf, None))
+            self._buf = ""
+        return events
+
+    def _scan_prefix(self, events: list[tuple[str, str, Any]]) -> None:
+        buf = self._buf
+        pos = self._pos
+        while pos < len(buf):
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                index = match.start()
+                if buf[index] == "\\":
+                    if index + 1 >= len(buf):
+                        pos = index
+                        break
+                    pos = index + 2
+                    continue
+                pos = index + 1
+                self._in_string = False
+                if self._depth == 1 and self._expect_key:
+                    self._last_key = json.loads(buf[self._string_start : pos])
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            index = match.start()
+            char = buf[index]
+            pos = index + 1
+            if char == '"':
+                self._in_string = True
+                self._string_start = index
+            elif char in "{[":
+                if char == "[" and self._depth == 1 and self._value_key == self.field:
+                    events.append(("raw", buf[:pos], None))
+                    self._mode = _ARRAY
+                    self._buf = buf[pos:]
+                    self._pos = 0
+                    return
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+            elif char in "}]":
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                self._expect_key = True
+            elif char == ":" and self._depth == 1:
+                self._expect_key = False
+                self._value_key = self._last_key
+        self._pos = pos
+
+    def _scan_array(self, events: list[tuple[str, str, Any]], *, final: bool) -> None:
+        buf = self._buf
+        pos = self._pos
+        while True:
+            pos = _ELEMENT_SEPARATORS.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                events.append(("raw", buf[pos:], None))
+                self._mode = _TAIL
+                self._buf = ""
+                self._pos = 0
+                return
+            if not final and len(buf) < self._retry_at:
+                break
+            try:
+                value, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Incomplete element: wait until the pending bytes double before retrying,
+                # which keeps re-parsing of an element spanning many chunks linear overall.
+                self._retry_at = len(buf) + (len(buf) - pos)
+                break
+            if end >= len(buf) and not final and not isinstance(value, (dict, list)):
+                # A scalar at the end of the buffer (for example a number) may still grow.
+                break
+            self._retry_at = 0
+            events.append(("element", buf[pos:end], value))
+            pos = end
+        # Drop text of elements already emitted so memory is bounded by one element.
+        self._buf = buf[pos:]
+        self._pos = 0
+
+
+@dataclass
+class SearchVerificationStats:
+    responses_checked: int = 0
+    rows_checked: int = 0
+    rows_dropped: int = 0
+    responses_failed: int = 0
+
+
+async def verify_search_response(
+    chunks: AsyncIterator[bytes],
+    field: str,
+    row_tenant: Callable[[dict[str, Any]], str | None],
+    tenant: str,
+    stats: SearchVerificationStats,
+) -> AsyncIterator[bytes]:
+    """Re-emit a streamed search response keeping only rows tagged with ``tenant``.
+
+    Rows are decoded one at a time; rows that are not objects or carry another
+    tenant are dropped and counted in ``stats.rows_dropped``.
+    """
+    scanner = JSONArrayFieldScanner(field)
+    stats.responses_checked += 1
+    kept = 0
+
+    def _render(events: list[tuple[str, str, Any]]) -> bytes:
+        nonlocal kept
+        parts: list[str] = []
+        for kind, text, row in events:
+            if kind == "raw":
+                parts.append(text)
+                continue
+            stats.rows_checked += 1
+            if not isinstance(row, dict) or row_tenant(row) != tenant:
+                stats.rows_dropped += 1
+                continue
+            if kept:
+                parts.append(",")
+            parts.append(text)
+            kept += 1
+        return "".join(parts).encode()
+
+    async for chunk in chunks:
+        rendered = _render(scanner.feed(chunk))
+        if rendered:
+            yield rendered
+    rendered = _render(scanner.close())
+    if rendered:
+        yield rendered
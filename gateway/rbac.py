@@ -3,6 +3,12 @@ from __future__ import annotations
 from typing import Any
 
 from gateway.mlflow.tenant import (
+    is_artifact_path,
+    is_experiment_create_path,
+    is_experiment_get_by_name_path,
+    is_experiment_get_path,
+    is_experiment_mutation_path,
+    is_experiments_search_path,
     is_model_version_create_path,
     is_model_version_get_path,
     is_model_version_mutation_path,
@@ -13,6 +19,7 @@ from gateway.mlflow.tenant import (
     is_registered_models_search_path,
     is_runs_create_path,
     is_runs_get_path,
+    is_runs_metrics_history_path,
     is_runs_mutation_path,
     is_runs_search_path,
 )
@@ -63,7 +70,13 @@ def _collect_role_candidates(claims: dict[str, Any], role_claims: list[str]) ->
     return [c for c in candidates if c], present_claims
 
 
-def required_role_for_request(path: str) -> str | None:
+# Artifact routes are classified by method: downloads and listings read, the rest write.
+ARTIFACT_READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+def required_role_for_request(path: str, method: str = "GET") -> str | None:
+    if is_artifact_path(path):
+        return "viewer" if method.upper() in ARTIFACT_READ_METHODS else "contributor"
     if (
         is_runs_create_path(path)
         or is_runs_mutation_path(path)
@@ -71,9 +84,17 @@ def required_role_for_request(path: str) -> str | None:
         or is_registered_model_mutation_path(path)
         or is_model_version_create_path(path)
         or is_model_version_mutation_path(path)
+        or is_experiment_create_path(path)
+        or is_experiment_mutation_path(path)
     ):
         return "contributor"
-    if is_runs_get_path(path) or is_runs_search_path(path):
+    if is_runs_get_path(path) or is_runs_search_path(path) or is_runs_metrics_history_path(path):
+        return "viewer"
+    if (
+        is_experiment_get_path(path)
+        or is_experiment_get_by_name_path(path)
+        or is_experiments_search_path(path)
+    ):
         return "viewer"
     if (
         is_registered_model_get_path(path)
@@ -122,8 +143,9 @@ def enforce_rbac(
     contributor_aliases: str = "",
     admin_aliases: str = "",
     default_deny: bool = False,
+    method: str = "GET",
 ) -> None:
-    required = required_role_for_request(path)
+    required = required_role_for_request(path, method)
     if required is None:
         if default_deny:
             raise RBACError(f"RBAC default deny: endpoint not covered by policy: {path}")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+import httpx
+
+
+# Failures where the request was not processed (or the connection broke before a
+# response), so an idempotent call can safely be sent again.
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+class RetryBudget:
+    """Cap retries (and hedges) to a fraction of recent request volume.
+
+    Over the last ``window_seconds``, retries are allowed while they stay below
+    ``ratio`` times the number of requests plus ``min_per_second`` per second of
+    window, so a failing upstream sees at most a bounded amount of extra load.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        min_per_second: float,
+        window_seconds: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window_seconds = window_seconds
+        self._clock = clock
+        # [second, requests, retries] per one-second bucket.
+        self._buckets: deque[list[int]] = deque()
+
+    def _current_bucket(self) -> list[int]:
+        second = int(self._clock())
+        while self._buckets and self._buckets[0][0] <= second - self.window_seconds:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+    def record_request(self) -> None:
+        self._current_bucket()[1] += 1
+
+    def try_acquire(self) -> bool:
+        bucket = self._current_bucket()
+        requests = sum(b[1] for b in self._buckets)
+        retries = sum(b[2] for b in self._buckets)
+        allowance = self.ratio * requests + self.min_per_second * self.window_seconds
+        if retries >= allowance:
+            return False
+        bucket[2] += 1
+        return True
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class LatencyTracker:
+    """Rolling sample of recent latencies with a cheaply refreshed percentile."""
+
+    def __init__(self, size: int = 1024, refresh_every: int = 64):
+        self._samples: deque[float] = deque(maxlen=size)
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, latency_ms: float) -> None:
+        self._samples.append(latency_ms)
+        self._since_refresh += 1
+
+    def percentile(self, pct: float) -> float | None:
+        if not self._samples:
+            return None
+        if self._since_refresh >= self._refresh_every or len(self._sorted) != len(self._samples):
+            self._sorted = sorted(self._samples)
+            self._since_refresh = 0
+        index = min(len(self._sorted) - 1, int(len(self._sorted) * pct / 100))
+        return self._sorted[index]
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._sorted = []
+        self._since_refresh = 0
+
+
+def backoff_delay(attempt: int, base_ms: float, max_ms: float) -> float:
+    """Full-jitter exponential backoff in seconds for retry ``attempt`` (0-based)."""
+    return random.uniform(0, min(max_ms, base_ms * (2**attempt))) / 1000
+
+
+async def first_response(tasks: Iterable[asyncio.Task[httpx.Response]]) -> httpx.Response:
+    """Return the first successful response among racing ``tasks``.
+
+    Losing tasks are cancelled and any response they already produced is
+    closed. If every task fails, the last error is raised.
+    """
+    pending = set(tasks)
+    winner: asyncio.Task[httpx.Response] | None = None
+    error: BaseException | None = None
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if winner is None:
+                        winner = task
+                        continue
+                    await task.result().aclose()
+                else:
+                    error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, httpx.Response):
+                await result.aclose()
+    if winner is None:
+        assert error is not None
+        raise error
+    return winner.result()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import importlib.util
+import random
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
+
+import httpx
+
+from gateway.config import settings
+
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+class ConsistentHashRing:
+    """Consistent-hash ring with virtual nodes mapping keys (tenants) to backends.
+
+    Adding or removing a backend only remaps the tenants whose hash falls on
+    that backend's virtual nodes; everyone else stays on their current shard.
+    """
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = 128):
+        ring: list[tuple[int, str]] = []
+        for node in nodes:
+            for index in range(virtual_nodes):
+                ring.append((self._hash(f"{node}#{index}"), node))
+        if not ring:
+            raise ValueError("ConsistentHashRing requires at least one node")
+        ring.sort()
+        self._hashes = [point for point, _ in ring]
+        self._nodes = [node for _, node in ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def node_for(self, key: str) -> str:
+        index = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._nodes[index]
+
+
+@lru_cache(maxsize=8)
+def _hash_ring(backends: tuple[str, ...]) -> ConsistentHashRing:
+    return ConsistentHashRing(backends)
+
+
+def _normalize_base_url(base_url: str) -> str:
+    return base_url.rstrip("/")
+
+
+def upstream_base_url_for_tenant(tenant: str | None) -> str:
+    """Resolve the MLflow backend serving ``tenant``.
+
+    ``GW_TENANT_BACKENDS`` pins tenants to a backend; other tenants are spread
+    over ``GW_UPSTREAM_BACKENDS`` by consistent hashing. Without either, all
+    traffic goes to ``GW_TARGET_BASE_URL``.
+    """
+    if tenant is not None:
+        mapped = settings.tenant_backends.get(tenant)
+        if mapped:
+            return _normalize_base_url(mapped)
+        if settings.upstream_backends:
+            backends = tuple(sorted({_normalize_base_url(b) for b in settings.upstream_backends}))
+            return _hash_ring(backends).node_for(tenant)
+    return _normalize_base_url(settings.target_base_url)
+
+
+def primary_upstream_base_urls() -> list[str]:
+    """Every distinct primary backend tenants may be routed to."""
+    base_urls = [_normalize_base_url(b) for b in settings.upstream_backends]
+    if not base_urls:
+        base_urls.append(_normalize_base_url(settings.target_base_url))
+    base_urls.extend(_normalize_base_url(b) for b in settings.tenant_backends.values())
+    return list(dict.fromkeys(base_urls))
+
+
+def configured_upstream_base_urls() -> list[str]:
+    """Every distinct backend the gateway may send traffic to, replicas included."""
+    base_urls = primary_upstream_base_urls()
+    for primary in list(base_urls):
+        base_urls.extend(read_replicas_for(primary))
+    return list(dict.fromkeys(base_urls))
+
+
+def read_replicas_for(primary_base_url: str) -> list[str]:
+    """Read replicas configured for a primary backend (``GW_UPSTREAM_READ_REPLICAS``)."""
+    for primary, replicas in settings.upstream_read_replicas.items():
+        if _normalize_base_url(primary) == primary_base_url:
+            return [_normalize_base_url(replica) for replica in replicas]
+    return []
+
+
+def sibling_replicas(base_url: str) -> list[str]:
+    """Other read replicas of the primary that ``base_url`` is a replica of."""
+    for replicas in settings.upstream_read_replicas.values():
+        normalized = [_normalize_base_url(replica) for replica in replicas]
+        if base_url in normalized:
+            return [replica for replica in normalized if replica != base_url]
+    return []
+
+
+def rebase_request(
+    upstream_request: httpx.Request, from_base_url: str, to_base_url: str
+) -> httpx.Request:
+    """Copy a request built against ``from_base_url`` so it targets ``to_base_url``."""
+    source = httpx.URL(from_base_url)
+    target = httpx.URL(to_base_url)
+    suffix = upstream_request.url.raw_path[len(source.raw_path.rstrip(b"/")) :]
+    url = upstream_request.url.copy_with(
+        scheme=target.scheme,
+        netloc=target.netloc,
+        raw_path=target.raw_path.rstrip(b"/") + suffix,
+    )
+    headers = [(k, v) for k, v in upstream_request.headers.raw if k.lower() != b"host"]
+    return httpx.Request(
+        upstream_request.method,
+        url,
+        headers=headers,
+        content=upstream_request.content,
+        extensions=upstream_request.extensions,
+    )
+
+
+class LeastOutstandingBalancer:
+    """Pick the backend with the fewest in-flight upstream calls.
+
+    Calls are counted from dispatch until response headers arrive, which is
+    where MLflow does its database work. Ties are broken randomly so idle
+    replicas share load evenly.
+    """
+
+    def __init__(self) -> None:
+        self._outstanding: dict[str, int] = {}
+
+    def outstanding(self, base_url: str) -> int:
+        return self._outstanding.get(base_url, 0)
+
+    def pick(self, candidates: Sequence[str]) -> str:
+        fewest = min(self.outstanding(candidate) for candidate in candidates)
+        return random.choice([c for c in candidates if self.outstanding(c) == fewest])
+
+    @contextmanager
+    def track(self, base_url: str) -> Iterator[None]:
+        self._outstanding[base_url] = self._outstanding.get(base_url, 0) + 1
+        try:
+            yield
+        finally:
+            remaining = self._outstanding[base_url] - 1
+            if remaining:
+                self._outstanding[base_url] = remaining
+            else:
+                del self._outstanding[base_url]
+
+
+class RecentWrites:
+    """Per-tenant read-your-writes window.
+
+    After a tenant writes, its reads go to the primary for ``window_seconds``
+    so they are not served by a replica that has not caught up yet.
+    """
+
+    def __init__(self, window_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._expires: dict[str, float] = {}
+
+    def mark(self, tenant: str) -> None:
+        now = self._clock()
+        if len(self._expires) > 1024:
+            self._expires = {t: e for t, e in self._expires.items() if e > now}
+        self._expires[tenant] = now + self.window_seconds
+
+    def active(self, tenant: str) -> bool:
+        expires = self._expires.get(tenant)
+        return expires is not None and expires > self._clock()
+
+    def clear(self) -> None:
+        self._expires.clear()
+
+
+def upstream_transport_for(base_url: str) -> str:
+    """Transport spec for a backend: ``http1`` (default), ``http2`` or ``uds:<socket path>``."""
+    for configured, transport in settings.upstream_transports.items():
+        if _normalize_base_url(configured) == base_url:
+            return transport.strip()
+    return "http1"
+
+
+def _build_client(base_url: str) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.upstream_max_connections,
+        max_keepalive_connections=settings.upstream_max_keepalive_connections,
+    )
+    transport = upstream_transport_for(base_url)
+    if transport == "http1":
+        return httpx.AsyncClient(follow_redirects=False, limits=limits)
+    if transport == "http2":
+        if importlib.util.find_spec("h2") is None:
+            raise RuntimeError(
+                f"HTTP/2 transport configured for {base_url} but the 'h2' package is not "
+                "installed; install mlflow-enterprise-gateway[http2]"
+            )
+        # Cleartext upstreams need prior-knowledge h2c; https negotiates HTTP/2 via ALPN.
+        return httpx.AsyncClient(
+            follow_redirects=False,
+            limits=limits,
+            http1=httpx.URL(base_url).scheme == "https",
+            http2=True,
+        )
+    if transport.startswith("uds:") and transport[4:]:
+        return httpx.AsyncClient(
+            follow_redirects=False,
+            transport=httpx.AsyncHTTPTransport(uds=transport[4:], limits=limits),
+        )
+    raise ValueError(f"Unsupported upstream transport for {base_url}: {transport!r}")
+
+
+def get_upstream_client(base_url: str) -> httpx.AsyncClient:
+    """Return the pooled client for one MLflow backend.
+
+    Each backend gets its own connection pool so a slow shard cannot exhaust
+    connections needed by the others. Streamed pass-through responses outlive
+    the request handler, so clients are long-lived; timeouts are per request.
+    """
+    key = _normalize_base_url(base_url)
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = _build_client(key)
+        _clients[key] = client
+    return client
+
+
+def register_upstream_client(base_url: str, client: httpx.AsyncClient) -> None:
+    """Use ``client`` for ``base_url`` instead of building one, e.g. for an in-process upstream."""
+    _clients[_normalize_base_url(base_url)] = client
+
+
+async def close_upstream_clients() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
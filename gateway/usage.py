@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+"""Per-tenant usage accounting for chargeback and capacity planning.
+
+Each tenant has one ``TenantUsage`` of plain integer counters. The request
+handler sets the caller's ``TenantUsage`` in ``current_usage``, and the code
+that reads bodies, calls MLflow, runs preflights or hits a cache increments it
+in place. ``UsageAccounting`` flushes the counters accumulated since the
+previous flush to the audit log as ``usage`` summary events and serves the
+running totals to the admin endpoint.
+"""
+
+import asyncio
+import logging
+import time
+from array import array
+from collections.abc import Callable
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import Any
+
+from gateway.mlflow.routes import ROUTE_CLASSES
+
+
+logger = logging.getLogger(__name__)
+
+USAGE_PATH = "/gateway/v1/usage"
+ROUTE_CLASS_INDEX = {route_class: index for index, route_class in enumerate(ROUTE_CLASSES)}
+# Tenants beyond ``max_tenants`` are accounted here, so a flood of made-up tenant
+# headers (auth off) cannot grow the table without bound.
+OVERFLOW_TENANT = "_overflow"
+COUNTERS = (
+    "request_bytes",
+    "response_bytes",
+    "upstream_calls",
+    "upstream_us",
+    "preflights",
+    "cache_hits",
+)
+
+
+class TenantUsage:
+    """Counters for one tenant. ``requests`` is indexed by ``ROUTE_CLASS_INDEX``."""
+
+    __slots__ = ("requests", *COUNTERS)
+
+    def __init__(self) -> None:
+        self.requests = array("Q", bytes(8 * len(ROUTE_CLASSES)))
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.upstream_calls = 0
+        self.upstream_us = 0
+        self.preflights = 0
+        self.cache_hits = 0
+
+    def count_request(self, route_class: str) -> None:
+        self.requests[ROUTE_CLASS_INDEX[route_class]] += 1
+
+    def copy(self) -> TenantUsage:
+        copied = TenantUsage()
+        copied.requests = array("Q", self.requests)
+        for name in COUNTERS:
+            setattr(copied, name, getattr(self, name))
+        return copied
+
+    def minus(self, earlier: TenantUsage | None) -> TenantUsage:
+        if earlier is None:
+            return self.copy()
+        delta = TenantUsage()
+        delta.requests = array("Q", (a - b for a, b in zip(self.requests, earlier.requests)))
+        for name in COUNTERS:
+            setattr(delta, name, getattr(self, name) - getattr(earlier, name))
+        return delta
+
+    def is_empty(self) -> bool:
+        return not any(self.requests) and not any(getattr(self, name) for name in COUNTERS)
+
+    def as_dict(self) -> dict[str, Any]:
+        requests = dict(zip(ROUTE_CLASSES, self.requests))
+        return {
+            "requests": {**requests, "total": sum(self.requests)},
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "upstream_calls": self.upstream_calls,
+            "upstream_ms": round(self.upstream_us / 1000, 3),
+            "preflights": self.preflights,
+            "cache_hits": self.cache_hits,
+        }
+
+
+# Requests without a resolved tenant count into this throwaway instance, so callers
+# can always increment ``current_usage.get()`` without a ``None`` check.
+_UNACCOUNTED = TenantUsage()
+current_usage: ContextVar[TenantUsage] = ContextVar("gateway_usage", default=_UNACCOUNTED)
+
+
+class UsageAccounting:
+    """Per-tenant usage since start, flushed periodically as audit summary events."""
+
+    def __init__(
+        self,
+        *,
+        max_tenants: int,
+        flush_interval_seconds: float,
+        emit: Callable[[str, datetime, datetime, dict[str, Any]], None],
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ):
+        self.max_tenants = max(1, max_tenants)
+        self.flush_interval_seconds = flush_interval_seconds
+        self._emit = emit
+        self._clock = clock
+        self._tenants: dict[str, TenantUsage] = {}
+        self._flushed: dict[str, TenantUsage] = {}
+        self.started_at = clock()
+        self.last_flush_at = self.started_at
+        self._task: asyncio.Task[None] | None = None
+
+    def for_tenant(self, tenant: str) -> TenantUsage:
+        usage = self._tenants.get(tenant)
+        if usage is None:
+            if len(self._tenants) >= self.max_tenants:
+                tenant = OVERFLOW_TENANT
+                usage = self._tenants.get(tenant)
+            if usage is None:
+                usage = self._tenants[tenant] = TenantUsage()
+        return usage
+
+    def snapshot(self, tenant: str | None = None) -> dict[str, Any]:
+        tenants = self._tenants if tenant is None else {
+            name: usage for name, usage in self._tenants.items() if name == tenant
+        }
+        return {
+            "since": self.started_at.isoformat(),
+            "last_flush": self.last_flush_at.isoformat(),
+            "tenants": {name: usage.as_dict() for name, usage in sorted(tenants.items())},
+        }
+
+    def flush(self) -> int:
+        """Emit one summary event per tenant with usage since the last flush."""
+        window_start, window_end = self.last_flush_at, self._clock()
+        emitted = 0
+        for tenant, usage in list(self._tenants.items()):
+            delta = usage.minus(self._flushed.get(tenant))
+            if delta.is_empty():
+                continue
+            self._emit(tenant, window_start, window_end, delta.as_dict())
+            self._flushed[tenant] = usage.copy()
+            emitted += 1
+        self.last_flush_at = window_end
+        return emitted
+
+    def start(self) -> None:
+        if self.flush_interval_seconds <= 0:
+            return
+
+        async def _run() -> None:
+            while True:
+                await asyncio.sleep(self.flush_interval_seconds)
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("Usage flush failed")
+
+        self._task = asyncio.create_task(_run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and emit what accumulated since the last one."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+
+    def clear(self) -> None:
+        self._tenants.clear()
+        self._flushed.clear()
+        self.started_at = self.last_flush_at = self._clock()
+
+
+def elapsed_us(started: float) -> int:
+    return int((time.perf_counter() - started) * 1_000_000)
@@ -0,0 +1,33 @@
+import pytest
+
+from gateway.main import (
+    _circuit_breakers,
+    _health_checker,
+    _model_names,
+    _ownership_cache,
+    _read_latency,
+    _recent_writes,
+    _retry_budget,
+    _usage,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_gateway_caches():
+    _ownership_cache.clear()
+    _recent_writes.clear()
+    _health_checker.clear()
+    _circuit_breakers.clear()
+    _retry_budget.clear()
+    _read_latency.clear()
+    _model_names.clear()
+    _usage.clear()
+    yield
+    _ownership_cache.clear()
+    _recent_writes.clear()
+    _health_checker.clear()
+    _circuit_breakers.clear()
+    _retry_budget.clear()
+    _read_latency.clear()
+    _model_names.clear()
+    _usage.clear()
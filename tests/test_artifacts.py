@@ -0,0 +1,145 @@
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, app
+from gateway.mlflow.artifacts import (
+    ArtifactOwner,
+    ArtifactPathError,
+    artifact_owner_for_path,
+    artifact_path_for_request,
+)
+from gateway.rbac import required_role_for_request
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "artifact_path_prefix", "")
+
+
+ARTIFACT_PATH = "/api/2.0/mlflow-artifacts/artifacts/1/r-1/artifacts/model.pkl"
+
+
+def _seed_owner(tenant: str) -> None:
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), tenant)
+    _ownership_cache.put("run", "r-1", tenant)
+
+
+def test_artifact_path_resolution():
+    assert artifact_path_for_request(ARTIFACT_PATH, {}) == "1/r-1/artifacts/model.pkl"
+    assert (
+        artifact_path_for_request("/api/2.0/mlflow-artifacts/artifacts", {"path": "1/r-1"})
+        == "1/r-1"
+    )
+    assert (
+        artifact_path_for_request("/ajax-api/2.0/mlflow-artifacts/mpu/create/1/r-1/a.bin", {})
+        == "1/r-1/a.bin"
+    )
+    assert artifact_owner_for_path("1/r-1/artifacts/model.pkl") == ArtifactOwner("1", "r-1")
+    assert artifact_owner_for_path("1/models/m-1/model.pkl") == ArtifactOwner("1")
+    assert artifact_owner_for_path("root/1/r-1", root_prefix="root") == ArtifactOwner("1", "r-1")
+
+    for path in ("", "1/../2/r-9", "other/1/r-1"):
+        with pytest.raises(ArtifactPathError):
+            artifact_owner_for_path(path, root_prefix="root" if path.startswith("other") else "")
+
+
+def test_artifact_rbac_depends_on_method():
+    assert required_role_for_request(ARTIFACT_PATH, "GET") == "viewer"
+    assert required_role_for_request(ARTIFACT_PATH, "PUT") == "contributor"
+    assert required_role_for_request(ARTIFACT_PATH, "DELETE") == "contributor"
+
+
+def test_artifact_download_denied_for_foreign_run_without_upstream_call():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+    _ownership_cache.put("run", "r-1", "tenant-b")
+
+    with respx.mock(assert_all_called=False) as mock:
+        download = mock.get(f"http://mlflow:5000{ARTIFACT_PATH}")
+        client = TestClient(app)
+        response = client.get(ARTIFACT_PATH, headers={"X-Tenant": "tenant-a"})
+
+    assert response.status_code == 403
+    assert download.called is False
+
+
+def test_artifact_listing_checks_experiment_owner_from_query_path():
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "experiment": {
+                        "experiment_id": "5",
+                        "tags": [{"key": "tenant", "value": "tenant-b"}],
+                    }
+                },
+            )
+        )
+        listing = mock.get("http://mlflow:5000/api/2.0/mlflow-artifacts/artifacts")
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow-artifacts/artifacts",
+            params={"path": "5"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 403
+    assert listing.called is False
+    cache_id = _experiment_cache_id("http://mlflow:5000", "5")
+    assert _ownership_cache.get("experiment", cache_id) == "tenant-b"
+
+
+def test_artifact_listing_of_root_is_denied():
+    client = TestClient(app)
+    response = client.get("/api/2.0/mlflow-artifacts/artifacts", headers={"X-Tenant": "tenant-a"})
+
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Artifact path does not identify an experiment"}
+
+
+def test_artifact_range_download_is_passed_through():
+    _seed_owner("tenant-a")
+    chunk = b"b" * 1024
+
+    with respx.mock(assert_all_called=True) as mock:
+        download = mock.get(f"http://mlflow:5000{ARTIFACT_PATH}").mock(
+            return_value=httpx.Response(
+                206,
+                content=chunk,
+                headers={
+                    "content-type": "application/octet-stream",
+                    "content-range": "bytes 1024-2047/8192",
+                    "content-length": str(len(chunk)),
+                },
+            )
+        )
+        client = TestClient(app)
+        response = client.get(
+            ARTIFACT_PATH, headers={"X-Tenant": "tenant-a", "Range": "bytes=1024-2047"}
+        )
+
+    assert response.status_code == 206
+    assert response.content == chunk
+    assert response.headers["content-range"] == "bytes 1024-2047/8192"
+    assert response.headers["content-length"] == str(len(chunk))
+    assert download.calls.last.request.headers["range"] == "bytes=1024-2047"
+
+
+def test_artifact_upload_limit_is_enforced_while_streaming(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "request_body_limits", {"artifact": 16})
+    _seed_owner("tenant-a")
+
+    with respx.mock(assert_all_called=False) as mock:
+        upload = mock.put(f"http://mlflow:5000{ARTIFACT_PATH}")
+        client = TestClient(app)
+        response = client.put(ARTIFACT_PATH, content=b"c" * 64, headers={"X-Tenant": "tenant-a"})
+
+    assert response.status_code == 413
+    assert upload.called is False
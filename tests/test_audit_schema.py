@@ -1,3 +1,4 @@
+import gzip
 import json
 from datetime import datetime
 
@@ -6,6 +7,7 @@ import pytest
 import respx
 from fastapi.testclient import TestClient
 
+from gateway.audit import iter_audit_events
 from gateway.config import settings
 from gateway.main import app
 
@@ -82,3 +84,51 @@ def test_audit_schema_v1_on_payload_400(caplog: pytest.LogCaptureFixture):
     assert event["status_code"] == 400
     assert event["decision"] == "deny"
     assert "Invalid MLflow payload" in event.get("reason", "")
+
+
+def test_iter_audit_events_reads_gzip_and_prefixed_lines(tmp_path):
+    event = {
+        "schema_version": "1",
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "method": "POST",
+        "path": "/api/2.0/mlflow/runs/create",
+        "tenant": "team-a",
+        "decision": "allow",
+    }
+    log = tmp_path / "audit.log.gz"
+    with gzip.open(log, "wt", encoding="utf-8") as handle:
+        handle.write(f"INFO:gateway.audit:{json.dumps(event)}\n")
+        handle.write("2026-01-01 00:00:01 INFO uvicorn: started\n")
+        handle.write("{not json\n")
+        handle.write(json.dumps({"unrelated": True}) + "\n")
+        handle.write(json.dumps({**event, "tenant": "team-b"}) + "\n")
+
+    events = list(iter_audit_events(str(log)))
+
+    assert [e["tenant"] for e in events] == ["team-a", "team-b"]
+    assert events[0]["path"] == "/api/2.0/mlflow/runs/create"
+
+
+def test_iter_audit_events_reads_plain_files(tmp_path):
+    log = tmp_path / "audit.log"
+    log.write_text(json.dumps({"schema_version": "1", "path": "/x"}) + "\n\n")
+
+    assert list(iter_audit_events(str(log))) == [{"schema_version": "1", "path": "/x"}]
+
+
+def test_audit_event_records_duration(caplog: pytest.LogCaptureFixture):
+    caplog.set_level("INFO", logger="gateway.audit")
+
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        TestClient(app).post(
+            "/api/2.0/mlflow/runs/search",
+            headers={"X-Tenant": "team-a"},
+            json={"experiment_ids": ["0"]},
+        )
+
+    event = _parse_last_audit_event(caplog)
+    assert isinstance(event["duration_ms"], float)
+    assert event["duration_ms"] >= 0
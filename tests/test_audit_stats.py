@@ -0,0 +1,117 @@
+import gzip
+import json
+import math
+
+import pytest
+
+from gateway.audit_stats import (
+    AuditStats,
+    AuditStatsError,
+    LatencyHistogram,
+    parse_time,
+    route_name,
+)
+from gateway.cli import main
+
+
+def _event(tenant: str, path: str, status_code: int, duration_ms: float | None, minute: int = 0):
+    event = {
+        "schema_version": "1",
+        "timestamp": f"2026-02-15T12:{minute:02d}:00+00:00",
+        "tenant": tenant,
+        "subject": "alice",
+        "method": "POST",
+        "path": path,
+        "status_code": status_code,
+        "upstream": "http://mlflow:5000",
+        "decision": "allow" if status_code < 400 else "deny" if status_code < 500 else "error",
+    }
+    if duration_ms is not None:
+        event["duration_ms"] = duration_ms
+    return event
+
+
+def test_histogram_percentiles_are_within_bucket_error():
+    histogram = LatencyHistogram()
+    values = [0.5 + index * 0.37 for index in range(10_000)]
+    for value in values:
+        histogram.add(value)
+
+    for percent in (50, 90, 99):
+        exact = sorted(values)[math.ceil(len(values) * percent / 100) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.025)
+    assert histogram.percentile(100) == max(values)
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_route_names_drop_resource_ids():
+    assert route_name("/api/2.0/mlflow/runs/search") == "runs/search"
+    assert route_name("/ajax-api/2.0/mlflow/metrics/get-history") == "metrics/get-history"
+    assert route_name("/api/2.0/mlflow-artifacts/artifacts/1/r-1/artifacts/model.pkl") == (
+        "artifacts"
+    )
+    assert route_name("/readyz") == "/readyz"
+
+
+def test_groups_filters_and_buckets():
+    stats = AuditStats(
+        ("tenant", "route", "bucket"),
+        bucket_seconds=1800,
+        routes=["runs/search"],
+        since=parse_time("2026-02-15T12:00:00"),
+    )
+    stats.consume(
+        [
+            _event("team-a", "/api/2.0/mlflow/runs/search", 200, 10.0, minute=1),
+            _event("team-a", "/api/2.0/mlflow/runs/search", 403, None, minute=2),
+            _event("team-a", "/api/2.0/mlflow/runs/search", 502, 30.0, minute=45),
+            _event("team-b", "/api/2.0/mlflow/runs/get", 200, 5.0),
+        ]
+    )
+
+    rows = stats.rows()
+    assert [(r["tenant"], r["bucket"], r["requests"]) for r in rows] == [
+        ("team-a", "2026-02-15T12:00:00+00:00", 2),
+        ("team-a", "2026-02-15T12:30:00+00:00", 1),
+    ]
+    assert rows[0]["allow"] == 1
+    assert rows[0]["4xx"] == 1
+    assert rows[0]["timed"] == 1
+    assert rows[1]["error"] == 1
+    assert stats.events == 4
+    assert stats.matched == 3
+    assert stats.total()["requests"] == 3
+
+    with pytest.raises(AuditStatsError):
+        AuditStats(("bucket",))
+    with pytest.raises(AuditStatsError):
+        AuditStats(("region",))
+
+
+def test_cli_audit_stats_reads_gzip_and_exports_json(tmp_path, capsys: pytest.CaptureFixture[str]):
+    log = tmp_path / "audit.log.gz"
+    with gzip.open(log, "wt", encoding="utf-8") as handle:
+        for index in range(100):
+            event = _event("team-a", "/api/2.0/mlflow/runs/search", 200, float(index + 1))
+            handle.write(f"INFO:gateway.audit:{json.dumps(event)}\n")
+        handle.write(json.dumps(_event("team-b", "/api/2.0/mlflow/runs/get", 404, 2.0)) + "\n")
+
+    exit_code = main(["audit-stats", str(log), "--tenant", "team-a", "--format", "json"])
+
+    assert exit_code == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["events"] == 101
+    assert summary["matched"] == 100
+    [group] = summary["groups"]
+    assert group["tenant"] == "team-a"
+    assert group["route"] == "runs/search"
+    assert group["p99_ms"] == pytest.approx(99, rel=0.025)
+    assert group["max_ms"] == 100
+
+
+def test_cli_audit_stats_rejects_bad_bucket(tmp_path, capsys: pytest.CaptureFixture[str]):
+    log = tmp_path / "audit.log"
+    log.write_text("")
+
+    assert main(["audit-stats", str(log), "--bucket", "soon"]) == 2
+    assert "Invalid bucket" in capsys.readouterr().err
@@ -0,0 +1,226 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from gateway.backfill import (
+    Backfill,
+    BackfillError,
+    Checkpoint,
+    RateLimiter,
+    TenantMapping,
+)
+from gateway.cli import main
+
+
+MLFLOW = "http://mlflow:5000"
+
+
+class _LegacyMlflow:
+    """Just enough MLflow for the backfill: paged searches and tag writes."""
+
+    def __init__(self, page_size: int = 2):
+        self.page_size = page_size
+        self.experiments = {
+            "1": {"experiment_id": "1", "name": "churn", "tags": []},
+            "2": {"experiment_id": "2", "name": "bravo-sweeps", "tags": []},
+            "3": {"experiment_id": "3", "name": "scratch", "tags": []},
+        }
+        self.runs = {
+            f"r-{index}": {
+                "info": {"run_id": f"r-{index}", "experiment_id": "1" if index < 5 else "2"},
+                "data": {"tags": []},
+            }
+            for index in range(8)
+        }
+        self.runs["r-0"]["data"]["tags"] = [{"key": "tenant", "value": "alpha"}]
+        self.runs["r-1"]["data"]["tags"] = [{"key": "tenant", "value": "bravo"}]
+        self.models = {
+            name: {"name": name, "tags": []} for name in ("alpha-churn", "bravo-fraud", "misc")
+        }
+        self.versions = {
+            ("alpha-churn", "1"): {"name": "alpha-churn", "version": "1", "tags": []},
+            ("alpha-churn", "2"): {"name": "alpha-churn", "version": "2", "tags": []},
+        }
+        self.writes: list[str] = []
+        self.fail_runs_search_for: set[str] = set()
+
+    def _page(self, rows: list, page_token: str | None) -> tuple[list, str | None]:
+        start = int(page_token or 0)
+        end = start + self.page_size
+        return rows[start:end], (str(end) if end < len(rows) else None)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/2.0/mlflow/")
+        body = json.loads(request.content) if request.content else {}
+        if path == "experiments/search":
+            rows, token = self._page(list(self.experiments.values()), body.get("page_token"))
+            return httpx.Response(200, json={"experiments": rows, "next_page_token": token})
+        if path == "runs/search":
+            experiment_id = body["experiment_ids"][0]
+            if experiment_id in self.fail_runs_search_for:
+                return httpx.Response(503)
+            runs = [r for r in self.runs.values() if r["info"]["experiment_id"] == experiment_id]
+            rows, token = self._page(runs, body.get("page_token"))
+            return httpx.Response(200, json={"runs": rows, "next_page_token": token})
+        if path == "registered-models/search":
+            # MLflow serves the registry searches as GETs only.
+            assert request.method == "GET"
+            rows, token = self._page(
+                list(self.models.values()), request.url.params.get("page_token")
+            )
+            return httpx.Response(200, json={"registered_models": rows, "next_page_token": token})
+        if path == "model-versions/search":
+            assert request.method == "GET"
+            name = request.url.params["filter"].split("'")[1]
+            versions = [v for (model, _), v in self.versions.items() if model == name]
+            rows, token = self._page(versions, request.url.params.get("page_token"))
+            return httpx.Response(200, json={"model_versions": rows, "next_page_token": token})
+
+        self.writes.append(path)
+        tag = {"key": body.get("key"), "value": body.get("value")}
+        if path == "experiments/set-experiment-tag":
+            self.experiments[body["experiment_id"]]["tags"].append(tag)
+        elif path == "runs/log-batch":
+            self.runs[body["run_id"]]["data"]["tags"].extend(body["tags"])
+        elif path == "registered-models/set-tag":
+            self.models[body["name"]]["tags"].append(tag)
+        elif path == "model-versions/set-tag":
+            self.versions[(body["name"], body["version"])]["tags"].append(tag)
+        else:
+            return httpx.Response(404)
+        return httpx.Response(200, json={})
+
+
+MAPPING = TenantMapping.from_dict(
+    {"experiments": {"1": "alpha"}, "name_prefixes": {"alpha-": "alpha", "bravo-": "bravo"}}
+)
+
+
+def _tenant(tags: list[dict]) -> str | None:
+    return next((tag["value"] for tag in tags if tag["key"] == "tenant"), None)
+
+
+async def _backfill(mlflow: _LegacyMlflow, **kwargs) -> Backfill:
+    with respx.mock(assert_all_called=False) as mock:
+        mock.route(host="mlflow").mock(side_effect=mlflow.handle)
+        async with httpx.AsyncClient(base_url=MLFLOW) as client:
+            backfill = Backfill(client, MAPPING, **kwargs)
+            await backfill.run()
+    return backfill
+
+
+def test_mapping_resolution():
+    assert MAPPING.tenant_for_experiment("1", "anything") == "alpha"
+    assert MAPPING.tenant_for_experiment("9", "bravo-sweeps") == "bravo"
+    assert MAPPING.tenant_for_experiment("9", "scratch") is None
+    longest = TenantMapping.from_dict({"name_prefixes": {"a-": "alpha", "a-b-": "bravo"}})
+    assert longest.tenant_for_name("a-b-model") == "bravo"
+
+    with pytest.raises(BackfillError):
+        TenantMapping.from_dict({"experiments": {"1": 7}})
+    with pytest.raises(BackfillError):
+        TenantMapping.from_dict({})
+
+
+async def test_backfill_tags_untagged_resources_and_reports_conflicts():
+    mlflow = _LegacyMlflow()
+    backfill = await _backfill(mlflow, concurrency=4)
+
+    assert _tenant(mlflow.experiments["1"]["tags"]) == "alpha"
+    assert _tenant(mlflow.experiments["2"]["tags"]) == "bravo"
+    assert mlflow.experiments["3"]["tags"] == []
+    assert {run_id: _tenant(run["data"]["tags"]) for run_id, run in mlflow.runs.items()} == {
+        "r-0": "alpha",
+        "r-1": "bravo",
+        "r-2": "alpha",
+        "r-3": "alpha",
+        "r-4": "alpha",
+        "r-5": "bravo",
+        "r-6": "bravo",
+        "r-7": "bravo",
+    }
+    assert _tenant(mlflow.models["alpha-churn"]["tags"]) == "alpha"
+    assert mlflow.models["misc"]["tags"] == []
+    assert all(_tenant(v["tags"]) == "alpha" for v in mlflow.versions.values())
+
+    summary = backfill.stats.summary()
+    assert summary["runs"] == {
+        "tagged": 6,
+        "already_tagged": 1,
+        "unmapped": 0,
+        "conflict": 1,
+        "failed": 0,
+    }
+    assert summary["experiments"]["unmapped"] == 1
+    assert summary["registered_models"]["tagged"] == 2
+    assert summary["model_versions"]["tagged"] == 2
+
+
+async def test_dry_run_writes_nothing():
+    mlflow = _LegacyMlflow()
+    backfill = await _backfill(mlflow, dry_run=True)
+
+    assert mlflow.writes == []
+    assert backfill.stats.summary()["runs"]["tagged"] == 6
+
+
+async def test_backfill_resumes_from_checkpoint(tmp_path):
+    checkpoint_path = str(tmp_path / "backfill.json")
+    mlflow = _LegacyMlflow()
+    mlflow.fail_runs_search_for = {"2"}
+
+    with pytest.raises(BackfillError):
+        await _backfill(mlflow, checkpoint=Checkpoint(checkpoint_path))
+    assert json.loads(open(checkpoint_path).read())["done"] == ["runs:1"]
+    writes_before_resume = len(mlflow.writes)
+
+    mlflow.fail_runs_search_for = set()
+    mlflow.runs["r-2"]["data"]["tags"] = []  # a run of the finished experiment is not revisited
+    await _backfill(mlflow, checkpoint=Checkpoint(checkpoint_path))
+
+    assert mlflow.runs["r-2"]["data"]["tags"] == []
+    resumed_writes = mlflow.writes[writes_before_resume:]
+    assert resumed_writes.count("runs/log-batch") == 3
+    assert "experiments/set-experiment-tag" not in resumed_writes
+
+
+async def test_rate_limiter_spaces_requests():
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(10, burst=2, clock=lambda: now[0], sleep=_sleep)
+    for _ in range(4):
+        await limiter.acquire()
+
+    assert sleeps == pytest.approx([0.1, 0.1])
+
+
+def test_cli_backfill_prints_summary(tmp_path, capsys: pytest.CaptureFixture[str]):
+    mapping_path = tmp_path / "mapping.json"
+    mapping_path.write_text(json.dumps({"experiments": {"1": "alpha"}}))
+    mlflow = _LegacyMlflow()
+
+    with respx.mock(assert_all_called=False) as mock:
+        mock.route(host="mlflow").mock(side_effect=mlflow.handle)
+        exit_code = main(
+            [
+                "backfill",
+                "--mapping",
+                str(mapping_path),
+                "--mlflow-url",
+                MLFLOW,
+                "--rate-limit",
+                "0",
+            ]
+        )
+
+    assert exit_code == 0
+    output = capsys.readouterr()
+    assert json.loads(output.out)["runs"]["tagged"] == 3
+    assert "runs: tagged=3" in output.err
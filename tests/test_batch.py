@@ -0,0 +1,172 @@
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+
+
+RUNS_GET = "/api/2.0/mlflow/runs/get"
+
+
+def _run_response(run_id: str, tenant: str) -> dict:
+    return {
+        "run": {
+            "info": {"run_id": run_id},
+            "data": {"tags": [{"key": "tenant", "value": tenant}]},
+        }
+    }
+
+
+def test_batch_returns_results_in_request_order():
+    def _runs_get(request: httpx.Request) -> httpx.Response:
+        run_id = request.url.params["run_id"]
+        tenant = "tenant-b" if run_id == "r-foreign" else "tenant-a"
+        return httpx.Response(200, json=_run_response(run_id, tenant))
+
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(side_effect=_runs_get)
+        client = TestClient(app)
+        response = client.post(
+            "/gateway/v1/batch",
+            json={
+                "requests": [
+                    {"method": "GET", "path": RUNS_GET, "query": {"run_id": "r-1"}},
+                    {"method": "GET", "path": RUNS_GET, "query": {"run_id": "r-foreign"}},
+                    {"method": "GET", "path": RUNS_GET, "query": {"run_id": "r-2"}},
+                ]
+            },
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    results = response.json()["responses"]
+    assert [result["status_code"] for result in results] == [200, 403, 200]
+    assert results[0]["body"]["run"]["info"]["run_id"] == "r-1"
+    assert results[1]["body"] == {"detail": "Resource is not accessible for tenant"}
+    assert results[2]["body"]["run"]["info"]["run_id"] == "r-2"
+
+
+def test_batch_applies_create_and_search_policies():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
+    with respx.mock(assert_all_called=True) as mock:
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            return_value=httpx.Response(200, json={"run": {"info": {"run_id": "r-1"}}})
+        )
+        search = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/gateway/v1/batch",
+            json={
+                "requests": [
+                    {
+                        "method": "POST",
+                        "path": "/api/2.0/mlflow/runs/create",
+                        "body": {"experiment_id": "1"},
+                    },
+                    {
+                        "method": "POST",
+                        "path": "/api/2.0/mlflow/runs/search",
+                        "body": {"experiment_ids": ["1"]},
+                    },
+                ]
+            },
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert [result["status_code"] for result in response.json()["responses"]] == [200, 200]
+    create_payload = json.loads(create.calls.last.request.content)
+    assert {"key": "tenant", "value": "tenant-a"} in create_payload["tags"]
+    search_payload = json.loads(search.calls.last.request.content)
+    assert "tags.tenant = 'tenant-a'" in search_payload["filter"]
+
+
+def test_batch_authenticates_once_and_enforces_rbac_per_sub_request(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from gateway.main import _validator
+
+    monkeypatch.setattr(settings, "auth_enabled", True)
+    monkeypatch.setattr(settings, "auth_mode", "oidc")
+    monkeypatch.setattr(settings, "tenant_claim", "tenant_id")
+    monkeypatch.setattr(settings, "role_claim", "roles")
+    validations: list[str] = []
+
+    async def _fake_validate_token(token: str):
+        validations.append(token)
+        return {"tenant_id": "tenant-a", "roles": ["viewer"], "sub": "alice"}
+
+    monkeypatch.setattr(_validator, "validate_token", _fake_validate_token)
+
+    with respx.mock(assert_all_called=False) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/gateway/v1/batch",
+            json={
+                "requests": [
+                    {"method": "POST", "path": "/api/2.0/mlflow/runs/search", "body": {}},
+                    {"method": "POST", "path": "/api/2.0/mlflow/runs/create", "body": {}},
+                ]
+            },
+            headers={"Authorization": "Bearer token-1"},
+        )
+
+    assert response.status_code == 200
+    assert [result["status_code"] for result in response.json()["responses"]] == [200, 403]
+    assert validations == ["token-1"]
+    assert create.called is False
+
+
+@pytest.mark.parametrize(
+    "sub_request",
+    [
+        {"method": "GET", "path": "/healthz"},
+        {"method": "GET", "path": "/api/2.0/mlflow/../../admin"},
+        {"method": "GET", "path": "/api/2.0/mlflow-artifacts/artifacts/x"},
+        {"method": "TRACE", "path": "/api/2.0/mlflow/runs/get"},
+    ],
+)
+def test_batch_rejects_invalid_sub_requests(sub_request: dict):
+    client = TestClient(app)
+    response = client.post(
+        "/gateway/v1/batch",
+        json={"requests": [sub_request]},
+        headers={"X-Tenant": "tenant-a"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid batch payload:")
+
+
+def test_batch_size_is_limited(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "batch_max_requests", 2)
+    client = TestClient(app)
+    response = client.post(
+        "/gateway/v1/batch",
+        json={"requests": [{"method": "GET", "path": "/api/2.0/mlflow/runs/get"}] * 3},
+        headers={"X-Tenant": "tenant-a"},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid batch payload: Batch exceeds 2 requests"}
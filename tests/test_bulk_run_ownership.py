@@ -0,0 +1,130 @@
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _ownership_cache, app
+from gateway.mlflow.ownership import OwnershipCache
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "preflight_concurrency", 2)
+
+
+RUN_OWNERS = {"r-1": "tenant-a", "r-2": "tenant-a", "r-3": "tenant-b"}
+
+
+def _run_get(request: httpx.Request) -> httpx.Response:
+    run_id = request.url.params["run_id"]
+    if run_id not in RUN_OWNERS:
+        return httpx.Response(404, json={"error_code": "RESOURCE_DOES_NOT_EXIST"})
+    return httpx.Response(
+        200,
+        json={"run": {"data": {"tags": [{"key": "tenant", "value": RUN_OWNERS[run_id]}]}}},
+    )
+
+
+def test_ownership_cache_expires_and_evicts():
+    now = {"t": 0.0}
+    cache = OwnershipCache(max_entries=2, ttl_seconds=10, clock=lambda: now["t"])
+    cache.put("run", "r-1", "tenant-a")
+    cache.put("run", "r-2", "tenant-a")
+    cache.put("run", "r-3", "tenant-b")
+
+    assert cache.get("run", "r-1") is None
+    assert cache.get("run", "r-3") == "tenant-b"
+    now["t"] = 11.0
+    assert cache.get("run", "r-3") is None
+
+
+def test_bulk_history_allows_runs_owned_by_tenant():
+    with respx.mock(assert_all_called=True) as mock:
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(side_effect=_run_get)
+        bulk = mock.get("http://mlflow:5000/ajax-api/2.0/mlflow/metrics/get-history-bulk").mock(
+            return_value=httpx.Response(200, json={"metrics": []})
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/ajax-api/2.0/mlflow/metrics/get-history-bulk",
+            params=[("run_id", "r-1"), ("run_id", "r-2"), ("metric_key", "loss")],
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert preflight.call_count == 2
+    assert bulk.called is True
+    assert _ownership_cache.get("run", "r-1") == "tenant-a"
+
+
+def test_bulk_history_denies_when_any_run_is_foreign():
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(side_effect=_run_get)
+        bulk = mock.get(
+            "http://mlflow:5000/api/2.0/mlflow/metrics/get-history-bulk-interval"
+        ).mock(return_value=httpx.Response(200, json={"metrics": []}))
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/metrics/get-history-bulk-interval",
+            params=[("run_ids", "r-1"), ("run_ids", "r-3"), ("metric_key", "loss")],
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 403
+    assert bulk.called is False
+
+
+def test_bulk_history_uses_ownership_cache():
+    _ownership_cache.put("run", "r-1", "tenant-a")
+    _ownership_cache.put("run", "r-2", "tenant-a")
+
+    with respx.mock(assert_all_called=False) as mock:
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(side_effect=_run_get)
+        mock.get("http://mlflow:5000/ajax-api/2.0/mlflow/metrics/get-history-bulk").mock(
+            return_value=httpx.Response(200, json={"metrics": []})
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/ajax-api/2.0/mlflow/metrics/get-history-bulk",
+            params=[("run_id", "r-1"), ("run_id", "r-2"), ("metric_key", "loss")],
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert preflight.called is False
+
+
+def test_bulk_history_requires_run_ids():
+    client = TestClient(app)
+    response = client.get(
+        "/ajax-api/2.0/mlflow/metrics/get-history-bulk",
+        params={"metric_key": "loss"},
+        headers={"X-Tenant": "tenant-a"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_run_mutation_skips_preflight_for_cached_owner():
+    _ownership_cache.put("run", "r-1", "tenant-a")
+
+    with respx.mock(assert_all_called=False) as mock:
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(side_effect=_run_get)
+        mutation = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/log-metric").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/log-metric",
+            json={"run_id": "r-1", "key": "loss", "value": 0.1, "timestamp": 0},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert preflight.called is False
+    assert mutation.called is True
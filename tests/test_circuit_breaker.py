@@ -0,0 +1,162 @@
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "circuit_breaker_minimum_calls", 3)
+    monkeypatch.setattr(settings, "circuit_breaker_failure_rate", 0.5)
+
+
+def _parse_last_audit_event(caplog: pytest.LogCaptureFixture) -> dict:
+    records = [r for r in caplog.records if r.name == "gateway.audit"]
+    assert records
+    return json.loads(records[-1].message)
+
+
+def _call(breaker: CircuitBreaker, *, failed: bool) -> None:
+    with breaker.guard() as call:
+        call.failed = failed
+
+
+def test_breaker_opens_on_failure_rate_and_recovers_through_half_open():
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(
+        "http://mlflow:5000",
+        minimum_calls=4,
+        failure_rate_threshold=0.5,
+        open_seconds=10,
+        half_open_max_calls=2,
+        clock=lambda: now["t"],
+    )
+    _call(breaker, failed=False)
+    _call(breaker, failed=True)
+    _call(breaker, failed=False)
+    assert breaker.state == CLOSED
+    _call(breaker, failed=True)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        _call(breaker, failed=False)
+    assert excinfo.value.retry_after == 10
+
+    now["t"] = 10.0
+    with breaker.guard(), breaker.guard():
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            _call(breaker, failed=False)
+    assert breaker.state == CLOSED
+
+
+def test_failed_trial_reopens_breaker():
+    now = {"t": 0.0}
+    breaker = CircuitBreaker("up", minimum_calls=1, open_seconds=5, clock=lambda: now["t"])
+    _call(breaker, failed=True)
+    now["t"] = 5.0
+
+    with pytest.raises(httpx.ConnectError):
+        with breaker.guard():
+            raise httpx.ConnectError("boom")
+
+    assert breaker.state == OPEN
+
+
+def test_slow_calls_open_breaker():
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(
+        "up",
+        minimum_calls=2,
+        slow_call_ms=100,
+        slow_call_rate_threshold=1.0,
+        clock=lambda: now["t"],
+    )
+    for _ in range(2):
+        with breaker.guard():
+            now["t"] += 0.5
+
+    assert breaker.state == OPEN
+
+
+def test_open_circuit_fails_fast_with_distinct_audit_reason(caplog: pytest.LogCaptureFixture):
+    caplog.set_level("INFO", logger="gateway.audit")
+    with respx.mock(assert_all_called=True) as mock:
+        upstream = mock.post("http://mlflow:5000/api/2.0/mlflow/experiments/create").mock(
+            return_value=httpx.Response(503, json={"error_code": "TEMPORARILY_UNAVAILABLE"})
+        )
+        client = TestClient(app)
+        for _ in range(3):
+            response = client.post(
+                "/api/2.0/mlflow/experiments/create",
+                json={"name": "exp"},
+                headers={"X-Tenant": "tenant-a"},
+            )
+            assert response.status_code == 503
+        response = client.post(
+            "/api/2.0/mlflow/experiments/create",
+            json={"name": "exp"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert upstream.call_count == 3
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Upstream MLflow is unavailable"}
+    assert int(response.headers["retry-after"]) >= 1
+    event = _parse_last_audit_event(caplog)
+    assert event["reason"] == "upstream_circuit_open"
+    assert event["decision"] == "error"
+
+
+def test_only_listed_exception_types_count_as_failures():
+    breaker = CircuitBreaker("up", minimum_calls=1, open_seconds=5)
+
+    with pytest.raises(ValueError):
+        with breaker.guard(failures=(httpx.TransportError,)):
+            raise ValueError("rejected by the gateway")
+    assert breaker.state == CLOSED
+
+    with pytest.raises(httpx.ReadTimeout):
+        with breaker.guard(failures=(httpx.TransportError,)):
+            raise httpx.ReadTimeout("slow upstream")
+    assert breaker.state == OPEN
+
+
+def test_rejected_upload_bodies_do_not_open_the_breaker(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "artifact_path_prefix", "")
+    monkeypatch.setattr(settings, "request_body_limits", {"artifact": 16})
+    artifact_path = "/api/2.0/mlflow-artifacts/artifacts/1/r-1/artifacts/model.pkl"
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+    _ownership_cache.put("run", "r-1", "tenant-a")
+
+    def _oversized_chunks():
+        for _ in range(8):
+            yield b"c" * 8
+
+    with respx.mock(assert_all_called=False) as mock:
+        mock.put(f"http://mlflow:5000{artifact_path}").mock(
+            side_effect=lambda request: httpx.Response(200, content=request.read())
+        )
+        download = mock.get(f"http://mlflow:5000{artifact_path}").mock(
+            return_value=httpx.Response(200, content=b"model")
+        )
+        client = TestClient(app)
+        uploads = [
+            client.put(artifact_path, content=_oversized_chunks(), headers={"X-Tenant": "tenant-a"})
+            for _ in range(3)
+        ]
+        response = client.get(artifact_path, headers={"X-Tenant": "tenant-a"})
+
+    assert [upload.status_code for upload in uploads] == [413, 413, 413]
+    assert response.status_code == 200
+    assert download.called is True
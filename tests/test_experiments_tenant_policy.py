@@ -0,0 +1,217 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+
+
+def _experiment_response(experiment_id: str, tenant: str) -> dict:
+    return {
+        "experiment": {
+            "experiment_id": experiment_id,
+            "name": f"exp-{experiment_id}",
+            "tags": [{"key": "tenant", "value": tenant}],
+        }
+    }
+
+
+def test_experiment_create_injects_tag_and_caches_owner():
+    with respx.mock(assert_all_called=True) as mock:
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/experiments/create").mock(
+            return_value=httpx.Response(200, json={"experiment_id": "7"})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/experiments/create",
+            json={"name": "sweep"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"experiment_id": "7"}
+    payload = json.loads(create.calls.last.request.content)
+    assert {"key": "tenant", "value": "tenant-a"} in payload["tags"]
+    cache_id = _experiment_cache_id("http://mlflow:5000", "7")
+    assert _ownership_cache.get("experiment", cache_id) == "tenant-a"
+
+
+def test_runs_create_uses_cached_experiment_owner():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "7"), "tenant-a")
+
+    with respx.mock(assert_all_called=False) as mock:
+        lookup = mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get")
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            return_value=httpx.Response(200, json={"run": {"info": {"run_id": "r-1"}}})
+        )
+        client = TestClient(app)
+        for _ in range(3):
+            response = client.post(
+                "/api/2.0/mlflow/runs/create",
+                json={"experiment_id": "7"},
+                headers={"X-Tenant": "tenant-a"},
+            )
+            assert response.status_code == 200
+
+    assert lookup.called is False
+
+
+def test_runs_create_denies_foreign_experiment():
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get").mock(
+            return_value=httpx.Response(200, json=_experiment_response("7", "tenant-b"))
+        )
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create")
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={"experiment_id": "7"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 403
+    assert create.called is False
+    cache_id = _experiment_cache_id("http://mlflow:5000", "7")
+    assert _ownership_cache.get("experiment", cache_id) == "tenant-b"
+
+
+def test_runs_create_requires_experiment_id():
+    client = TestClient(app)
+    response = client.post(
+        "/api/2.0/mlflow/runs/create",
+        json={"run_name": "r"},
+        headers={"X-Tenant": "tenant-a"},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Missing required field: experiment_id"}
+
+
+async def test_concurrent_runs_create_share_one_experiment_lookup():
+    async def _slow_experiment(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=_experiment_response("7", "tenant-a"))
+
+    with respx.mock(assert_all_called=True) as mock:
+        lookup = mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get").mock(
+            side_effect=_slow_experiment
+        )
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            return_value=httpx.Response(200, json={"run": {"info": {"run_id": "r-1"}}})
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://gateway"
+        ) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        "/api/2.0/mlflow/runs/create",
+                        json={"experiment_id": "7"},
+                        headers={"X-Tenant": "tenant-a"},
+                    )
+                    for _ in range(20)
+                )
+            )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert lookup.call_count == 1
+    assert create.call_count == 20
+
+
+def test_experiments_search_appends_tenant_filter():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.post("http://mlflow:5000/api/2.0/mlflow/experiments/search").mock(
+            return_value=httpx.Response(200, json={"experiments": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/experiments/search",
+            json={"filter": "name LIKE 'sweep%'", "max_results": 10},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    payload = json.loads(search.calls.last.request.content)
+    assert payload["filter"] == "name LIKE 'sweep%' and tags.tenant = 'tenant-a'"
+
+
+def test_experiments_search_rewrites_query_filter_on_get():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/search").mock(
+            return_value=httpx.Response(200, json={"experiments": []})
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/experiments/search",
+            params={"filter": "name LIKE 'sweep%'", "max_results": "10"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    params = search.calls.last.request.url.params
+    assert params.get_list("filter") == ["name LIKE 'sweep%' and tags.tenant = 'tenant-a'"]
+    assert params["max_results"] == "10"
+
+
+def test_experiment_get_by_name_denies_other_tenant_and_caches_id():
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get-by-name").mock(
+            return_value=httpx.Response(200, json=_experiment_response("9", "tenant-b"))
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/experiments/get-by-name",
+            params={"experiment_name": "exp-9"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 403
+    cache_id = _experiment_cache_id("http://mlflow:5000", "9")
+    assert _ownership_cache.get("experiment", cache_id) == "tenant-b"
+
+
+def test_experiment_get_returns_preflight_body_for_owner():
+    with respx.mock(assert_all_called=True) as mock:
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get").mock(
+            return_value=httpx.Response(200, json=_experiment_response("7", "tenant-a"))
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/experiments/get",
+            params={"experiment_id": "7"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["experiment"]["experiment_id"] == "7"
+    assert preflight.call_count == 1
+
+
+def test_experiment_mutation_denied_from_cache_without_preflight():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "7"), "tenant-b")
+
+    with respx.mock(assert_all_called=False) as mock:
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/experiments/get")
+        update = mock.post("http://mlflow:5000/api/2.0/mlflow/experiments/update")
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/experiments/update",
+            json={"experiment_id": "7", "new_name": "renamed"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 403
+    assert preflight.called is False
+    assert update.called is False
@@ -0,0 +1,141 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.fake_mlflow import FaultInjection, create_app
+from gateway.backfill import Backfill, TenantMapping
+from gateway.config import settings
+from gateway.main import app
+from gateway.upstream import close_upstream_clients, register_upstream_client
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "retry_max_attempts", 1)
+
+
+@pytest.fixture
+async def fake_upstream():
+    fake = create_app()
+    register_upstream_client(
+        "http://mlflow:5000",
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://mlflow:5000"),
+    )
+    yield fake
+    await close_upstream_clients()
+
+
+def test_search_filters_by_tags_and_pages():
+    client = TestClient(create_app())
+    experiment_id = client.post(
+        "/api/2.0/mlflow/experiments/create", json={"name": "sweep"}
+    ).json()["experiment_id"]
+    for index in range(5):
+        client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={
+                "experiment_id": experiment_id,
+                "tags": [{"key": "tenant", "value": "alpha" if index % 2 else "bravo"}],
+            },
+        )
+
+    first = client.post(
+        "/api/2.0/mlflow/runs/search",
+        json={
+            "experiment_ids": [experiment_id],
+            "filter": "tags.tenant = 'bravo'",
+            "max_results": 2,
+        },
+    ).json()
+    second = client.post(
+        "/api/2.0/mlflow/runs/search",
+        json={
+            "experiment_ids": [experiment_id],
+            "filter": "tags.tenant = 'bravo'",
+            "page_token": first["next_page_token"],
+        },
+    ).json()
+
+    assert len(first["runs"]) == 2
+    assert len(second["runs"]) == 1
+    assert "next_page_token" not in second
+    missing = client.get("/api/2.0/mlflow/runs/get", params={"run_id": "nope"})
+    assert missing.status_code == 404
+    assert missing.json()["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_artifacts_support_range_downloads_and_listing():
+    client = TestClient(create_app())
+    path = "/api/2.0/mlflow-artifacts/artifacts/1/r-1/artifacts/model.pkl"
+    client.put(path, content=b"0123456789")
+
+    partial = client.get(path, headers={"Range": "bytes=2-5"})
+    listing = client.get("/api/2.0/mlflow-artifacts/artifacts", params={"path": "1/r-1"})
+
+    assert partial.status_code == 206
+    assert partial.content == b"2345"
+    assert partial.headers["content-range"] == "bytes 2-5/10"
+    assert listing.json() == {"files": [{"path": "artifacts", "is_dir": True}]}
+
+
+def test_fault_injection_returns_configured_errors():
+    client = TestClient(create_app(FaultInjection(error_rate=1.0, error_status=503)))
+
+    assert client.get("/api/2.0/mlflow/experiments/search").status_code == 503
+    assert client.get("/health").status_code == 200
+
+
+async def test_gateway_round_trip_against_in_process_fake(fake_upstream):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://gateway"
+    ) as client:
+        created = await client.post(
+            "/api/2.0/mlflow/experiments/create",
+            json={"name": "alpha-sweep"},
+            headers={"X-Tenant": "alpha"},
+        )
+        experiment_id = created.json()["experiment_id"]
+        run = await client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={"experiment_id": experiment_id},
+            headers={"X-Tenant": "alpha"},
+        )
+        foreign = await client.post(
+            "/api/2.0/mlflow/runs/get",
+            json={"run_id": run.json()["run"]["info"]["run_id"]},
+            headers={"X-Tenant": "bravo"},
+        )
+        search = await client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": [experiment_id]},
+            headers={"X-Tenant": "alpha"},
+        )
+
+    assert run.status_code == 200
+    assert foreign.status_code == 403
+    assert [r["info"]["run_id"] for r in search.json()["runs"]] == [
+        run.json()["run"]["info"]["run_id"]
+    ]
+    stored = fake_upstream.state.store.runs[run.json()["run"]["info"]["run_id"]]
+    assert {"key": "tenant", "value": "alpha"} in stored["data"]["tags"]
+
+
+async def test_backfill_against_fake():
+    fake = create_app()
+    store = fake.state.store
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fake), base_url="http://mlflow"
+    ) as client:
+        experiment_id = (
+            await client.post("/api/2.0/mlflow/experiments/create", json={"name": "legacy"})
+        ).json()["experiment_id"]
+        await client.post("/api/2.0/mlflow/runs/create", json={"experiment_id": experiment_id})
+        await Backfill(client, TenantMapping.from_dict({"experiments": {"legacy": "alpha"}})).run()
+
+    run = next(iter(store.runs.values()))
+    assert {"key": "tenant", "value": "alpha"} in run["data"]["tags"]
+    assert {"key": "tenant", "value": "alpha"} in store.experiments[experiment_id]["tags"]
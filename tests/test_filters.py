@@ -0,0 +1,65 @@
+import pytest
+
+from gateway.mlflow.filters import (
+    And,
+    Comparison,
+    FilterParseError,
+    Or,
+    parse_filter,
+    render_filter,
+    tenant_scoped_filter,
+)
+from gateway.mlflow.tenant import TenantPayloadError, ensure_tenant_filter_for_search
+
+
+def test_parse_filter_builds_conjunction_with_normalized_entities():
+    node = parse_filter("attr.status = 'RUNNING' AND metric.acc >= 0.9 and tag.`my key` LIKE 'a%'")
+
+    assert isinstance(node, And)
+    assert [clause.entity for clause in node.clauses] == ["attributes", "metrics", "tags"]
+    assert node.clauses[2].key == "my key"
+    assert render_filter(node) == (
+        "attributes.status = 'RUNNING' and metrics.acc >= 0.9 and tags.`my key` LIKE 'a%'"
+    )
+
+
+def test_parse_filter_supports_or_groups_in_and_tuples():
+    node = parse_filter("(tags.a = 'x' OR tags.b = 'y') and attributes.run_id IN ('r1', \"r2\")")
+
+    assert isinstance(node, And)
+    assert isinstance(node.clauses[0], Or)
+    assert render_filter(node) == "(tags.a = 'x' or tags.b = 'y') and attributes.run_id IN ('r1', 'r2')"
+
+
+@pytest.mark.parametrize("bad_filter", ["tags.a =", "tags.a = 'x' and", "tags.a ~ 'x'", "(tags.a = 'x'"])
+def test_parse_filter_rejects_invalid_expressions(bad_filter: str):
+    with pytest.raises(FilterParseError):
+        parse_filter(bad_filter)
+
+
+def test_tenant_scoped_filter_is_idempotent():
+    once = tenant_scoped_filter("attributes.status = 'RUNNING'", "tenant-a")
+    twice = tenant_scoped_filter(once, "tenant-a")
+
+    assert once == "attributes.status = 'RUNNING' and tags.tenant = 'tenant-a'"
+    assert twice == once
+
+
+def test_tenant_predicate_under_or_does_not_count_as_present():
+    scoped = tenant_scoped_filter("tags.tenant = 'tenant-a' or tags.public = 'true'", "tenant-a")
+
+    assert scoped == "(tags.tenant = 'tenant-a' or tags.public = 'true') and tags.tenant = 'tenant-a'"
+
+
+def test_tenant_scoped_filter_escapes_tenant_quotes():
+    scoped = tenant_scoped_filter("", "o'brien")
+
+    assert scoped == "tags.tenant = 'o''brien'"
+    node = parse_filter(scoped)
+    assert isinstance(node, Comparison)
+    assert node.value.value == "o'brien"
+
+
+def test_ensure_tenant_filter_rejects_unparseable_filter():
+    with pytest.raises(TenantPayloadError, match="Invalid MLflow payload"):
+        ensure_tenant_filter_for_search({"filter": "tags.tenant = 'a' or"}, "tenant-a")
@@ -0,0 +1,208 @@
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import app
+from gateway.mlflow.filters import name_scoped_filter, tenant_predicate
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "model_versions_search_scope", "tag")
+
+
+MV_SEARCH_URL = "http://mlflow:5000/api/2.0/mlflow/model-versions/search"
+RM_SEARCH_URL = "http://mlflow:5000/api/2.0/mlflow/registered-models/search"
+
+
+def _registered_models(*names: str, next_page_token: str | None = None) -> dict:
+    payload: dict = {"registered_models": [{"name": name} for name in names]}
+    if next_page_token:
+        payload["next_page_token"] = next_page_token
+    return payload
+
+
+def test_name_scoped_filter():
+    names = frozenset({"churn", "fraud"})
+
+    assert name_scoped_filter("", names) == "name IN ('churn', 'fraud')"
+    assert name_scoped_filter("run_id = 'r1'", names) == (
+        "run_id = 'r1' and name IN ('churn', 'fraud')"
+    )
+    assert name_scoped_filter("name = 'churn'", names) == "name = 'churn'"
+    assert name_scoped_filter("name = 'other'", names) is None
+    assert name_scoped_filter("", frozenset()) is None
+
+
+def test_name_scoped_filter_falls_back_above_max_names():
+    names = frozenset({"churn", "fraud", "ltv"})
+    fallback = tenant_predicate("tenant-a")
+
+    assert name_scoped_filter("", names, max_names=2, fallback=fallback) == (
+        "tags.tenant = 'tenant-a'"
+    )
+    assert name_scoped_filter("version = 1", names, max_names=3, fallback=fallback) == (
+        "version = 1 and name IN ('churn', 'fraud', 'ltv')"
+    )
+    assert name_scoped_filter("name = 'churn'", names, max_names=2, fallback=fallback) == (
+        "name = 'churn'"
+    )
+
+
+def test_tag_scope_appends_tenant_predicate_to_post_body():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.post(MV_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json={"model_versions": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/model-versions/search",
+            json={"filter": "name = 'churn'"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    payload = json.loads(search.calls.last.request.content)
+    assert payload["filter"] == "name = 'churn' and tags.tenant = 'tenant-a'"
+
+
+def test_tag_scope_rewrites_query_filter_on_get():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.get(MV_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json={"model_versions": []})
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/model-versions/search",
+            params={"filter": "name = 'churn'", "max_results": "10"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    params = search.calls.last.request.url.params
+    assert params["filter"] == "name = 'churn' and tags.tenant = 'tenant-a'"
+    assert params["max_results"] == "10"
+
+
+def test_name_scope_seeds_index_once_across_pages(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "model_versions_search_scope", "name")
+    with respx.mock(assert_all_called=True) as mock:
+        seed = mock.get(RM_SEARCH_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=_registered_models("churn", next_page_token="p2")),
+                httpx.Response(200, json=_registered_models("fraud")),
+            ]
+        )
+        search = mock.get(MV_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json={"model_versions": []})
+        )
+        client = TestClient(app)
+        for _ in range(2):
+            response = client.get(
+                "/api/2.0/mlflow/model-versions/search",
+                headers={"X-Tenant": "tenant-a"},
+            )
+            assert response.status_code == 200
+
+    assert seed.call_count == 2
+    first_page = seed.calls[0].request.url.params
+    assert first_page["filter"] == "tags.tenant = 'tenant-a'"
+    assert "page_token" not in first_page
+    assert seed.calls[0].request.content == b""
+    assert seed.calls[1].request.url.params["page_token"] == "p2"
+    assert search.call_count == 2
+    assert search.calls.last.request.url.params["filter"] == "name IN ('churn', 'fraud')"
+
+
+def test_name_scope_answers_empty_without_upstream_search(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "model_versions_search_scope", "name")
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(RM_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json=_registered_models("churn"))
+        )
+        search = mock.post(MV_SEARCH_URL)
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/model-versions/search",
+            json={"filter": "name = 'someone-elses-model'"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"model_versions": []}
+    assert search.called is False
+
+
+def test_name_index_follows_create_and_delete_traffic(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "model_versions_search_scope", "name")
+    with respx.mock(assert_all_called=True) as mock:
+        seed = mock.get(RM_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json=_registered_models("churn"))
+        )
+        mock.post("http://mlflow:5000/api/2.0/mlflow/registered-models/create").mock(
+            return_value=httpx.Response(200, json={"registered_model": {"name": "fraud"}})
+        )
+        mock.get("http://mlflow:5000/api/2.0/mlflow/registered-models/get").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "registered_model": {
+                        "name": "churn",
+                        "tags": [{"key": "tenant", "value": "tenant-a"}],
+                    }
+                },
+            )
+        )
+        mock.delete("http://mlflow:5000/api/2.0/mlflow/registered-models/delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        search = mock.post(MV_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json={"model_versions": []})
+        )
+        client = TestClient(app)
+        headers = {"X-Tenant": "tenant-a"}
+        client.post("/api/2.0/mlflow/model-versions/search", json={}, headers=headers)
+        client.post(
+            "/api/2.0/mlflow/registered-models/create", json={"name": "fraud"}, headers=headers
+        )
+        client.request(
+            "DELETE",
+            "/api/2.0/mlflow/registered-models/delete",
+            json={"name": "churn"},
+            headers=headers,
+        )
+        client.post("/api/2.0/mlflow/model-versions/search", json={}, headers=headers)
+
+    assert seed.call_count == 1
+    assert json.loads(search.calls.last.request.content)["filter"] == "name IN ('fraud')"
+
+
+def test_name_scope_uses_tenant_tag_for_large_registries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "model_versions_search_scope", "name")
+    monkeypatch.setattr(settings, "model_versions_search_max_names", 2)
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get(RM_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json=_registered_models("churn", "fraud", "ltv"))
+        )
+        search = mock.get(MV_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json={"model_versions": []})
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/model-versions/search",
+            params={"filter": "version = 1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert search.calls.last.request.url.params["filter"] == (
+        "version = 1 and tags.tenant = 'tenant-a'"
+    )
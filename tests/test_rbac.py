@@ -12,6 +12,10 @@ def test_required_role_mapping():
     assert required_role_for_request("/api/2.0/mlflow/registered-models/delete") == "contributor"
     assert required_role_for_request("/api/2.0/mlflow/model-versions/search") == "viewer"
     assert required_role_for_request("/api/2.0/mlflow/model-versions/transition-stage") == "contributor"
+    assert required_role_for_request("/api/2.0/mlflow/experiments/create") == "contributor"
+    assert required_role_for_request("/api/2.0/mlflow/experiments/set-experiment-tag") == "contributor"
+    assert required_role_for_request("/api/2.0/mlflow/experiments/get-by-name") == "viewer"
+    assert required_role_for_request("/api/2.0/mlflow/experiments/search") == "viewer"
     assert required_role_for_request("/api/2.0/mlflow/experiments/list") is None
 
 
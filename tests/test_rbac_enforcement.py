@@ -4,7 +4,7 @@ import respx
 from fastapi.testclient import TestClient
 
 from gateway.config import settings
-from gateway.main import app
+from gateway.main import _experiment_cache_id, _ownership_cache, app
 
 
 @pytest.fixture(autouse=True)
@@ -24,6 +24,8 @@ def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
 def test_rbac_allows_contributor_create(monkeypatch: pytest.MonkeyPatch):
     from gateway.main import _validator
 
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "team-a")
+
     async def _fake_validate_token(token: str):
         return {"tenant_id": "team-a", "roles": ["contributor"], "sub": "alice"}
 
@@ -126,6 +128,8 @@ def test_rbac_uses_configured_role_claim(monkeypatch: pytest.MonkeyPatch):
 def test_rbac_uses_aliases_for_groups(monkeypatch: pytest.MonkeyPatch):
     from gateway.main import _validator
 
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "team-a")
+
     monkeypatch.setattr(settings, "role_claim", "roles,groups")
     monkeypatch.setattr(settings, "rbac_viewer_aliases", "mlflow-read")
     monkeypatch.setattr(settings, "rbac_contributor_aliases", "mlflow-write")
@@ -0,0 +1,186 @@
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, _read_balancer, app
+from gateway.upstream import LeastOutstandingBalancer, RecentWrites
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(
+        settings, "upstream_read_replicas", {"http://mlflow:5000/": ["http://mlflow-ro:5000"]}
+    )
+
+
+RUN_RESPONSE = {"run": {"info": {"run_id": "r-1"}, "data": {"tags": [{"key": "tenant", "value": "tenant-a"}]}}}
+
+
+def test_balancer_prefers_backend_with_fewest_outstanding_calls():
+    balancer = LeastOutstandingBalancer()
+
+    with balancer.track("http://ro-1"):
+        assert balancer.pick(["http://ro-1", "http://ro-2"]) == "http://ro-2"
+        with balancer.track("http://ro-2"), balancer.track("http://ro-2"):
+            assert balancer.pick(["http://ro-1", "http://ro-2"]) == "http://ro-1"
+    assert balancer.outstanding("http://ro-1") == 0
+
+
+def test_in_flight_calls_are_tracked_with_circuit_breaker_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "circuit_breaker_enabled", True)
+    in_flight = []
+
+    def _search(request: httpx.Request) -> httpx.Response:
+        in_flight.append(_read_balancer.outstanding("http://mlflow-ro:5000"))
+        return httpx.Response(200, json={"runs": []})
+
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow-ro:5000/api/2.0/mlflow/runs/search").mock(side_effect=_search)
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert in_flight == [1]
+    assert _read_balancer.outstanding("http://mlflow-ro:5000") == 0
+
+
+def test_recent_writes_window_expires():
+    now = {"t": 0.0}
+    recent = RecentWrites(5.0, clock=lambda: now["t"])
+    recent.mark("tenant-a")
+
+    assert recent.active("tenant-a") is True
+    assert recent.active("tenant-b") is False
+    now["t"] = 6.0
+    assert recent.active("tenant-a") is False
+
+
+def test_search_is_sent_to_read_replica():
+    with respx.mock(assert_all_called=True) as mock:
+        replica = mock.post("http://mlflow-ro:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert replica.called is True
+
+
+def test_reads_go_to_primary_after_write():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
+    with respx.mock(assert_all_called=True) as mock:
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            return_value=httpx.Response(200, json=RUN_RESPONSE)
+        )
+        primary_get = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(200, json=RUN_RESPONSE)
+        )
+        client = TestClient(app)
+        create_response = client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={"experiment_id": "1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+        get_response = client.get(
+            "/api/2.0/mlflow/runs/get",
+            params={"run_id": "r-1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert create_response.status_code == 200
+    assert create.called is True
+    assert get_response.status_code == 200
+    assert primary_get.called is True
+
+
+def test_other_tenant_reads_still_use_replica_after_write():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            return_value=httpx.Response(200, json=RUN_RESPONSE)
+        )
+        replica_get = mock.get("http://mlflow-ro:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(
+                200, json={"run": {"data": {"tags": [{"key": "tenant", "value": "tenant-b"}]}}}
+            )
+        )
+        client = TestClient(app)
+        client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={"experiment_id": "1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+        response = client.get(
+            "/api/2.0/mlflow/runs/get",
+            params={"run_id": "r-2"},
+            headers={"X-Tenant": "tenant-b"},
+        )
+
+    assert response.status_code == 200
+    assert replica_get.called is True
+
+
+def test_mutation_preflight_uses_primary_when_replica_lags():
+    victim_run = {
+        "run": {
+            "info": {"run_id": "r-1"},
+            "data": {"tags": [{"key": "tenant", "value": "victim"}]},
+        }
+    }
+    with respx.mock(assert_all_called=False) as mock:
+        replica = mock.get("http://mlflow-ro:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(404, json={"error_code": "RESOURCE_DOES_NOT_EXIST"})
+        )
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(200, json=victim_run)
+        )
+        delete = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/delete", json={"run_id": "r-1"}, headers={"X-Tenant": "attacker"}
+        )
+
+    assert response.status_code == 403
+    assert replica.called is False
+    assert delete.called is False
+
+
+@pytest.mark.parametrize(("status_code", "expected"), [(404, 403), (500, 502)])
+def test_mutation_is_not_forwarded_when_ownership_cannot_be_verified(
+    status_code: int, expected: int
+):
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(status_code, json={"error_code": "ERROR"})
+        )
+        delete = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/delete", json={"run_id": "r-1"}, headers={"X-Tenant": "tenant-a"}
+        )
+
+    assert response.status_code == expected
+    assert delete.called is False
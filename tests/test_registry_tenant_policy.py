@@ -62,7 +62,7 @@ def test_registered_models_search_appends_tenant_filter():
     with respx.mock(assert_all_called=True) as mock:
         def _assert_request(request: httpx.Request) -> httpx.Response:
             payload = json.loads(request.content)
-            assert payload["filter_string"] == "(name LIKE 'model-%') and tags.tenant = 'tenant-a'"
+            assert payload["filter_string"] == "name LIKE 'model-%' and tags.tenant = 'tenant-a'"
             return httpx.Response(200, json={"registered_models": []})
 
         mock.post("http://mlflow:5000/api/2.0/mlflow/registered-models/search").mock(
@@ -78,9 +78,27 @@ def test_registered_models_search_appends_tenant_filter():
     assert response.status_code == 200
 
 
+def test_registered_models_search_rewrites_query_filter_on_get():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.get("http://mlflow:5000/api/2.0/mlflow/registered-models/search").mock(
+            return_value=httpx.Response(200, json={"registered_models": []})
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/registered-models/search",
+            params={"filter": "name LIKE 'model-%'", "max_results": "5"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    params = search.calls.last.request.url.params
+    assert params["filter"] == "name LIKE 'model-%' and tags.tenant = 'tenant-a'"
+    assert params["max_results"] == "5"
+
+
 def test_registered_model_get_denies_access_to_other_tenant():
     with respx.mock(assert_all_called=True) as mock:
-        route = mock.post("http://mlflow:5000/api/2.0/mlflow/registered-models/get").mock(
+        route = mock.get("http://mlflow:5000/api/2.0/mlflow/registered-models/get").mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -104,7 +122,7 @@ def test_registered_model_get_denies_access_to_other_tenant():
 
 def test_model_version_get_denies_access_to_other_tenant():
     with respx.mock(assert_all_called=True) as mock:
-        route = mock.post("http://mlflow:5000/api/2.0/mlflow/model-versions/get").mock(
+        route = mock.get("http://mlflow:5000/api/2.0/mlflow/model-versions/get").mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -129,7 +147,7 @@ def test_model_version_get_denies_access_to_other_tenant():
 
 def test_registered_model_delete_denies_access_to_other_tenant():
     with respx.mock(assert_all_called=False) as mock:
-        preflight = mock.post("http://mlflow:5000/api/2.0/mlflow/registered-models/get").mock(
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/registered-models/get").mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -157,7 +175,7 @@ def test_registered_model_delete_denies_access_to_other_tenant():
 
 def test_model_version_transition_stage_denies_access_to_other_tenant():
     with respx.mock(assert_all_called=False) as mock:
-        preflight = mock.post("http://mlflow:5000/api/2.0/mlflow/model-versions/get").mock(
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/model-versions/get").mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -0,0 +1,138 @@
+import gzip
+import json
+import zlib
+
+import httpx
+import pytest
+import respx
+from pydantic import ValidationError
+from fastapi.testclient import TestClient
+
+from gateway.config import Settings, settings
+from gateway.encoding import RequestBodyTooLargeError, decode_request_body
+from gateway.main import _experiment_cache_id, _ownership_cache, app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "upstream_request_encoding", "identity")
+
+
+def test_decode_request_body_supports_gzip_and_deflate():
+    payload = b'{"run_id": "r-1"}'
+    assert decode_request_body(gzip.compress(payload), "gzip", 1024) == payload
+    assert decode_request_body(zlib.compress(payload), "deflate", 1024) == payload
+    assert decode_request_body(payload, "identity", 1024) == payload
+
+
+def test_decode_request_body_caps_inflated_size():
+    bomb = gzip.compress(b"0" * 10_000)
+    with pytest.raises(RequestBodyTooLargeError):
+        decode_request_body(bomb, "gzip", 1_000)
+
+
+def test_create_accepts_gzip_body_and_forwards_plain_json():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
+    with respx.mock(assert_all_called=True) as mock:
+        def _assert_request(request: httpx.Request) -> httpx.Response:
+            assert "content-encoding" not in request.headers
+            payload = json.loads(request.content)
+            assert {"key": "tenant", "value": "tenant-a"} in payload["tags"]
+            return httpx.Response(200, json={"run": {"info": {"run_id": "r-1"}}})
+
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(side_effect=_assert_request)
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/create",
+            content=gzip.compress(json.dumps({"experiment_id": "1"}).encode()),
+            headers={
+                "X-Tenant": "tenant-a",
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        )
+
+    assert response.status_code == 200
+
+
+def test_create_forwards_gzip_body_when_configured(monkeypatch: pytest.MonkeyPatch):
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
+    monkeypatch.setattr(settings, "upstream_request_encoding", "gzip")
+
+    with respx.mock(assert_all_called=True) as mock:
+        def _assert_request(request: httpx.Request) -> httpx.Response:
+            assert request.headers["content-encoding"] == "gzip"
+            payload = json.loads(gzip.decompress(request.content))
+            assert {"key": "tenant", "value": "tenant-a"} in payload["tags"]
+            return httpx.Response(200, json={"run": {"info": {"run_id": "r-1"}}})
+
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(side_effect=_assert_request)
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={"experiment_id": "1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+
+
+def test_oversized_decompressed_body_is_rejected(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "request_max_decompressed_bytes", 1_000)
+
+    with respx.mock(assert_all_called=False) as mock:
+        route = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/log-batch").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            content=gzip.compress(json.dumps({"run_id": "r-1", "params": ["x" * 5_000]}).encode()),
+            headers={"X-Tenant": "tenant-a", "Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 413
+    assert route.called is False
+
+
+def test_decompressed_body_is_capped_by_route_class_limit(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "request_body_limits", {"get": 4_096})
+    bomb = gzip.compress(json.dumps({"run_id": "r-1", "pad": "0" * 1_000_000}).encode())
+    assert len(bomb) < 4_096
+
+    with respx.mock(assert_all_called=False) as mock:
+        route = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/get",
+            content=bomb,
+            headers={"X-Tenant": "tenant-a", "Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 413
+    assert route.called is False
+
+
+def test_unsupported_request_encoding_is_rejected():
+    client = TestClient(app)
+    response = client.post(
+        "/api/2.0/mlflow/runs/search",
+        content=b"\x00\x01",
+        headers={"X-Tenant": "tenant-a", "Content-Encoding": "br"},
+    )
+
+    assert response.status_code == 415
+
+
+@pytest.mark.parametrize("encoding", ["deflate", "br", "gzp"])
+def test_unsupported_upstream_request_encoding_fails_at_startup(encoding: str):
+    with pytest.raises(ValidationError):
+        Settings(upstream_request_encoding=encoding)
@@ -0,0 +1,101 @@
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, app
+from gateway.mlflow.routes import route_class_for_path
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "request_body_limits", {"search": 256, "artifact": 0})
+
+
+def _parse_last_audit_event(caplog: pytest.LogCaptureFixture) -> dict:
+    records = [r for r in caplog.records if r.name == "gateway.audit"]
+    assert records, "expected at least one audit log record"
+    return json.loads(records[-1].message)
+
+
+def test_route_class_for_path():
+    assert route_class_for_path("/api/2.0/mlflow/runs/create") == "create"
+    assert route_class_for_path("/api/2.1/mlflow/runs/get") == "get"
+    assert route_class_for_path("/api/2.0/mlflow/model-versions/search") == "search"
+    assert route_class_for_path("/api/2.0/mlflow/runs/log-batch") == "mutation"
+    assert route_class_for_path("/api/2.0/mlflow-artifacts/artifacts/1/abc/model.pkl") == "artifact"
+    assert route_class_for_path("/api/2.0/mlflow/experiments/search") == "search"
+    assert route_class_for_path("/api/2.0/mlflow/experiments/create") == "create"
+    assert route_class_for_path("/api/2.0/mlflow/gateway/routes") == "other"
+
+
+def test_declared_content_length_over_limit_is_rejected(caplog: pytest.LogCaptureFixture):
+    caplog.set_level("INFO", logger="gateway.audit")
+
+    with respx.mock(assert_all_called=False) as mock:
+        route = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["0"], "filter": "x" * 512},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 413
+    assert route.called is False
+    event = _parse_last_audit_event(caplog)
+    assert event["decision"] == "deny"
+    assert "route class search" in event["reason"]
+
+
+def test_chunked_body_over_limit_is_rejected():
+    def _chunks():
+        for _ in range(8):
+            yield b"x" * 64
+
+    with respx.mock(assert_all_called=False) as mock:
+        route = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            content=_chunks(),
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 413
+    assert route.called is False
+
+
+def test_artifact_upload_is_streamed_without_limit():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+    _ownership_cache.put("run", "r-1", "tenant-a")
+    upload = b"a" * 4096
+
+    with respx.mock(assert_all_called=True) as mock:
+        def _assert_request(request: httpx.Request) -> httpx.Response:
+            assert request.headers["content-length"] == str(len(upload))
+            assert request.read() == upload
+            return httpx.Response(200, json={})
+
+        mock.put("http://mlflow:5000/api/2.0/mlflow-artifacts/artifacts/1/r-1/artifacts/model.pkl").mock(
+            side_effect=_assert_request
+        )
+        client = TestClient(app)
+        response = client.put(
+            "/api/2.0/mlflow-artifacts/artifacts/1/r-1/artifacts/model.pkl",
+            content=upload,
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
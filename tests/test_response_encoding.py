@@ -0,0 +1,103 @@
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.encoding import accepts_encoding
+from gateway.main import app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+
+
+def _gzip_json(payload: dict) -> bytes:
+    return gzip.compress(json.dumps(payload).encode())
+
+
+def test_accepts_encoding_parses_quality_values():
+    assert accepts_encoding("gzip, deflate", "gzip") is True
+    assert accepts_encoding("gzip;q=0, deflate", "gzip") is False
+    assert accepts_encoding("*", "br") is True
+    assert accepts_encoding("identity", "gzip") is False
+    assert accepts_encoding(None, "gzip") is False
+
+
+def test_passthrough_forwards_raw_encoded_body_when_client_accepts_it():
+    encoded = _gzip_json({"experiments": []})
+
+    with respx.mock(assert_all_called=True) as mock:
+        def _assert_request(request: httpx.Request) -> httpx.Response:
+            assert request.headers["accept-encoding"] == "gzip"
+            return httpx.Response(
+                200,
+                content=encoded,
+                headers={"content-encoding": "gzip", "content-type": "application/json"},
+            )
+
+        mock.post("http://mlflow:5000/api/2.0/mlflow/experiments/search").mock(
+            side_effect=_assert_request
+        )
+        client = TestClient(app)
+        with client.stream(
+            "POST",
+            "/api/2.0/mlflow/experiments/search",
+            json={},
+            headers={"X-Tenant": "tenant-a", "Accept-Encoding": "gzip"},
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-length"] == str(len(encoded))
+    assert raw == encoded
+
+
+def test_passthrough_decodes_body_when_client_does_not_accept_encoding():
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/experiments/search").mock(
+            return_value=httpx.Response(
+                200,
+                content=_gzip_json({"experiments": []}),
+                headers={"content-encoding": "gzip", "content-type": "application/json"},
+            )
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/experiments/search",
+            json={},
+            headers={"X-Tenant": "tenant-a", "Accept-Encoding": "identity"},
+        )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"experiments": []}
+
+
+def test_preflight_response_is_decoded_for_tenant_inspection():
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(
+                200,
+                content=_gzip_json({"run": {"data": {"tags": [{"key": "tenant", "value": "tenant-a"}]}}}),
+                headers={"content-encoding": "gzip", "content-type": "application/json"},
+            )
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/get",
+            json={"run_id": "r-1"},
+            headers={"X-Tenant": "tenant-a", "Accept-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json()["run"]["data"]["tags"][0]["value"] == "tenant-a"
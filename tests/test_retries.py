@@ -0,0 +1,133 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _experiment_cache_id, _ownership_cache, _read_latency, app
+from gateway.retry import LatencyTracker, RetryBudget
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "retry_backoff_base_ms", 0.0)
+    monkeypatch.setattr(settings, "upstream_read_replicas", {})
+
+
+def test_retry_budget_caps_retries_to_ratio_of_requests():
+    now = {"t": 0.0}
+    budget = RetryBudget(ratio=0.5, min_per_second=0, clock=lambda: now["t"])
+    for _ in range(4):
+        budget.record_request()
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    now["t"] = 11.0
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_acquire() is True
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(size=100)
+    for value in range(1, 101):
+        tracker.observe(float(value))
+
+    assert tracker.percentile(50) == 51.0
+    assert tracker.percentile(99) == 100.0
+
+
+def test_search_is_retried_after_connection_reset():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            side_effect=[httpx.ReadError("reset"), httpx.Response(200, json={"runs": []})]
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert search.call_count == 2
+
+
+def test_retry_moves_to_another_replica(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        settings,
+        "upstream_read_replicas",
+        {"http://mlflow:5000": ["http://mlflow-ro-1:5000", "http://mlflow-ro-2:5000"]},
+    )
+    with respx.mock(assert_all_called=True) as mock:
+        first = mock.post("http://mlflow-ro-1:5000/api/2.0/mlflow/runs/search").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        second = mock.post("http://mlflow-ro-2:5000/api/2.0/mlflow/runs/search").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        client = TestClient(app, raise_server_exceptions=False)
+        client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert first.call_count + second.call_count == settings.retry_max_attempts + 1
+    assert first.called and second.called
+
+
+def test_create_is_not_retried():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
+    with respx.mock(assert_all_called=True) as mock:
+        create = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/create").mock(
+            side_effect=httpx.ReadError("reset")
+        )
+        client = TestClient(app, raise_server_exceptions=False)
+        client.post(
+            "/api/2.0/mlflow/runs/create",
+            json={"experiment_id": "1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert create.call_count == 1
+
+
+def test_slow_read_is_hedged_to_another_replica(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        settings,
+        "upstream_read_replicas",
+        {"http://mlflow:5000": ["http://mlflow-ro-1:5000", "http://mlflow-ro-2:5000"]},
+    )
+    monkeypatch.setattr(settings, "hedge_percentile", 50.0)
+    monkeypatch.setattr(settings, "hedge_min_samples", 1)
+    _read_latency.observe(10.0)
+    calls: list[str] = []
+
+    async def _first_slow(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        if len(calls) == 1:
+            await asyncio.sleep(2)
+        return httpx.Response(200, json={"runs": [], "served_by": request.url.host})
+
+    with respx.mock(assert_all_called=False) as mock:
+        mock.post(url__regex=r"http://mlflow-ro-\d:5000/api/2.0/mlflow/runs/search").mock(
+            side_effect=_first_slow
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert calls[0] != calls[1]
+    assert response.json()["served_by"] == calls[1]
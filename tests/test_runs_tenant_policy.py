@@ -6,7 +6,7 @@ import respx
 from fastapi.testclient import TestClient
 
 from gateway.config import settings
-from gateway.main import app
+from gateway.main import _experiment_cache_id, _ownership_cache, app
 
 
 @pytest.fixture(autouse=True)
@@ -18,6 +18,7 @@ def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
 
 
 def test_create_injects_tenant_tag():
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
 
     with respx.mock(assert_all_called=True) as mock:
         def _assert_request(request: httpx.Request) -> httpx.Response:
@@ -57,7 +58,7 @@ def test_search_appends_tenant_filter():
     with respx.mock(assert_all_called=True) as mock:
         def _assert_request(request: httpx.Request) -> httpx.Response:
             payload = json.loads(request.content)
-            assert payload["filter"] == "(attributes.status = 'RUNNING') and tags.tenant = 'tenant-a'"
+            assert payload["filter"] == "attributes.status = 'RUNNING' and tags.tenant = 'tenant-a'"
             return httpx.Response(200, json={"runs": []})
 
         mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(side_effect=_assert_request)
@@ -73,7 +74,7 @@ def test_search_appends_tenant_filter():
 
 def test_get_denies_access_to_other_tenant():
     with respx.mock(assert_all_called=True) as mock:
-        route = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+        route = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -101,6 +102,8 @@ def test_get_denies_access_to_other_tenant():
 def test_create_injects_tenant_tag_with_auth_enabled(monkeypatch: pytest.MonkeyPatch):
     from gateway.main import _validator
 
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
     async def _fake_validate_token(token: str):
         assert token == "token-1"
         return {"tenant_id": "tenant-a", "roles": ["contributor"], "sub": "alice"}
@@ -127,6 +130,8 @@ def test_create_injects_tenant_tag_with_auth_enabled(monkeypatch: pytest.MonkeyP
 
 
 def test_create_uses_configured_tenant_tag_key(monkeypatch: pytest.MonkeyPatch):
+    _ownership_cache.put("experiment", _experiment_cache_id("http://mlflow:5000", "1"), "tenant-a")
+
     monkeypatch.setattr(settings, "tenant_tag_key", "workspace")
 
     with respx.mock(assert_all_called=True) as mock:
@@ -149,7 +154,7 @@ def test_create_uses_configured_tenant_tag_key(monkeypatch: pytest.MonkeyPatch):
 
 def test_log_batch_denies_access_to_other_tenant():
     with respx.mock(assert_all_called=False) as mock:
-        preflight = mock.post("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -176,3 +181,74 @@ def test_log_batch_denies_access_to_other_tenant():
     assert response.status_code == 403
     assert preflight.called is True
     assert mutation.called is False
+
+
+def _stateful_run_tags(mock: respx.MockRouter, tenant: str) -> dict[str, str]:
+    """Mock runs/get, set-tag, delete-tag and delete against one run with mutable tags."""
+    tags = {"tenant": tenant}
+
+    def _run_get(request: httpx.Request) -> httpx.Response:
+        run_id = request.url.params["run_id"]
+        run_tags = [{"key": key, "value": value} for key, value in tags.items()]
+        return httpx.Response(
+            200, json={"run": {"info": {"run_id": run_id}, "data": {"tags": run_tags}}}
+        )
+
+    def _set_tag(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        tags[payload["key"]] = payload["value"]
+        return httpx.Response(200, json={})
+
+    def _delete_tag(request: httpx.Request) -> httpx.Response:
+        tags.pop(json.loads(request.content)["key"], None)
+        return httpx.Response(200, json={})
+
+    mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(side_effect=_run_get)
+    mock.post("http://mlflow:5000/api/2.0/mlflow/runs/set-tag").mock(side_effect=_set_tag)
+    mock.post("http://mlflow:5000/api/2.0/mlflow/runs/delete-tag").mock(side_effect=_delete_tag)
+    mock.post("http://mlflow:5000/api/2.0/mlflow/runs/delete").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    return tags
+
+
+def test_tenant_tag_handover_is_not_served_from_stale_cache():
+    with respx.mock(assert_all_called=False) as mock:
+        _stateful_run_tags(mock, "tenant-a")
+        client = TestClient(app)
+        handover = client.post(
+            "/api/2.0/mlflow/runs/set-tag",
+            json={"run_id": "r-1", "key": "tenant", "value": "tenant-b"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+        cached_after_handover = _ownership_cache.get("run", "r-1")
+        previous_owner = client.post(
+            "/api/2.0/mlflow/runs/delete", json={"run_id": "r-1"}, headers={"X-Tenant": "tenant-a"}
+        )
+        new_owner = client.post(
+            "/api/2.0/mlflow/runs/get", json={"run_id": "r-1"}, headers={"X-Tenant": "tenant-b"}
+        )
+
+    assert handover.status_code == 200
+    assert cached_after_handover is None
+    assert previous_owner.status_code == 403
+    assert new_owner.status_code == 200
+
+
+def test_tenant_tag_delete_is_not_served_from_stale_cache():
+    with respx.mock(assert_all_called=False) as mock:
+        _stateful_run_tags(mock, "tenant-a")
+        client = TestClient(app)
+        removed = client.post(
+            "/api/2.0/mlflow/runs/delete-tag",
+            json={"run_id": "r-1", "key": "tenant"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+        cached_after_delete = _ownership_cache.get("run", "r-1")
+        delete = client.post(
+            "/api/2.0/mlflow/runs/delete", json={"run_id": "r-1"}, headers={"X-Tenant": "tenant-a"}
+        )
+
+    assert removed.status_code == 200
+    assert cached_after_delete is None
+    assert delete.status_code == 403
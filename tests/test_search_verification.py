@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import app
+from gateway.mlflow.verify import JSONArrayFieldScanner, SearchVerificationStats, verify_search_response
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "search_response_verification", "drop")
+
+
+def _run(run_id: str, tenant: str) -> dict:
+    return {
+        "info": {"run_id": run_id, "run_name": 'quoted "name" [x], {y} \u00fc'},
+        "data": {"tags": [{"key": "tenant", "value": tenant}]},
+    }
+
+
+SEARCH_RESPONSE = {
+    "runs": [_run("r-1", "tenant-a"), _run("r-2", "tenant-b"), _run("r-3", "tenant-a")],
+    "next_page_token": "abc",
+}
+
+
+def _filter(body: bytes, chunk_size: int) -> tuple[dict, SearchVerificationStats]:
+    stats = SearchVerificationStats()
+
+    async def _chunks():
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    async def _collect() -> bytes:
+        return b"".join(
+            [
+                chunk
+                async for chunk in verify_search_response(
+                    _chunks(),
+                    "runs",
+                    lambda row: row["data"]["tags"][0]["value"],
+                    "tenant-a",
+                    stats,
+                )
+            ]
+        )
+
+    return json.loads(asyncio.run(_collect())), stats
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100_000])
+def test_verify_search_response_drops_foreign_rows_for_any_chunking(chunk_size: int):
+    body = json.dumps(SEARCH_RESPONSE, ensure_ascii=False).encode()
+
+    filtered, stats = _filter(body, chunk_size)
+
+    assert [run["info"]["run_id"] for run in filtered["runs"]] == ["r-1", "r-3"]
+    assert filtered["next_page_token"] == "abc"
+    assert stats.rows_checked == 3
+    assert stats.rows_dropped == 1
+
+
+def test_scanner_passes_through_responses_without_the_field():
+    scanner = JSONArrayFieldScanner("runs")
+    events = scanner.feed(b'{"next_page_token": "[runs]"}') + scanner.close()
+    assert "".join(text for _, text, _ in events) == '{"next_page_token": "[runs]"}'
+
+
+def test_runs_search_drops_rows_of_other_tenants():
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json=SEARCH_RESPONSE)
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert [run["info"]["run_id"] for run in response.json()["runs"]] == ["r-1", "r-3"]
+
+
+def test_registered_models_search_fails_response_in_fail_mode(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "search_response_verification", "fail")
+
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/registered-models/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "registered_models": [
+                        {"name": "m-1", "tags": [{"key": "tenant", "value": "tenant-a"}]},
+                        {"name": "m-2", "tags": [{"key": "tenant", "value": "tenant-b"}]},
+                    ]
+                },
+            )
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/registered-models/search",
+            json={},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 502
+    assert response.json()["detail"] == "Search response failed tenant verification"
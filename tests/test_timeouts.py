@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.deadline import Deadline
+from gateway.main import _request_deadline, app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "request_timeouts", {})
+    monkeypatch.setattr(settings, "request_timeout_seconds", None)
+
+
+RUN_RESPONSE = {"run": {"data": {"tags": [{"key": "tenant", "value": "tenant-a"}]}}}
+
+
+def _parse_last_audit_event(caplog: pytest.LogCaptureFixture) -> dict:
+    records = [r for r in caplog.records if r.name == "gateway.audit"]
+    assert records
+    return json.loads(records[-1].message)
+
+
+def _slow(seconds: float, payload: dict):
+    async def _respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(seconds)
+        return httpx.Response(200, json=payload)
+
+    return _respond
+
+
+def test_deadline_caps_phase_timeouts_at_remaining_budget():
+    now = {"t": 0.0}
+    deadline = Deadline(
+        5.0, {"connect": 2.0, "read": 10.0, "write": 10.0, "pool": 1.0}, clock=lambda: now["t"]
+    )
+    now["t"] = 4.0
+
+    timeout = deadline.timeout()
+    assert timeout.connect == 1.0
+    assert timeout.read == 1.0
+    assert timeout.pool == 1.0
+    now["t"] = 5.0
+    assert deadline.expired() is True
+
+
+def test_route_class_timeouts_merge_defaults_and_overrides(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "request_timeouts", {"get": {"read": 3.0}})
+
+    get_deadline = _request_deadline("get")
+    other_deadline = _request_deadline("other")
+
+    assert get_deadline.phases == {"connect": 2.0, "read": 3.0, "write": 10.0, "pool": 2.0}
+    assert other_deadline.phases["read"] == 30.0
+    assert 29.0 < other_deadline.remaining() <= 30.0
+
+
+def test_explicit_request_timeout_replaces_route_class_defaults(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "request_timeout_seconds", 120.0)
+    monkeypatch.setattr(settings, "request_timeouts", {"get": {"read": 3.0}})
+
+    search_deadline = _request_deadline("search")
+    get_deadline = _request_deadline("get")
+
+    assert set(search_deadline.phases.values()) == {120.0}
+    assert 119.0 < search_deadline.remaining() <= 120.0
+    assert get_deadline.phases["read"] == 3.0
+    assert get_deadline.phases["connect"] == 120.0
+
+
+def test_slow_upstream_maps_to_504_with_audit_reason(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+):
+    caplog.set_level("INFO", logger="gateway.audit")
+    monkeypatch.setattr(settings, "request_timeouts", {"get": {"deadline": 0.1}})
+    # Routes cancelled by the deadline are not recorded as called.
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            side_effect=_slow(1.0, RUN_RESPONSE)
+        )
+        client = TestClient(app)
+        response = client.get(
+            "/api/2.0/mlflow/runs/get",
+            params={"run_id": "r-1"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Upstream MLflow timed out"}
+    event = _parse_last_audit_event(caplog)
+    assert event["reason"] == "upstream_timeout"
+    assert event["decision"] == "error"
+
+
+def test_preflight_consumes_shared_deadline(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "request_timeouts", {"mutation": {"deadline": 0.3}})
+    with respx.mock(assert_all_called=False) as mock:
+        preflight = mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            side_effect=_slow(0.2, RUN_RESPONSE)
+        )
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/update").mock(
+            side_effect=_slow(0.2, {})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/update",
+            json={"run_id": "r-1", "status": "FINISHED"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert preflight.called is True
+    assert response.status_code == 504
@@ -0,0 +1,109 @@
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.health import UpstreamHealthChecker
+from gateway.main import _health_checker, app
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(
+        settings,
+        "upstream_read_replicas",
+        {"http://mlflow:5000": ["http://mlflow-ro-1:5000", "http://mlflow-ro-2:5000"]},
+    )
+
+
+def _checker(now: dict[str, float]) -> UpstreamHealthChecker:
+    return UpstreamHealthChecker(
+        interval_seconds=5,
+        failure_threshold=2,
+        ejection_seconds=30,
+        timeout_seconds=1,
+        clock=lambda: now["t"],
+    )
+
+
+async def test_endpoint_is_ejected_after_consecutive_failures_and_reinstated():
+    now = {"t": 0.0}
+    checker = _checker(now)
+    with respx.mock(assert_all_called=True) as mock:
+        route = mock.get("http://mlflow:5000/").mock(side_effect=httpx.ConnectError("boom"))
+        async with httpx.AsyncClient() as client:
+            await checker.probe(client, "http://mlflow:5000")
+            assert checker.is_available("http://mlflow:5000") is True
+            await checker.probe(client, "http://mlflow:5000")
+            assert checker.is_available("http://mlflow:5000") is False
+
+            route.mock(return_value=httpx.Response(200, text="ok"))
+            now["t"] = 5.0
+            await checker.probe(client, "http://mlflow:5000")
+
+    assert checker.is_available("http://mlflow:5000") is True
+    assert checker.state("http://mlflow:5000").latency_ewma_ms is not None
+
+
+async def test_slow_probe_counts_as_failure():
+    now = {"t": 0.0}
+    checker = _checker(now)
+    checker.max_latency_ms = 0.000001
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/").mock(return_value=httpx.Response(200, text="ok"))
+        async with httpx.AsyncClient() as client:
+            healthy = await checker.probe(client, "http://mlflow:5000")
+
+    assert healthy is False
+    assert checker.state("http://mlflow:5000").last_error.startswith("latency")
+
+
+def test_readyz_answers_from_fresh_health_state():
+    _health_checker.record_success("http://mlflow:5000", 3.0)
+
+    with respx.mock(assert_all_called=False) as mock:
+        probe = mock.get("http://mlflow:5000/").mock(return_value=httpx.Response(200, text="ok"))
+        client = TestClient(app)
+        response = client.get("/readyz")
+
+    assert response.status_code == 200
+    assert probe.called is False
+
+
+def test_readyz_reports_ejected_primary():
+    for _ in range(settings.health_check_failure_threshold):
+        _health_checker.record_failure("http://mlflow:5000", "ConnectError")
+
+    client = TestClient(app)
+    response = client.get("/readyz")
+
+    assert response.status_code == 503
+
+
+def test_ejected_replica_is_skipped_for_reads():
+    for _ in range(settings.health_check_failure_threshold):
+        _health_checker.record_failure("http://mlflow-ro-1:5000", "ConnectError")
+
+    with respx.mock(assert_all_called=False) as mock:
+        ejected = mock.post("http://mlflow-ro-1:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        healthy = mock.post("http://mlflow-ro-2:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        client = TestClient(app)
+        for _ in range(5):
+            response = client.post(
+                "/api/2.0/mlflow/runs/search",
+                json={"experiment_ids": ["1"]},
+                headers={"X-Tenant": "tenant-a"},
+            )
+            assert response.status_code == 200
+
+    assert ejected.called is False
+    assert healthy.call_count == 5
@@ -0,0 +1,140 @@
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import app
+from gateway.upstream import ConsistentHashRing, upstream_base_url_for_tenant
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "tenant_backends", {"tenant-a": "http://mlflow-a:5000/"})
+    monkeypatch.setattr(settings, "upstream_backends", [])
+
+
+def test_consistent_hash_ring_only_moves_keys_of_removed_node():
+    nodes = ["http://b1", "http://b2", "http://b3"]
+    full = ConsistentHashRing(nodes)
+    reduced = ConsistentHashRing(nodes[:2])
+    tenants = [f"tenant-{index}" for index in range(500)]
+
+    before = {tenant: full.node_for(tenant) for tenant in tenants}
+    after = {tenant: reduced.node_for(tenant) for tenant in tenants}
+
+    assert set(before.values()) == set(nodes)
+    moved = [tenant for tenant in tenants if before[tenant] != after[tenant]]
+    assert moved
+    assert all(before[tenant] == "http://b3" for tenant in moved)
+
+
+def test_static_map_takes_precedence_over_hash_pool(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "upstream_backends", ["http://b1", "http://b2"])
+
+    assert upstream_base_url_for_tenant("tenant-a") == "http://mlflow-a:5000"
+    assert upstream_base_url_for_tenant("tenant-z") in {"http://b1", "http://b2"}
+    assert upstream_base_url_for_tenant("tenant-z") == upstream_base_url_for_tenant("tenant-z")
+
+
+def test_unmapped_tenant_falls_back_to_target_base_url():
+    assert upstream_base_url_for_tenant("tenant-b") == "http://mlflow:5000"
+
+
+def test_search_rewrite_goes_to_tenant_backend():
+    with respx.mock(assert_all_called=True) as mock:
+        search = mock.post("http://mlflow-a:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["1"]},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    forwarded = json.loads(search.calls.last.request.content)
+    assert forwarded["filter"] == "tags.tenant = 'tenant-a'"
+
+
+def test_preflight_goes_to_tenant_backend():
+    with respx.mock(assert_all_called=True) as mock:
+        preflight = mock.get("http://mlflow-a:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(
+                200, json={"run": {"data": {"tags": [{"key": "tenant", "value": "tenant-a"}]}}}
+            )
+        )
+        mutation = mock.post("http://mlflow-a:5000/api/2.0/mlflow/runs/update").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        response = client.post(
+            "/api/2.0/mlflow/runs/update",
+            json={"run_id": "r-1", "status": "FINISHED"},
+            headers={"X-Tenant": "tenant-a"},
+        )
+
+    assert response.status_code == 200
+    assert preflight.called is True
+    assert mutation.called is True
+
+
+def test_readyz_probes_every_backend():
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/").mock(return_value=httpx.Response(200, text="ok"))
+        mock.get("http://mlflow-a:5000/").mock(side_effect=httpx.ConnectError("boom"))
+        client = TestClient(app)
+        response = client.get("/readyz")
+
+    assert response.status_code == 503
+
+
+def test_same_experiment_id_on_two_shards_is_cached_per_shard(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        settings,
+        "tenant_backends",
+        {"tenant-a": "http://mlflow-a:5000", "tenant-b": "http://mlflow-b:5000"},
+    )
+
+    def _experiment(tenant: str) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "experiment": {
+                    "experiment_id": "1",
+                    "tags": [{"key": "tenant", "value": tenant}],
+                }
+            },
+        )
+
+    lookups = []
+    with respx.mock(assert_all_called=True) as mock:
+        for tenant, host in (("tenant-a", "mlflow-a"), ("tenant-b", "mlflow-b")):
+            lookups.append(
+                mock.get(f"http://{host}:5000/api/2.0/mlflow/experiments/get").mock(
+                    return_value=_experiment(tenant)
+                )
+            )
+            mock.post(f"http://{host}:5000/api/2.0/mlflow/runs/create").mock(
+                return_value=httpx.Response(200, json={"run": {"info": {"run_id": tenant}}})
+            )
+        client = TestClient(app)
+        responses = [
+            client.post(
+                "/api/2.0/mlflow/runs/create",
+                json={"experiment_id": "1"},
+                headers={"X-Tenant": tenant},
+            )
+            for tenant in ("tenant-a", "tenant-b", "tenant-a", "tenant-b")
+        ]
+
+    assert [response.status_code for response in responses] == [200, 200, 200, 200]
+    # One ownership lookup per shard; the repeats are served from the cache.
+    assert [lookup.call_count for lookup in lookups] == [1, 1]
@@ -0,0 +1,65 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from gateway import upstream
+from gateway.config import settings
+from gateway.upstream import close_upstream_clients, get_upstream_client
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_upstream_clients():
+    await close_upstream_clients()
+    yield
+    await close_upstream_clients()
+
+
+async def _serve_http_over_uds(path: Path) -> asyncio.AbstractServer:
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+            b"content-length: 15\r\nconnection: close\r\n\r\n{\"status\":\"ok\"}"
+        )
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_unix_server(_handle, path=str(path))
+
+
+async def test_uds_transport_reaches_upstream_over_socket(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    sock = tmp_path / "mlflow.sock"
+    monkeypatch.setattr(settings, "upstream_transports", {"http://mlflow-local/": f"uds:{sock}"})
+    server = await _serve_http_over_uds(sock)
+    try:
+        client = get_upstream_client("http://mlflow-local")
+        response = await client.get("http://mlflow-local/health")
+    finally:
+        server.close()
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+async def test_http2_transport_requires_h2(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "upstream_transports", {"http://mlflow:5000": "http2"})
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        upstream.importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "h2" else real_find_spec(name, *args),
+    )
+
+    with pytest.raises(RuntimeError, match=r"mlflow-enterprise-gateway\[http2\]"):
+        get_upstream_client("http://mlflow:5000")
+
+
+async def test_unknown_transport_is_rejected(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "upstream_transports", {"http://mlflow:5000": "quic"})
+
+    with pytest.raises(ValueError, match="Unsupported upstream transport"):
+        get_upstream_client("http://mlflow:5000")
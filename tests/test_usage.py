@@ -0,0 +1,203 @@
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from gateway.config import settings
+from gateway.main import _ownership_cache, _usage, app
+from gateway.usage import OVERFLOW_TENANT, UsageAccounting
+
+
+@pytest.fixture(autouse=True)
+def _configure_gateway(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "auth_enabled", False)
+    monkeypatch.setattr(settings, "auth_mode", "off")
+    monkeypatch.setattr(settings, "target_base_url", "http://mlflow:5000")
+    monkeypatch.setattr(settings, "tenant_tag_key", "tenant")
+    monkeypatch.setattr(settings, "tenant_claim", "tenant_id")
+    monkeypatch.setattr(settings, "role_claim", "roles")
+    monkeypatch.setattr(settings, "rbac_viewer_aliases", "")
+    monkeypatch.setattr(settings, "rbac_contributor_aliases", "")
+    monkeypatch.setattr(settings, "rbac_admin_aliases", "")
+
+
+def _run_response(run_id: str, tenant: str) -> dict:
+    return {
+        "run": {
+            "info": {"run_id": run_id, "experiment_id": "1"},
+            "data": {"tags": [{"key": "tenant", "value": tenant}]},
+        }
+    }
+
+
+def test_usage_counts_requests_bytes_upstream_calls_and_cache_hits():
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            return_value=httpx.Response(200, json=_run_response("r-1", "tenant-a"))
+        )
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/log-metric").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = TestClient(app)
+        # The first mutation preflights the run; the second finds its owner cached.
+        for step in range(2):
+            client.post(
+                "/api/2.0/mlflow/runs/log-metric",
+                json={"run_id": "r-1", "key": "loss", "value": 0.1, "timestamp": 1, "step": step},
+                headers={"X-Tenant": "tenant-a"},
+            )
+        # Answered from its own ownership lookup, so not counted as a preflight.
+        get_response = client.post(
+            "/api/2.0/mlflow/runs/get", json={"run_id": "r-1"}, headers={"X-Tenant": "tenant-a"}
+        )
+
+    usage = _usage.snapshot()["tenants"]["tenant-a"]
+    assert usage["requests"]["get"] == 1
+    assert usage["requests"]["mutation"] == 2
+    assert usage["requests"]["total"] == 3
+    assert usage["preflights"] == 1
+    assert usage["cache_hits"] == 1
+    assert usage["upstream_calls"] == 4
+    assert usage["upstream_ms"] >= 0
+    assert usage["request_bytes"] > len(json.dumps({"run_id": "r-1"}))
+    assert usage["response_bytes"] >= len(get_response.content)
+
+
+def test_usage_is_kept_per_tenant():
+    _ownership_cache.put("run", "r-b", "tenant-b")
+    with respx.mock(assert_all_called=True) as mock:
+        mock.get("http://mlflow:5000/api/2.0/mlflow/runs/get").mock(
+            side_effect=lambda request: httpx.Response(
+                200, json=_run_response(request.url.params["run_id"], "tenant-b")
+            )
+        )
+        client = TestClient(app)
+        client.post(
+            "/api/2.0/mlflow/runs/get", json={"run_id": "r-b"}, headers={"X-Tenant": "tenant-b"}
+        )
+        denied = client.post(
+            "/api/2.0/mlflow/runs/get", json={"run_id": "r-b"}, headers={"X-Tenant": "tenant-a"}
+        )
+
+    assert denied.status_code == 403
+    tenants = _usage.snapshot()["tenants"]
+    assert tenants["tenant-a"]["requests"]["get"] == 1
+    assert tenants["tenant-a"]["response_bytes"] == 0
+    assert tenants["tenant-b"]["requests"]["get"] == 1
+    assert tenants["tenant-b"]["response_bytes"] > 0
+
+
+def test_usage_beyond_max_tenants_is_accounted_as_overflow():
+    accounting = UsageAccounting(max_tenants=2, flush_interval_seconds=0, emit=lambda *a: None)
+    for tenant in ("tenant-a", "tenant-b", "tenant-c", "tenant-d"):
+        accounting.for_tenant(tenant).count_request("get")
+
+    tenants = accounting.snapshot()["tenants"]
+    assert sorted(tenants) == [OVERFLOW_TENANT, "tenant-a", "tenant-b"]
+    assert tenants[OVERFLOW_TENANT]["requests"]["get"] == 2
+
+
+def test_usage_flush_emits_deltas_since_previous_flush():
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    emitted = []
+    accounting = UsageAccounting(
+        max_tenants=10,
+        flush_interval_seconds=0,
+        emit=lambda tenant, start, end, usage: emitted.append((tenant, start, end, usage)),
+        clock=lambda: now,
+    )
+    usage = accounting.for_tenant("tenant-a")
+    usage.count_request("search")
+    usage.response_bytes += 100
+    accounting.for_tenant("tenant-b")
+
+    now += timedelta(minutes=1)
+    assert accounting.flush() == 1
+    usage.count_request("search")
+    usage.response_bytes += 50
+    now += timedelta(minutes=1)
+    assert accounting.flush() == 1
+    now += timedelta(minutes=1)
+    assert accounting.flush() == 0
+
+    summaries = [
+        (tenant, usage["requests"]["search"], usage["response_bytes"])
+        for tenant, *_, usage in emitted
+    ]
+    assert summaries == [("tenant-a", 1, 100), ("tenant-a", 1, 50)]
+    assert emitted[1][1] == emitted[0][2]
+    assert accounting.snapshot("tenant-a")["tenants"]["tenant-a"]["response_bytes"] == 150
+
+
+def test_usage_events_are_written_to_audit_log_at_shutdown(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    monkeypatch.setattr(settings, "health_check_interval_seconds", 0)
+    with respx.mock(assert_all_called=True) as mock:
+        mock.post("http://mlflow:5000/api/2.0/mlflow/runs/search").mock(
+            return_value=httpx.Response(200, json={"runs": []})
+        )
+        with caplog.at_level(logging.INFO, logger="gateway.audit"):
+            with TestClient(app) as client:
+                client.post(
+                    "/api/2.0/mlflow/runs/search",
+                    json={"experiment_ids": ["1"]},
+                    headers={"X-Tenant": "tenant-a"},
+                )
+
+    events = [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "gateway.audit"
+    ]
+    usage_events = [event for event in events if event.get("event_type") == "usage"]
+    assert len(usage_events) == 1
+    event = usage_events[0]
+    assert event["schema_version"] == "1"
+    assert event["tenant"] == "tenant-a"
+    assert event["requests"]["search"] == 1
+    assert event["upstream_calls"] == 1
+    assert "path" not in event
+    assert event["window_start"] <= event["window_end"]
+
+
+def test_usage_endpoint_without_auth_filters_by_tenant():
+    _usage.for_tenant("tenant-a").count_request("get")
+    _usage.for_tenant("tenant-b").count_request("create")
+
+    response = TestClient(app).get("/gateway/v1/usage", params={"tenant": "tenant-b"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body["tenants"]) == ["tenant-b"]
+    assert body["tenants"]["tenant-b"]["requests"]["create"] == 1
+    assert "since" in body and "last_flush" in body
+
+
+@pytest.mark.parametrize(("roles", "status_code"), [(["admin"], 200), (["contributor"], 403)])
+def test_usage_endpoint_requires_admin_when_auth_enabled(
+    monkeypatch: pytest.MonkeyPatch, roles: list[str], status_code: int
+):
+    from gateway.main import _validator
+
+    monkeypatch.setattr(settings, "auth_enabled", True)
+    monkeypatch.setattr(settings, "auth_mode", "oidc")
+
+    async def _fake_validate_token(token: str):
+        return {"tenant_id": "team-a", "roles": roles, "sub": "alice"}
+
+    monkeypatch.setattr(_validator, "validate_token", _fake_validate_token)
+    _usage.for_tenant("team-b").count_request("get")
+
+    client = TestClient(app)
+    response = client.get("/gateway/v1/usage", headers={"Authorization": "Bearer token-1"})
+    unauthenticated = client.get("/gateway/v1/usage")
+
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert "team-b" in response.json()["tenants"]
+    assert unauthenticated.status_code == 401